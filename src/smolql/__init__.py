@@ -1,15 +1,29 @@
 """smolql - A micro SQL statement builder library."""
 
 from smolql.api import (
+    aexecute,
+    and_,
+    astream,
+    async_executor,
+    compile_cache,
     compile_to_sql,
+    compile_with_params,
+    copy_from,
+    excluded,
+    executor,
     identifier,
+    insert,
+    keyset,
+    literal,
+    or_,
     placeholder,
     predicate,
+    prepare,
     query,
     raw,
     table,
 )
-from smolql.domain.value_objects import Dialect
+from smolql.domain.value_objects import CopyFormat, Dialect, DialectSpec, ParamStyle
 from smolql.operators import (
     avg,
     cast,
@@ -31,8 +45,34 @@ from smolql.operators import (
     rank,
     row_number,
     sum_,
+    tuple_,
     upper,
 )
+from smolql.services.async_executor import AsyncDriver, AsyncExecutor, ThreadedDriver
+from smolql.services.compile_cache import CompileCache
+from smolql.services.compiler_service import normalized_sql
+from smolql.services.copy_from import CopyFrom
+from smolql.services.executor import Executor
+from smolql.services.explain import PlanNode, QueryPlan, explain
+from smolql.services.fingerprint import fingerprint
+from smolql.services.index_advisor import (
+    IndexCheck,
+    IndexSuggestion,
+    advise_indexes,
+    check_indexes,
+)
+from smolql.services.instrumentation import (
+    CompileEvent,
+    CompileObserver,
+    CompileStats,
+    CompileSummary,
+    add_compile_observer,
+    remove_compile_observer,
+)
+from smolql.services.keyset import Keyset
+from smolql.services.prepared_query import PreparedQuery
+from smolql.services.sql_compiler import SQLCompiler, get_compiler
+from smolql.services.sqlite_pool import PoolMetrics, SQLitePool, SQLitePragmas
 
 __version__ = "0.1.0"
 
@@ -40,13 +80,59 @@ __all__ = [
     # API functions
     "table",
     "identifier",
+    "literal",
     "placeholder",
     "predicate",
+    "and_",
+    "or_",
     "query",
+    "keyset",
+    "insert",
+    "excluded",
+    "copy_from",
     "raw",
     "compile_to_sql",
+    "compile_with_params",
+    "compile_cache",
+    "prepare",
+    "executor",
+    "async_executor",
+    "explain",
+    "fingerprint",
+    "normalized_sql",
+    "advise_indexes",
+    "check_indexes",
+    "add_compile_observer",
+    "remove_compile_observer",
+    "aexecute",
+    "astream",
+    # Services
+    "AsyncDriver",
+    "AsyncExecutor",
+    "CompileCache",
+    "CompileEvent",
+    "CompileObserver",
+    "CompileStats",
+    "CompileSummary",
+    "CopyFrom",
+    "Executor",
+    "IndexCheck",
+    "IndexSuggestion",
+    "Keyset",
+    "PreparedQuery",
+    "PlanNode",
+    "PoolMetrics",
+    "QueryPlan",
+    "SQLCompiler",
+    "SQLitePool",
+    "SQLitePragmas",
+    "ThreadedDriver",
+    "get_compiler",
     # Value objects
+    "CopyFormat",
     "Dialect",
+    "DialectSpec",
+    "ParamStyle",
     # Operators
     "count",
     "sum_",
@@ -69,4 +155,5 @@ __all__ = [
     "dense_rank",
     "lag",
     "lead",
+    "tuple_",
 ]
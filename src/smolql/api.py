@@ -1,20 +1,41 @@
 """Public API helper functions."""
 
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from typing import Any
+
+from smolql.domain import interfaces
 from smolql.domain.entities import (
+    EXCLUDED,
+    CompoundPredicate,
     Identifier,
+    Insert,
+    Literal,
     Placeholder,
     Predicate,
     Query,
     RawSQL,
     Table,
+    _combine,
 )
-from smolql.domain.value_objects import Dialect
-from smolql.services.compiler_service import compile_query
+from smolql.domain.value_objects import CopyFormat, Dialect, ParamStyle
+from smolql.services.async_executor import AsyncExecutor, ThreadedDriver
+from smolql.services.compile_cache import CompileCache, default_compile_cache
+from smolql.services.compiler_service import compile_statement
+from smolql.services.copy_from import CopyFrom
+from smolql.services.executor import Executor
+from smolql.services.keyset import Keyset
+from smolql.services.prepared_query import PreparedQuery, prepare_query
 
 
-def table(name: str, schema: str | None = None, alias: str | None = None) -> Table:
-    """Create a table reference."""
-    return Table(_name=name, _schema=schema, _alias=alias)
+def table(
+    name: str,
+    schema: str | None = None,
+    alias: str | None = None,
+    columns: Iterable[str] | None = None,
+) -> Table:
+    """Create a table reference, optionally declaring its columns."""
+    declared = tuple(columns) if columns is not None else None
+    return Table(_name=name, _schema=schema, _alias=alias, _columns=declared)
 
 
 def identifier(
@@ -29,21 +50,136 @@ def placeholder(name: str) -> Placeholder:
     return Placeholder(_name=name)
 
 
+def literal(value: Any, inline: bool = False) -> Literal:
+    """Create a literal value, optionally forced inline when extracting literals."""
+    return Literal(_value=value, _inline=inline)
+
+
 def predicate(condition: Predicate) -> Predicate:
     """Create a predicate (mainly for clarity in code)."""
     return condition
 
 
+def and_(*conditions: interfaces.ICondition) -> CompoundPredicate:
+    """Combine conditions with AND in a single n-ary node."""
+    if not conditions:
+        raise ValueError("and_() requires at least one condition")
+    return _combine("AND", *conditions)
+
+
+def or_(*conditions: interfaces.ICondition) -> CompoundPredicate:
+    """Combine conditions with OR in a single n-ary node."""
+    if not conditions:
+        raise ValueError("or_() requires at least one condition")
+    return _combine("OR", *conditions)
+
+
 def raw(sql: str) -> RawSQL:
     """Create a raw SQL node for direct injection."""
     return RawSQL(_sql=sql)
 
 
 def query() -> Query:
-    """Create a new query builder."""
-    return Query(_select_fields=[])
+    """Create a new immutable query builder."""
+    return Query()
+
+
+def keyset(query_obj: Query) -> Keyset:
+    """Create a keyset paginator seeking on the query's ORDER BY fields."""
+    return Keyset(query_obj)
+
+
+def insert(table: interfaces.ITable) -> Insert:
+    """Create a new immutable INSERT builder for a table."""
+    return Insert(_table=table)
+
+
+def excluded(column: str) -> Identifier:
+    """Reference a column of the row proposed for insertion in an upsert."""
+    return Identifier(_name=column, _table=EXCLUDED)
+
+
+def copy_from(
+    table: interfaces.ITable,
+    columns: Iterable[str | interfaces.IIdentifier] | None = None,
+    format: CopyFormat = CopyFormat.TEXT,
+    delimiter: str | None = None,
+) -> CopyFrom:
+    """Create a PostgreSQL ``COPY ... FROM STDIN`` load for a table."""
+    return CopyFrom(table, columns, format, delimiter)
+
+
+def compile_to_sql(
+    query_obj: interfaces.IQuery | interfaces.IInsert, dialect: Dialect
+) -> str:
+    """Compile a query to SQL string, reusing cached SQL for repeated shapes."""
+    return default_compile_cache.compile(query_obj, dialect)
+
+
+def compile_with_params(
+    query_obj: Query, dialect: Dialect
+) -> tuple[str, dict[str, Any]]:
+    """Compile a query with literals extracted into bound parameters."""
+    statement = compile_statement(query_obj, dialect, extract_literals=True)
+    return statement.sql, statement.params
+
+
+def compile_cache() -> CompileCache:
+    """Get the compile cache used by ``compile_to_sql``."""
+    return default_compile_cache
+
+
+def executor(
+    connection: Any,
+    dialect: Dialect,
+    paramstyle: ParamStyle | None = None,
+    extract_literals: bool = True,
+) -> Executor:
+    """Create an executor running statements on a DB-API connection."""
+    return Executor(connection, dialect, paramstyle, extract_literals)
+
+
+def async_executor(
+    connect: Callable[[], Any],
+    dialect: Dialect,
+    max_workers: int = 4,
+    timeout: float | None = None,
+    paramstyle: ParamStyle | None = None,
+) -> AsyncExecutor:
+    """Create an asyncio executor running a blocking driver on worker threads.
+
+    Without ``paramstyle``, one connection is opened right away to infer it.
+    """
+    driver = ThreadedDriver(connect, max_workers, paramstyle)
+    return AsyncExecutor(driver, dialect, timeout=timeout)
+
+
+async def aexecute(
+    executor_obj: AsyncExecutor,
+    statement: interfaces.ISQLNode,
+    params: Mapping[str, Any] | None = None,
+    timeout: float | None = None,
+) -> list[Any]:
+    """Execute a statement without blocking the event loop and get its rows."""
+    return await executor_obj.execute(statement, params, timeout)
+
+
+def astream(
+    executor_obj: AsyncExecutor,
+    statement: interfaces.ISQLNode,
+    params: Mapping[str, Any] | None = None,
+    batch_size: int = 1000,
+    timeout: float | None = None,
+) -> AsyncIterator[Any]:
+    """Stream the rows of a statement without blocking the event loop."""
+    return executor_obj.stream(statement, params, batch_size, timeout)
 
 
-def compile_to_sql(query_obj: Query, dialect: Dialect) -> str:
-    """Compile a query to SQL string."""
-    return compile_query(query_obj, dialect)
+def prepare(
+    query_obj: Query,
+    dialect: Dialect,
+    extract_literals: bool = False,
+    paramstyle: ParamStyle = ParamStyle.NAMED,
+) -> PreparedQuery:
+    """Compile a query once into a template with fast parameter binding."""
+    return prepare_query(query_obj, dialect, extract_literals, paramstyle)
@@ -0,0 +1,62 @@
+"""Run the smolql micro-benchmarks.
+
+Run with ``python -m smolql.bench [--save FILE] [--compare FILE]``.
+"""
+
+import argparse
+import sys
+
+from smolql.bench.suite import (
+    default_cases,
+    find_regressions,
+    load_baseline,
+    run_suite,
+    save_baseline,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite, print a report and compare against a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-k", "--filter", default="", help="run cases containing this")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", metavar="FILE", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="FILE", help="baseline to compare with")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1, help="allowed slowdown (0.1 = 10%%)"
+    )
+    args = parser.parse_args(argv)
+
+    cases = [case for case in default_cases() if args.filter in case.name]
+    baseline = load_baseline(args.compare) if args.compare else {}
+
+    print(f"{'case':<36} {'ops/sec':>12} {'peak KiB':>10} {'vs base':>8}")
+    results = []
+    for result in run_suite(cases, args.min_time, args.repeat):
+        results.append(result)
+        previous = baseline.get(result.name)
+        change = (
+            f"{result.ops_per_sec / previous.ops_per_sec - 1:+.0%}" if previous else ""
+        )
+        print(
+            f"{result.name:<36} {result.ops_per_sec:>12,.0f} "
+            f"{result.peak_bytes / 1024:>10.1f} {change:>8}"
+        )
+
+    if args.save:
+        save_baseline(results, args.save)
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.slowdown:.0%} slower "
+            f"({regression.baseline_ops:,.0f} -> "
+            f"{regression.current_ops:,.0f} ops/sec)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Benchmark AST node memory and large-tree build/compile time.
+
+Run with ``python -m smolql.bench.nodes [--nodes N]``.
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from smolql.api import query, table
+from smolql.domain.entities import Query
+from smolql.domain.value_objects import Dialect
+from smolql.services.compiler_service import compile_query
+from smolql.services.instrumentation import count_nodes
+
+
+def build_tree(conditions: int) -> Query:
+    """Build a report-filter style query with one predicate per condition."""
+    facts = table("facts", alias="f")
+    predicates = [facts.col(f"c{i % 50}") == i for i in range(conditions)]
+    return query().select(facts.id).from_(facts).where(*predicates)
+
+
+def measure_memory(conditions: int) -> tuple[int, int]:
+    """Get the bytes allocated while building a tree and its node count."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tree = build_tree(conditions)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return after - before, count_nodes(tree)
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Get the best wall time of ``repeat`` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the node benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # Each condition is a Predicate, an Identifier, its Table and a Literal
+    conditions = max(1, args.nodes // 4)
+    allocated, nodes = measure_memory(conditions)
+    tree = build_tree(conditions)
+
+    build = best_time(lambda: build_tree(conditions), args.repeat)
+    compile_pg = best_time(lambda: compile_query(tree, Dialect.POSTGRESQL), args.repeat)
+    compile_sqlite = best_time(lambda: compile_query(tree, Dialect.SQLITE), args.repeat)
+
+    print(f"nodes:              {nodes}")
+    print(f"bytes per node:     {allocated / nodes:.1f}")
+    print(f"build:              {build * 1000:.2f} ms")
+    print(f"compile postgresql: {compile_pg * 1000:.2f} ms")
+    print(f"compile sqlite:     {compile_sqlite * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Representative query shapes used by the benchmarks."""
+
+from collections.abc import Callable
+
+from smolql.api import literal, placeholder, query, table
+from smolql.domain import interfaces
+from smolql.domain.entities import CompoundPredicate, Predicate, Query
+from smolql.operators import coalesce, count, lower, sum_
+
+__all__ = ["SHAPES", "deep_query", "join_query", "simple_query", "wide_query"]
+
+
+def simple_query() -> Query:
+    """Build a typical lookup: a few columns, one filter and a limit."""
+    users = table("users", schema="app", alias="u")
+    return (
+        query()
+        .select(users.id, users.email, users.created_at)
+        .from_(users)
+        .where(users.id == placeholder("user_id"), users.active == literal(True))
+        .order_by(users.created_at, "DESC")
+        .limit(10)
+    )
+
+
+def wide_query(columns: int = 200) -> Query:
+    """Build a report query selecting many columns."""
+    facts = table("facts", alias="f")
+    fields = [facts.col(f"c{i}") for i in range(columns)]
+    return query().select(*fields).from_(facts).where(facts.day == placeholder("day"))
+
+
+def deep_query(depth: int = 100) -> Query:
+    """Build a query with deeply nested filters and expressions."""
+    facts = table("facts", alias="f")
+    condition: Predicate | CompoundPredicate = facts.c0 == 0
+    for i in range(1, depth):
+        predicate = facts.col(f"c{i % 20}") > i
+        condition = (condition & predicate) if i % 2 else (condition | predicate)
+
+    expression: interfaces.ISQLNode = facts.c0
+    for i in range(depth):
+        expression = coalesce(expression, facts.col(f"c{i % 20}"))
+    return query().select(expression).from_(facts).where(condition)
+
+
+def join_query(joins: int = 8) -> Query:
+    """Build an aggregate over a fact table joined to many dimensions."""
+    facts = table("facts", schema="warehouse", alias="f")
+    q = query().from_(facts)
+    labels: list[interfaces.ISQLNode] = []
+    for i in range(joins):
+        dim = table(f"dim_{i}", schema="warehouse", alias=f"d{i}")
+        q = q.left_join(dim, dim.id == facts.col(f"dim_{i}_id"))
+        labels.append(dim.label)
+    fields = [lower(label, alias=f"label_{i}") for i, label in enumerate(labels)]
+    return (
+        q.select(*fields, sum_(facts.amount, alias="total"), count(alias="n"))
+        .where(facts.day >= placeholder("start"), facts.day < placeholder("end"))
+        .group_by(*labels)
+        .having(count() > 10)
+        .order_by("total", "DESC")
+        .limit(100)
+    )
+
+
+SHAPES: dict[str, Callable[[], Query]] = {
+    "simple": simple_query,
+    "wide": wide_query,
+    "deep": deep_query,
+    "join": join_query,
+}
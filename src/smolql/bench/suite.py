@@ -0,0 +1,185 @@
+"""Benchmark cases, runner and JSON baselines."""
+
+import json
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+
+from smolql.api import compile_to_sql, prepare
+from smolql.bench.shapes import SHAPES
+from smolql.domain.entities import Query
+from smolql.domain.value_objects import Dialect
+from smolql.services.compiler_service import compile_query
+
+__all__ = [
+    "BenchCase",
+    "BenchResult",
+    "Regression",
+    "default_cases",
+    "find_regressions",
+    "load_baseline",
+    "run_case",
+    "run_suite",
+    "save_baseline",
+]
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """A named operation to measure."""
+
+    name: str
+    func: Callable[[], object]
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Throughput and allocations of one benchmark case."""
+
+    name: str
+    ops_per_sec: float
+    peak_bytes: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A case whose throughput dropped below its baseline."""
+
+    name: str
+    baseline_ops: float
+    current_ops: float
+
+    @property
+    def slowdown(self) -> float:
+        """Get the relative throughput loss, 0.25 meaning 25% slower."""
+        return 1 - self.current_ops / self.baseline_ops
+
+
+def default_cases() -> list[BenchCase]:
+    """Get the build, compile and bind cases for every query shape.
+
+    ``compile_cached`` cases reuse one query, whose structural key is then
+    memoized; ``build_compile`` cases build a new query on every call, with
+    and without the compile cache.
+    """
+    cases = []
+    for shape, build in SHAPES.items():
+        cases.append(BenchCase(f"build.{shape}", build))
+        built = build()
+        for dialect in Dialect:
+            suffix = f"{shape}.{dialect.value}"
+            cases.append(
+                BenchCase(f"compile.{suffix}", partial(compile_query, built, dialect))
+            )
+            cases.append(
+                BenchCase(
+                    f"compile_cached.{suffix}", partial(compile_to_sql, built, dialect)
+                )
+            )
+            cases.append(
+                BenchCase(
+                    f"build_compile.{suffix}",
+                    partial(_build_and_compile, build, dialect, compile_query),
+                )
+            )
+            cases.append(
+                BenchCase(
+                    f"build_compile_cached.{suffix}",
+                    partial(_build_and_compile, build, dialect, compile_to_sql),
+                )
+            )
+
+    prepared = prepare(SHAPES["simple"](), Dialect.POSTGRESQL, extract_literals=True)
+    cases.append(BenchCase("bind.simple", lambda: prepared.bind(user_id=42)))
+    return cases
+
+
+def _build_and_compile(
+    build: Callable[[], Query],
+    dialect: Dialect,
+    compile_: Callable[[Query, Dialect], str],
+) -> str:
+    """Build a new query and compile it."""
+    return compile_(build(), dialect)
+
+
+def _measure_peak(func: Callable[[], object]) -> int:
+    """Get the peak bytes allocated during one call."""
+    func()  # warm caches so only steady-state allocations are counted
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def run_case(case: BenchCase, min_time: float = 0.2, repeat: int = 3) -> BenchResult:
+    """Measure the best throughput of ``repeat`` timed runs."""
+    func = case.func
+    # Calibrate the loop so each run lasts at least ``min_time`` seconds
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, int(min_time / elapsed) + 1)
+
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - start) / loops)
+
+    return BenchResult(case.name, 1 / best, _measure_peak(func))
+
+
+def run_suite(
+    cases: Iterable[BenchCase], min_time: float = 0.2, repeat: int = 3
+) -> list[BenchResult]:
+    """Run every case in order."""
+    return [run_case(case, min_time, repeat) for case in cases]
+
+
+def save_baseline(results: Iterable[BenchResult], path: str | Path) -> None:
+    """Write results to a JSON baseline file."""
+    data = {
+        "python": platform.python_version(),
+        "results": [asdict(result) for result in results],
+    }
+    Path(path).write_text(json.dumps(data, indent=2) + "\n")
+
+
+def load_baseline(path: str | Path) -> dict[str, BenchResult]:
+    """Read a JSON baseline file, keyed by case name."""
+    data = json.loads(Path(path).read_text())
+    results = (BenchResult(**item) for item in data["results"])
+    return {result.name: result for result in results}
+
+
+def find_regressions(
+    results: Iterable[BenchResult],
+    baseline: dict[str, BenchResult],
+    tolerance: float = 0.1,
+) -> list[Regression]:
+    """Get the cases more than ``tolerance`` slower than their baseline."""
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+        if result.ops_per_sec < previous.ops_per_sec * (1 - tolerance):
+            regressions.append(
+                Regression(result.name, previous.ops_per_sec, result.ops_per_sec)
+            )
+    return regressions
@@ -1,9 +1,15 @@
 """Domain layer exports."""
 
 from smolql.domain.entities import (
+    BulkInsert,
+    CommonTableExpression,
+    CompoundPredicate,
     Identifier,
+    InList,
+    Insert,
     Join,
     Literal,
+    OnConflict,
     Operator,
     Placeholder,
     Predicate,
@@ -12,8 +18,15 @@ from smolql.domain.entities import (
     Table,
 )
 from smolql.domain.interfaces import (
+    ICommonTableExpression,
+    ICompoundPredicate,
+    ICondition,
     IIdentifier,
+    IInList,
+    IInsert,
     IJoin,
+    ILiteral,
+    IOnConflict,
     IOperator,
     IPlaceholder,
     IPredicate,
@@ -23,12 +36,25 @@ from smolql.domain.interfaces import (
     ITable,
     IVisitor,
 )
-from smolql.domain.value_objects import Dialect
+from smolql.domain.value_objects import (
+    CompiledStatement,
+    CopyFormat,
+    Dialect,
+    DialectSpec,
+    ParamStyle,
+)
 
 __all__ = [
     # Interfaces
+    "ICommonTableExpression",
+    "ICompoundPredicate",
+    "ICondition",
     "IIdentifier",
+    "IInsert",
+    "IInList",
     "IJoin",
+    "ILiteral",
+    "IOnConflict",
     "IOperator",
     "IPlaceholder",
     "IPredicate",
@@ -38,9 +64,15 @@ __all__ = [
     "ITable",
     "IVisitor",
     # Entities
+    "BulkInsert",
+    "CommonTableExpression",
+    "CompoundPredicate",
     "Identifier",
+    "InList",
+    "Insert",
     "Join",
     "Literal",
+    "OnConflict",
     "Operator",
     "Placeholder",
     "Predicate",
@@ -48,5 +80,9 @@ __all__ = [
     "RawSQL",
     "Table",
     # Value Objects
+    "CompiledStatement",
+    "CopyFormat",
     "Dialect",
+    "DialectSpec",
+    "ParamStyle",
 ]
@@ -2,22 +2,48 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from smolql.domain.interfaces import IVisitor
 
 from smolql.domain import interfaces
+from smolql.domain.value_objects import Dialect, ParamStyle
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Table(interfaces.ITable):
-    """Represents a database table."""
+    """Represents a database table.
+
+    When ``_columns`` is declared, each column's ``Identifier`` is built once
+    and reused on attribute access, and unknown columns raise
+    ``AttributeError`` instead of failing at the database.
+    """
 
     _name: str
     _schema: str | None = None
     _alias: str | None = None
+    _columns: tuple[str, ...] | None = field(default=None, compare=False)
+    _column_map: dict[str, Identifier] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Precompute the identifiers of declared columns."""
+        if self._columns is None:
+            return
+        columns = tuple(self._columns)
+        column_map = {}
+        for column in columns:
+            ident = Identifier(_name=column, _table=self, _alias=None)
+            # Visitors cache the rendered SQL of shared identifiers per dialect
+            object.__setattr__(ident, "_fragments", {})
+            column_map[column] = ident
+        object.__setattr__(self, "_columns", columns)
+        object.__setattr__(self, "_column_map", column_map)
 
     @property
     def name(self) -> str:
@@ -34,6 +60,11 @@ class Table(interfaces.ITable):
         """Get table alias."""
         return self._alias
 
+    @property
+    def columns(self) -> tuple[str, ...] | None:
+        """Get declared column names, or None for an undeclared table."""
+        return self._columns
+
     def accept(self, visitor: "IVisitor") -> str:
         """Accept a visitor for compilation."""
         return visitor.visit_table(self)
@@ -44,20 +75,30 @@ class Table(interfaces.ITable):
             raise AttributeError(
                 f"'{type(self).__name__}' object has no attribute '{name}'"
             )
-        return Identifier(_name=name, _table=self, _alias=None)
+        return self.col(name)
 
     def col(self, name: str) -> "Identifier":
         """Explicitly access a column by name (useful for columns named 'name', 'schema', or 'alias')."""
-        return Identifier(_name=name, _table=self, _alias=None)
+        column_map = self._column_map
+        if column_map is None:
+            return Identifier(_name=name, _table=self, _alias=None)
+        try:
+            return column_map[name]
+        except KeyError:
+            message = f"Table '{self._name}' has no column '{name}'"
+            raise AttributeError(message) from None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Identifier(interfaces.IIdentifier):
     """Represents a column or field identifier."""
 
     _name: str
     _table: interfaces.ITable | None = None
     _alias: str | None = None
+    _fragments: dict[Any, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def name(self) -> str:
@@ -105,29 +146,41 @@ class Identifier(interfaces.IIdentifier):
     def __add__(self, other: Any) -> "Operator":
         """Create an addition operator."""
         return Operator(
-            _operator_name="+", _arguments=[self, _to_sql_node(other)], _alias=None
+            _operator_name="+", _arguments=(self, _to_sql_node(other)), _alias=None
         )
 
     def __sub__(self, other: Any) -> "Operator":
         """Create a subtraction operator."""
         return Operator(
-            _operator_name="-", _arguments=[self, _to_sql_node(other)], _alias=None
+            _operator_name="-", _arguments=(self, _to_sql_node(other)), _alias=None
         )
 
     def __mul__(self, other: Any) -> "Operator":
         """Create a multiplication operator."""
         return Operator(
-            _operator_name="*", _arguments=[self, _to_sql_node(other)], _alias=None
+            _operator_name="*", _arguments=(self, _to_sql_node(other)), _alias=None
         )
 
     def __truediv__(self, other: Any) -> "Operator":
         """Create a division operator."""
         return Operator(
-            _operator_name="/", _arguments=[self, _to_sql_node(other)], _alias=None
+            _operator_name="/", _arguments=(self, _to_sql_node(other)), _alias=None
         )
 
+    def in_(
+        self, values: Iterable[Any] | interfaces.ILiteral | interfaces.IPlaceholder
+    ) -> "InList":
+        """Create an IN condition over a list of values or a bound array."""
+        return InList(_operand=self, _values=_to_list_node(values))
+
+    def not_in_(
+        self, values: Iterable[Any] | interfaces.ILiteral | interfaces.IPlaceholder
+    ) -> "InList":
+        """Create a NOT IN condition over a list of values or a bound array."""
+        return InList(_operand=self, _values=_to_list_node(values), _negated=True)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Predicate(interfaces.IPredicate):
     """Represents a predicate (condition)."""
 
@@ -154,16 +207,101 @@ class Predicate(interfaces.IPredicate):
         """Accept a visitor for compilation."""
         return visitor.visit_predicate(self)
 
-    def __and__(self, other: "Predicate") -> "Predicate":
+    def __and__(self, other: interfaces.ICondition) -> "CompoundPredicate":
         """Combine predicates with AND."""
-        return Predicate(_operator="AND", _left=self, _right=other)
+        return _combine("AND", self, other)
 
-    def __or__(self, other: "Predicate") -> "Predicate":
+    def __or__(self, other: interfaces.ICondition) -> "CompoundPredicate":
         """Combine predicates with OR."""
-        return Predicate(_operator="OR", _left=self, _right=other)
+        return _combine("OR", self, other)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class CompoundPredicate(interfaces.ICompoundPredicate):
+    """Represents conditions combined with a single AND or OR.
+
+    Chains such as ``a & b & c`` are flattened into one node when they are
+    built, instead of a left-deep tree of binary predicates.
+    """
+
+    _operator: str
+    _conditions: tuple[interfaces.ICondition, ...]
+
+    @property
+    def operator(self) -> str:
+        """Get logical operator (AND or OR)."""
+        return self._operator
+
+    @property
+    def conditions(self) -> tuple[interfaces.ICondition, ...]:
+        """Get combined conditions."""
+        return self._conditions
+
+    def accept(self, visitor: "IVisitor") -> str:
+        """Accept a visitor for compilation."""
+        return visitor.visit_compound_predicate(self)
+
+    def __and__(self, other: interfaces.ICondition) -> "CompoundPredicate":
+        """Combine predicates with AND."""
+        return _combine("AND", self, other)
+
+    def __or__(self, other: interfaces.ICondition) -> "CompoundPredicate":
+        """Combine predicates with OR."""
+        return _combine("OR", self, other)
+
+
+def _combine(operator: str, *conditions: interfaces.ICondition) -> "CompoundPredicate":
+    """Combine conditions, merging operands that already use ``operator``."""
+    merged: list[interfaces.ICondition] = []
+    for condition in conditions:
+        if isinstance(condition, CompoundPredicate) and condition._operator == operator:
+            merged.extend(condition._conditions)
+        else:
+            merged.append(condition)
+    return CompoundPredicate(_operator=operator, _conditions=tuple(merged))
+
+
+@dataclass(frozen=True, slots=True)
+class InList(interfaces.IInList):
+    """Represents an IN / NOT IN condition over a list of values.
+
+    The values are bound as a single array parameter when literals are
+    extracted, so the SQL is the same whatever the length of the list.
+    """
+
+    _operand: interfaces.ISQLNode
+    _values: interfaces.ILiteral | interfaces.IPlaceholder
+    _negated: bool = False
+
+    @property
+    def operand(self) -> interfaces.ISQLNode:
+        """Get the tested expression."""
+        return self._operand
+
+    @property
+    def values(self) -> interfaces.ILiteral | interfaces.IPlaceholder:
+        """Get the values, a literal sequence or a placeholder bound to one."""
+        return self._values
+
+    @property
+    def negated(self) -> bool:
+        """Get whether this is a NOT IN condition."""
+        return self._negated
+
+    def accept(self, visitor: "IVisitor") -> str:
+        """Accept a visitor for compilation."""
+        return visitor.visit_in_list(self)
+
+    def __and__(self, other: interfaces.ICondition) -> "CompoundPredicate":
+        """Combine predicates with AND."""
+        return _combine("AND", self, other)
+
+    def __or__(self, other: interfaces.ICondition) -> "CompoundPredicate":
+        """Combine predicates with OR."""
+        return _combine("OR", self, other)
+
+
+@dataclass(frozen=True, slots=True)
 class Placeholder(interfaces.IPlaceholder):
     """Represents a parameter placeholder."""
 
@@ -179,13 +317,13 @@ class Placeholder(interfaces.IPlaceholder):
         return visitor.visit_placeholder(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Join(interfaces.IJoin):
     """Represents a JOIN clause."""
 
     _table: interfaces.ITable
     _join_type: str
-    _on_condition: interfaces.IPredicate | None
+    _on_condition: interfaces.ICondition | None
 
     @property
     def table(self) -> interfaces.ITable:
@@ -198,7 +336,7 @@ class Join(interfaces.IJoin):
         return self._join_type
 
     @property
-    def on_condition(self) -> interfaces.IPredicate | None:
+    def on_condition(self) -> interfaces.ICondition | None:
         """Get ON condition."""
         return self._on_condition
 
@@ -207,22 +345,30 @@ class Join(interfaces.IJoin):
         return visitor.visit_join(self)
 
 
-@dataclass
+@dataclass(frozen=True, eq=False, slots=True)
 class Query(interfaces.IQuery):
-    """Represents a SQL query."""
+    """Represents an immutable SQL query.
+
+    Builder methods return a new ``Query`` that shares every unchanged clause
+    tuple with its parent, so deriving variants from a shared base query is
+    cheap and thread-safe. Queries hash and compare by structure.
+    """
 
-    _select_fields: list[interfaces.ISQLNode]
+    _select_fields: tuple[interfaces.ISQLNode, ...] = ()
     _from_table: interfaces.ITable | None = None
-    _joins: list[interfaces.IJoin] | None = None
-    _where_conditions: list[interfaces.IPredicate] | None = None
-    _group_by_fields: list[interfaces.ISQLNode] | None = None
-    _having_conditions: list[interfaces.IPredicate] | None = None
-    _order_by_fields: list[tuple[interfaces.ISQLNode, str]] | None = None
+    _joins: tuple[interfaces.IJoin, ...] = ()
+    _where_conditions: tuple[interfaces.ICondition, ...] = ()
+    _group_by_fields: tuple[interfaces.ISQLNode, ...] = ()
+    _having_conditions: tuple[interfaces.ICondition, ...] = ()
+    _order_by_fields: tuple[tuple[interfaces.ISQLNode, str], ...] = ()
     _limit_value: int | None = None
     _offset_value: int | None = None
+    _ctes: tuple[interfaces.ICommonTableExpression, ...] = ()
+    _key: Hashable | None = field(default=None, init=False, repr=False)
+    _fingerprint: str | None = field(default=None, init=False, repr=False)
 
     @property
-    def select_fields(self) -> list[interfaces.ISQLNode]:
+    def select_fields(self) -> tuple[interfaces.ISQLNode, ...]:
         """Get selected fields."""
         return self._select_fields
 
@@ -232,29 +378,29 @@ class Query(interfaces.IQuery):
         return self._from_table
 
     @property
-    def joins(self) -> list[interfaces.IJoin]:
+    def joins(self) -> tuple[interfaces.IJoin, ...]:
         """Get JOIN clauses."""
-        return self._joins or []
+        return self._joins
 
     @property
-    def where_conditions(self) -> list[interfaces.IPredicate]:
+    def where_conditions(self) -> tuple[interfaces.ICondition, ...]:
         """Get WHERE conditions."""
-        return self._where_conditions or []
+        return self._where_conditions
 
     @property
-    def group_by_fields(self) -> list[interfaces.ISQLNode]:
+    def group_by_fields(self) -> tuple[interfaces.ISQLNode, ...]:
         """Get GROUP BY fields."""
-        return self._group_by_fields or []
+        return self._group_by_fields
 
     @property
-    def having_conditions(self) -> list[interfaces.IPredicate]:
+    def having_conditions(self) -> tuple[interfaces.ICondition, ...]:
         """Get HAVING conditions."""
-        return self._having_conditions or []
+        return self._having_conditions
 
     @property
-    def order_by_fields(self) -> list[tuple[interfaces.ISQLNode, str]]:
+    def order_by_fields(self) -> tuple[tuple[interfaces.ISQLNode, str], ...]:
         """Get ORDER BY fields."""
-        return self._order_by_fields or []
+        return self._order_by_fields
 
     @property
     def limit_value(self) -> int | None:
@@ -266,103 +412,231 @@ class Query(interfaces.IQuery):
         """Get OFFSET value."""
         return self._offset_value
 
+    @property
+    def ctes(self) -> tuple[interfaces.ICommonTableExpression, ...]:
+        """Get the common table expressions of the WITH clause."""
+        return self._ctes
+
     def accept(self, visitor: "IVisitor") -> str:
         """Accept a visitor for compilation."""
         return visitor.visit_query(self)
 
+    def structure_key(self) -> Hashable:
+        """Get the structural key of the query, computed once and memoized."""
+        key = self._key
+        if key is None:
+            key = _build_key(self)
+            object.__setattr__(self, "_key", key)
+        return key
+
+    def __hash__(self) -> int:
+        """Hash the query by structure."""
+        return hash(self.structure_key())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare queries by structure."""
+        if self is other:
+            return True
+        if not isinstance(other, Query):
+            return NotImplemented
+        return self.structure_key() == other.structure_key()
+
+    def _derive(self, name: str, value: Any) -> Query:
+        """Copy the query with one clause replaced.
+
+        The clauses were validated when this query was built, so they are
+        copied slot by slot rather than through ``replace()`` and
+        ``__init__``. The memoized key and fingerprint start out empty.
+        """
+        if type(self) is not Query:
+            return replace(self, **{name: value})
+        clone = _new_query(Query)
+        for get, set_ in _QUERY_CLAUSES:
+            set_(clone, get(self))
+        for set_ in _QUERY_MEMOS:
+            set_(clone, None)
+        _QUERY_SETTERS[name](clone, value)
+        return clone
+
     def select(self, *fields: interfaces.ISQLNode | str) -> "Query":
         """Add SELECT fields."""
-        converted_fields = [_to_sql_node(f) for f in fields]
-        self._select_fields.extend(converted_fields)
-        return self
+        converted_fields = tuple(_to_sql_node(f) for f in fields)
+        return self._derive("_select_fields", self._select_fields + converted_fields)
 
     def from_(self, table: interfaces.ITable) -> "Query":
         """Set FROM table."""
-        self._from_table = table
-        return self
+        return self._derive("_from_table", table)
 
     def join(
         self,
         table: interfaces.ITable,
-        on: interfaces.IPredicate | None = None,
+        on: interfaces.ICondition | None = None,
         join_type: str = "INNER",
     ) -> "Query":
         """Add a JOIN clause."""
-        if self._joins is None:
-            self._joins = []
-        self._joins.append(Join(_table=table, _join_type=join_type, _on_condition=on))
-        return self
+        join = Join(_table=table, _join_type=join_type, _on_condition=on)
+        return self._derive("_joins", self._joins + (join,))
 
     def left_join(
-        self, table: interfaces.ITable, on: interfaces.IPredicate | None = None
+        self, table: interfaces.ITable, on: interfaces.ICondition | None = None
     ) -> "Query":
         """Add a LEFT JOIN clause."""
         return self.join(table, on, "LEFT")
 
     def right_join(
-        self, table: interfaces.ITable, on: interfaces.IPredicate | None = None
+        self, table: interfaces.ITable, on: interfaces.ICondition | None = None
     ) -> "Query":
         """Add a RIGHT JOIN clause."""
         return self.join(table, on, "RIGHT")
 
-    def where(self, *conditions: interfaces.IPredicate) -> "Query":
+    def where(self, *conditions: interfaces.ICondition) -> "Query":
         """Add WHERE conditions."""
-        if self._where_conditions is None:
-            self._where_conditions = []
-        self._where_conditions.extend(conditions)
-        return self
-
-    def group_by(self, *fields: interfaces.ISQLNode | str) -> "Query":
-        """Add GROUP BY fields."""
-        if self._group_by_fields is None:
-            self._group_by_fields = []
-        converted_fields = [_to_sql_node(f) for f in fields]
-        self._group_by_fields.extend(converted_fields)
-        return self
-
-    def having(self, *conditions: interfaces.IPredicate) -> "Query":
+        return self._derive("_where_conditions", self._where_conditions + conditions)
+
+    def group_by(self, *fields: interfaces.ISQLNode | str | int) -> "Query":
+        """Add GROUP BY fields; integers are positions in the select list."""
+        converted_fields = tuple(_to_sql_node(f) for f in fields)
+        return self._derive(
+            "_group_by_fields", self._group_by_fields + converted_fields
+        )
+
+    def having(self, *conditions: interfaces.ICondition) -> "Query":
         """Add HAVING conditions."""
-        if self._having_conditions is None:
-            self._having_conditions = []
-        self._having_conditions.extend(conditions)
-        return self
+        return self._derive("_having_conditions", self._having_conditions + conditions)
 
     def order_by(
-        self, field: interfaces.ISQLNode | str, direction: str = "ASC"
+        self, field: interfaces.ISQLNode | str | int, direction: str = "ASC"
     ) -> "Query":
-        """Add ORDER BY field."""
-        if self._order_by_fields is None:
-            self._order_by_fields = []
-        converted_field = _to_sql_node(field)
-        self._order_by_fields.append((converted_field, direction))
-        return self
+        """Add ORDER BY field; an integer is a position in the select list."""
+        order_item = (_to_sql_node(field), direction)
+        return self._derive("_order_by_fields", self._order_by_fields + (order_item,))
 
     def limit(self, value: int) -> "Query":
         """Set LIMIT value."""
-        self._limit_value = value
-        return self
+        return self._derive("_limit_value", value)
 
     def offset(self, value: int) -> "Query":
         """Set OFFSET value."""
-        self._offset_value = value
-        return self
+        return self._derive("_offset_value", value)
+
+    def with_(
+        self,
+        name: str,
+        query: interfaces.IQuery,
+        columns: Iterable[str | interfaces.IIdentifier] = (),
+        materialized: bool | None = None,
+    ) -> "Query":
+        """Add a named subquery to the WITH clause.
+
+        ``materialized`` asks for the subquery to be computed once (True) or
+        inlined into each reference (False); None leaves it to the planner.
+        """
+        cte = CommonTableExpression(
+            _name=name,
+            _query=query,
+            _columns=_column_names(columns),
+            _materialized=materialized,
+        )
+        return self._add_cte(cte)
+
+    def with_recursive(
+        self,
+        name: str,
+        anchor: interfaces.IQuery,
+        step: interfaces.IQuery,
+        columns: Iterable[str | interfaces.IIdentifier] = (),
+    ) -> "Query":
+        """Add a recursive CTE, ``anchor UNION ALL step``, to the WITH clause.
+
+        ``step`` refers to the CTE by ``name`` and runs on the rows the last
+        iteration produced, until it returns none.
+        """
+        cte = CommonTableExpression(
+            _name=name, _query=anchor, _step=step, _columns=_column_names(columns)
+        )
+        return self._add_cte(cte)
+
+    def _add_cte(self, cte: "CommonTableExpression") -> "Query":
+        """Append a CTE, rejecting duplicate names."""
+        if any(existing.name == cte.name for existing in self._ctes):
+            raise ValueError(f"A CTE named '{cte.name}' already exists")
+        return self._derive("_ctes", self._ctes + (cte,))
+
+
+# Slot accessors used by Query._derive; the setters bypass the frozen
+# __setattr__ of the dataclass
+_new_query = object.__new__
+_QUERY_CLAUSES = tuple(
+    (getattr(Query, f.name).__get__, getattr(Query, f.name).__set__)
+    for f in fields(Query)
+    if f.init
+)
+_QUERY_MEMOS = tuple(
+    getattr(Query, f.name).__set__ for f in fields(Query) if not f.init
+)
+_QUERY_SETTERS = {f.name: getattr(Query, f.name).__set__ for f in fields(Query)}
+
+
+@dataclass(frozen=True, slots=True)
+class CommonTableExpression(interfaces.ICommonTableExpression):
+    """Represents a named subquery of a WITH clause, possibly recursive."""
 
+    _name: str
+    _query: interfaces.IQuery
+    _step: interfaces.IQuery | None = None
+    _columns: tuple[str, ...] = ()
+    _materialized: bool | None = None
+
+    @property
+    def name(self) -> str:
+        """Get the name the statement refers to the CTE by."""
+        return self._name
+
+    @property
+    def query(self) -> interfaces.IQuery:
+        """Get the query, the anchor member of a recursive CTE."""
+        return self._query
+
+    @property
+    def step(self) -> interfaces.IQuery | None:
+        """Get the recursive member joined by UNION ALL, if recursive."""
+        return self._step
 
-@dataclass(frozen=True)
+    @property
+    def column_names(self) -> tuple[str, ...]:
+        """Get the declared column names."""
+        return self._columns
+
+    @property
+    def materialized(self) -> bool | None:
+        """Get the MATERIALIZED hint, None to let the planner decide."""
+        return self._materialized
+
+    def accept(self, visitor: "IVisitor") -> str:
+        """Accept a visitor for compilation."""
+        return visitor.visit_cte(self)
+
+
+@dataclass(frozen=True, slots=True)
 class Operator(interfaces.IOperator):
     """Represents a SQL operator."""
 
     _operator_name: str
-    _arguments: list[interfaces.ISQLNode]
+    _arguments: tuple[interfaces.ISQLNode, ...]
     _alias: str | None = None
 
+    def __post_init__(self) -> None:
+        """Store arguments as a tuple even when built from a list."""
+        if type(self._arguments) is not tuple:
+            object.__setattr__(self, "_arguments", tuple(self._arguments))
+
     @property
     def operator_name(self) -> str:
         """Get operator name."""
         return self._operator_name
 
     @property
-    def arguments(self) -> list[interfaces.ISQLNode]:
+    def arguments(self) -> tuple[interfaces.ISQLNode, ...]:
         """Get operator arguments."""
         return self._arguments
 
@@ -400,7 +674,7 @@ class Operator(interfaces.IOperator):
         return Predicate(_operator=">=", _left=self, _right=_to_sql_node(other))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RawSQL(interfaces.IRawSQL):
     """Represents raw SQL for direct injection."""
 
@@ -416,26 +690,202 @@ class RawSQL(interfaces.IRawSQL):
         return visitor.visit_raw_sql(self)
 
 
-@dataclass(frozen=True)
-class Literal(interfaces.ISQLNode):
+@dataclass(frozen=True, slots=True)
+class Literal(interfaces.ILiteral):
     """Represents a literal value."""
 
     _value: Any
+    _inline: bool = False
 
     @property
     def value(self) -> Any:
         """Get literal value."""
         return self._value
 
+    @property
+    def inline(self) -> bool:
+        """Get whether the value must always be rendered inline."""
+        return self._inline
+
+    def accept(self, visitor: "IVisitor") -> str:
+        """Accept a visitor for compilation."""
+        return visitor.visit_literal(self)
+
+
+@dataclass(frozen=True, slots=True)
+class OnConflict(interfaces.IOnConflict):
+    """Represents an ON CONFLICT ... DO NOTHING / DO UPDATE clause."""
+
+    _target: tuple[str, ...] = ()
+    _updates: tuple[tuple[str, interfaces.ISQLNode], ...] | None = None
+    _where: interfaces.ICondition | None = None
+
+    @property
+    def target(self) -> tuple[str, ...]:
+        """Get the conflict target column names."""
+        return self._target
+
+    @property
+    def updates(self) -> tuple[tuple[str, interfaces.ISQLNode], ...] | None:
+        """Get the SET assignments, or None for DO NOTHING."""
+        return self._updates
+
+    @property
+    def where(self) -> interfaces.ICondition | None:
+        """Get the condition guarding the update."""
+        return self._where
+
+
+# The row proposed for insertion, as seen by ON CONFLICT DO UPDATE
+EXCLUDED = Table(_name="excluded")
+
+
+@dataclass(frozen=True, slots=True)
+class Insert(interfaces.IInsert):
+    """Represents an immutable INSERT ... VALUES statement."""
+
+    _table: interfaces.ITable
+    _columns: tuple[str, ...] = ()
+    _rows: tuple[tuple[interfaces.ISQLNode, ...], ...] = ()
+    _on_conflict: OnConflict | None = None
+
+    @property
+    def table(self) -> interfaces.ITable:
+        """Get the target table."""
+        return self._table
+
+    @property
+    def column_names(self) -> tuple[str, ...]:
+        """Get the target column names."""
+        return self._columns
+
+    @property
+    def rows(self) -> tuple[tuple[interfaces.ISQLNode, ...], ...]:
+        """Get the rows of values."""
+        return self._rows
+
+    @property
+    def on_conflict(self) -> OnConflict | None:
+        """Get the ON CONFLICT clause."""
+        return self._on_conflict
+
     def accept(self, visitor: "IVisitor") -> str:
         """Accept a visitor for compilation."""
-        # Literals are handled inline, format based on type
-        if isinstance(self._value, str):
-            return f"'{self._value}'"
-        elif self._value is None:
-            return "NULL"
+        return visitor.visit_insert(self)
+
+    def columns(self, *columns: str | interfaces.IIdentifier) -> "Insert":
+        """Set the target columns."""
+        return replace(self, _columns=_column_names(columns))
+
+    def values(self, *values: Any) -> "Insert":
+        """Add one row of values; plain Python values become literals."""
+        if len(values) != len(self._columns):
+            raise ValueError(f"Expected {len(self._columns)} values, got {len(values)}")
+        row = tuple(_to_value_node(value) for value in values)
+        return replace(self, _rows=self._rows + (row,))
+
+    def on_conflict_do_nothing(self, *target: str | interfaces.IIdentifier) -> "Insert":
+        """Skip rows that conflict on ``target`` (or on any constraint)."""
+        clause = OnConflict(_target=_column_names(target), _updates=None)
+        return replace(self, _on_conflict=clause)
+
+    def on_conflict_do_update(
+        self,
+        target: Iterable[str | interfaces.IIdentifier],
+        set_: Iterable[str | interfaces.IIdentifier] | Mapping[str, Any],
+        where: interfaces.ICondition | None = None,
+    ) -> "Insert":
+        """Update conflicting rows instead of inserting them.
+
+        ``set_`` lists columns to overwrite with the proposed row, i.e.
+        ``col = EXCLUDED.col``, or maps columns to arbitrary expressions (see
+        ``excluded()``). ``where`` limits which conflicting rows are updated.
+        """
+        names = _column_names(target)
+        if not names:
+            raise ValueError("ON CONFLICT DO UPDATE requires a conflict target")
+        if isinstance(set_, Mapping):
+            updates = tuple(
+                (name, _to_value_node(value)) for name, value in set_.items()
+            )
         else:
-            return str(self._value)
+            updates = tuple(
+                (name, Identifier(_name=name, _table=EXCLUDED))
+                for name in _column_names(set_)
+            )
+        if not updates:
+            raise ValueError("ON CONFLICT DO UPDATE requires columns to update")
+        clause = OnConflict(_target=names, _updates=updates, _where=where)
+        return replace(self, _on_conflict=clause)
+
+    def values_many(self, rows: Iterable[Any]) -> "BulkInsert":
+        """Insert many rows of plain values, compiled in parameter-bound chunks."""
+        if not self._columns:
+            raise ValueError("values_many() requires columns() to be set")
+        return BulkInsert(_insert=self, _rows=rows)
+
+
+@dataclass(frozen=True, slots=True)
+class BulkInsert:
+    """A lazy multi-row insert over an iterable of rows.
+
+    Rows are sequences in column order or mappings keyed by column name. They
+    are only read while iterating the chunks, so a one-shot iterator can be
+    consumed only once.
+    """
+
+    _insert: Insert
+    _rows: Iterable[Any]
+
+    @property
+    def insert(self) -> Insert:
+        """Get the INSERT statement the rows go into."""
+        return self._insert
+
+    @property
+    def rows(self) -> Iterable[Any]:
+        """Get the source rows."""
+        return self._rows
+
+    def chunks(
+        self,
+        dialect: Dialect,
+        paramstyle: ParamStyle = ParamStyle.NAMED,
+        max_rows: int | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any] | tuple[Any, ...]]]:
+        """Yield ``(sql, params)`` per chunk within the dialect's parameter limit."""
+        # Services depend on the domain, so the compiler is imported lazily
+        from smolql.services.bulk_insert import iter_insert_chunks
+
+        return iter_insert_chunks(self, dialect, paramstyle, max_rows)
+
+
+def _column_names(
+    columns: Iterable[str | interfaces.IIdentifier],
+) -> tuple[str, ...]:
+    """Get column names from names or identifiers."""
+    return tuple(c if isinstance(c, str) else c.name for c in columns)
+
+
+def _to_value_node(value: Any) -> interfaces.ISQLNode:
+    """Convert a value to a SQL node, keeping strings as literals."""
+    if isinstance(value, interfaces.ISQLNode):
+        return value
+    return Literal(_value=value)
+
+
+def _to_list_node(
+    values: Iterable[Any] | interfaces.ILiteral | interfaces.IPlaceholder,
+) -> interfaces.ILiteral | interfaces.IPlaceholder:
+    """Convert IN list values to a placeholder or a literal tuple."""
+    if isinstance(values, interfaces.IPlaceholder):
+        return values
+    inline = False
+    if isinstance(values, interfaces.ILiteral):
+        values, inline = values.value, values.inline
+    if isinstance(values, (str, bytes, interfaces.ISQLNode)):
+        raise TypeError(f"IN expects a collection of values, got {values!r}")
+    return Literal(_value=tuple(values), _inline=inline)
 
 
 def _to_sql_node(value: Any) -> interfaces.ISQLNode:
@@ -449,3 +899,198 @@ def _to_sql_node(value: Any) -> interfaces.ISQLNode:
         return Identifier(_name=value)
     else:
         return Literal(_value=value)
+
+
+# Per node type: 1 for leaves emitted as-is, 0 for plain values, otherwise a
+# getter returning the structural fields in reverse order
+_FIELD_GETTERS: dict[type, Callable[[Any], tuple[Any, ...]] | int] = {}
+
+# Leaf nodes whose generated equality is purely structural, so they can be
+# stored in keys as themselves instead of being expanded field by field
+_KEY_LEAVES = (Table, Placeholder, RawSQL)
+
+
+class _StructureKey:
+    """Hashable structural key of a node tree with a precomputed hash."""
+
+    __slots__ = ("_hash", "_tokens")
+
+    def __init__(self, tokens: tuple[Any, ...]) -> None:
+        """Create a key from a flat token sequence."""
+        self._tokens = tokens
+        self._hash = hash(tokens)
+
+    def __hash__(self) -> int:
+        """Get the precomputed hash."""
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the token sequences."""
+        if self is other:
+            return True
+        if not isinstance(other, _StructureKey):
+            return NotImplemented
+        return self._hash == other._hash and self._tokens == other._tokens
+
+
+def _field_getter(value: Any) -> Callable[[Any], tuple[Any, ...]] | int:
+    """Get how structural keys expand values of the given node type."""
+    value_type = type(value)
+    getter = _FIELD_GETTERS.get(value_type)
+    if getter is not None:
+        return getter
+    if value_type in _KEY_LEAVES:
+        getter = 1
+    elif is_dataclass(value):
+        # Caches and declarations that do not affect the SQL are not structure
+        names = [f.name for f in fields(value) if f.init and f.compare]
+        names.reverse()
+        if len(names) == 1:
+            (name,) = names
+            getter = lambda node: (getattr(node, name),)
+        else:
+            getter = attrgetter(*names)
+    else:
+        getter = 0
+    _FIELD_GETTERS[value_type] = getter
+    return getter
+
+
+def _structural_key(value: Any) -> Hashable:
+    """Build a hashable key describing the structure and values of a node tree.
+
+    The key never compares nodes with overridden comparison operators (e.g.
+    ``Identifier.__eq__``), so it is safe for dictionary lookups. Raises
+    ``TypeError`` for values that cannot be keyed, such as unhashable literals
+    or custom nodes that are not dataclasses.
+    """
+    if isinstance(value, Query):
+        return value.structure_key()
+    return _build_key(value)
+
+
+def _shape_key(root: Any) -> tuple[_StructureKey, list[Literal]]:
+    """Build a structural key leaving out the values of bound literals.
+
+    Literals not marked inline contribute only their value type (and for
+    lists, the type of each item), so statements differing only in those
+    values share a key. They are returned in walk order, for reading the
+    values of a statement with a known shape. Column positions in GROUP BY
+    and ORDER BY render inline, so they stay part of the key.
+    """
+    literals: list[Literal] = []
+    return _build_key(root, literals), literals
+
+
+def _build_key(root: Any, literals: list[Literal] | None = None) -> _StructureKey:
+    """Build a structural key with one iterative pre-order walk.
+
+    With ``literals``, bound literals are collected there instead of keyed by
+    value, and nested queries are walked rather than keyed by their memo.
+    """
+    # Every node contributes its type followed by its fields, containers their
+    # type and length, and plain values their type and value (so that e.g. True
+    # and 1 stay distinct). Strings and None are never confused with a type, so
+    # they are emitted untagged. Arity is implied by the types, so the flat
+    # token sequence identifies the tree. Identifiers and predicates, most of
+    # any tree, are expanded inline rather than through the stack.
+    tokens: list[Any] = []
+    emit = tokens.append
+    stack: list[Any] = [root]
+    pop = stack.pop
+    push_all = stack.extend
+    while stack:
+        value = pop()
+        value_type = type(value)
+        if value_type is str or value is None:
+            emit(value)
+        elif value_type is Identifier:
+            emit(Identifier)
+            emit(value._name)
+            table = value._table
+            if type(table) is Table:
+                # Hashing the tokens is cheaper than hashing the table each time
+                emit(Table)
+                emit(table._name)
+                emit(table._schema)
+                emit(table._alias)
+                emit(value._alias)
+            else:
+                push_all((value._alias, table))
+        elif value_type is Predicate:
+            emit(Predicate)
+            emit(value._operator)
+            push_all((value._right, value._left))
+        elif value_type is tuple or value_type is list:
+            emit(value_type)
+            emit(len(value))
+            push_all(reversed(value))
+        elif value_type is Literal and literals is not None and not value._inline:
+            literals.append(value)
+            emit(Literal)
+            item = value._value
+            item_type = type(item)
+            emit(item_type)
+            if item_type is list or item_type is tuple:
+                emit(tuple(map(type, item)))
+        elif value_type is Query and literals is not None:
+            emit(Query)
+            clauses = list(_QUERY_KEY_FIELDS(value))
+            for slot in _QUERY_POSITION_SLOTS:
+                clauses[slot] = _mark_positions(clauses[slot])
+            push_all(clauses)
+        else:
+            getter = _FIELD_GETTERS.get(value_type)
+            if getter is None:
+                getter = _field_getter(value)
+            if getter == 1:
+                emit(value)
+            elif getter == 0:
+                if isinstance(value, interfaces.ISQLNode):
+                    raise TypeError(
+                        f"Cannot build a structural key for {value_type.__name__}"
+                    )
+                emit(value_type)
+                emit(value)
+            elif value is not root and value_type is Query:
+                emit(value.structure_key())
+            else:
+                emit(value_type)
+                push_all(getter(value))  # type: ignore[operator]
+    return _StructureKey(tuple(tokens))
+
+
+class _Position(int):
+    """Column position of a GROUP BY or ORDER BY item."""
+
+    __slots__ = ()
+
+
+def _mark_positions(items: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Replace the column-position literals of a sort or group list."""
+    # Positions render inline, so unlike other literals they change the SQL
+    marked = []
+    for item in items:
+        if type(item) is tuple:
+            marked.append((_position(item[0]), *item[1:]))
+        else:
+            marked.append(_position(item))
+    return tuple(marked)
+
+
+def _position(node: Any) -> Any:
+    """Get the position a sort or group item stands for, or the item itself."""
+    if isinstance(node, interfaces.ILiteral) and type(node.value) is int:
+        return _Position(node.value)
+    return node
+
+
+# Structural query fields in reverse order, as keys expand them, and where
+# GROUP BY and ORDER BY sit among them
+_QUERY_KEY_NAMES = [f.name for f in reversed(fields(Query)) if f.init and f.compare]
+_QUERY_KEY_FIELDS = attrgetter(*_QUERY_KEY_NAMES)
+_QUERY_POSITION_SLOTS = tuple(
+    index
+    for index, name in enumerate(_QUERY_KEY_NAMES)
+    if name in ("_group_by_fields", "_order_by_fields")
+)
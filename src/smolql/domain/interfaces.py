@@ -1,11 +1,14 @@
 """Domain interfaces for smolql query builder."""
 
 from abc import ABC, abstractmethod
+from typing import Any
 
 
 class ISQLNode(ABC):
     """Interface for all SQL expression nodes."""
 
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: "IVisitor") -> str:
         """Accept a visitor for compilation."""
@@ -15,6 +18,8 @@ class ISQLNode(ABC):
 class IVisitor(ABC):
     """Interface for SQL dialect visitors."""
 
+    __slots__ = ()
+
     @abstractmethod
     def visit_table(self, table: "ITable") -> str:
         """Visit a table node."""
@@ -30,6 +35,11 @@ class IVisitor(ABC):
         """Visit a predicate node."""
         pass
 
+    @abstractmethod
+    def visit_compound_predicate(self, compound: "ICompoundPredicate") -> str:
+        """Visit an n-ary AND/OR predicate node."""
+        pass
+
     @abstractmethod
     def visit_placeholder(self, placeholder: "IPlaceholder") -> str:
         """Visit a placeholder node."""
@@ -55,10 +65,32 @@ class IVisitor(ABC):
         """Visit a raw SQL node."""
         pass
 
+    @abstractmethod
+    def visit_literal(self, literal: "ILiteral") -> str:
+        """Visit a literal value node."""
+        pass
+
+    @abstractmethod
+    def visit_insert(self, insert: "IInsert") -> str:
+        """Visit an INSERT statement node."""
+        pass
+
+    @abstractmethod
+    def visit_in_list(self, in_list: "IInList") -> str:
+        """Visit an IN list condition node."""
+        pass
+
+    @abstractmethod
+    def visit_cte(self, cte: "ICommonTableExpression") -> str:
+        """Visit a common table expression node."""
+        pass
+
 
 class ITable(ISQLNode):
     """Interface for table representation."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -81,6 +113,8 @@ class ITable(ISQLNode):
 class IIdentifier(ISQLNode):
     """Interface for column/field identifiers."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -100,9 +134,17 @@ class IIdentifier(ISQLNode):
         pass
 
 
-class IPredicate(ISQLNode):
+class ICondition(ISQLNode):
+    """Interface for boolean conditions usable in WHERE, HAVING and ON."""
+
+    __slots__ = ()
+
+
+class IPredicate(ICondition):
     """Interface for WHERE/ON predicates."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def operator(self) -> str:
@@ -122,9 +164,53 @@ class IPredicate(ISQLNode):
         pass
 
 
+class ICompoundPredicate(ICondition):
+    """Interface for n-ary AND/OR combinations of conditions."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def operator(self) -> str:
+        """Get logical operator (AND or OR)."""
+        pass
+
+    @property
+    @abstractmethod
+    def conditions(self) -> tuple[ICondition, ...]:
+        """Get combined conditions."""
+        pass
+
+
+class IInList(ICondition):
+    """Interface for IN / NOT IN conditions over a list of values."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def operand(self) -> ISQLNode:
+        """Get the tested expression."""
+        pass
+
+    @property
+    @abstractmethod
+    def values(self) -> "ILiteral | IPlaceholder":
+        """Get the values, a literal sequence or a placeholder bound to one."""
+        pass
+
+    @property
+    @abstractmethod
+    def negated(self) -> bool:
+        """Get whether this is a NOT IN condition."""
+        pass
+
+
 class IPlaceholder(ISQLNode):
     """Interface for parameter placeholders."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -135,6 +221,8 @@ class IPlaceholder(ISQLNode):
 class IJoin(ISQLNode):
     """Interface for JOIN clauses."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def table(self) -> ITable:
@@ -149,7 +237,7 @@ class IJoin(ISQLNode):
 
     @property
     @abstractmethod
-    def on_condition(self) -> IPredicate | None:
+    def on_condition(self) -> ICondition | None:
         """Get ON condition."""
         pass
 
@@ -157,9 +245,11 @@ class IJoin(ISQLNode):
 class IQuery(ISQLNode):
     """Interface for SQL queries."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
-    def select_fields(self) -> list[ISQLNode]:
+    def select_fields(self) -> tuple[ISQLNode, ...]:
         """Get selected fields."""
         pass
 
@@ -171,31 +261,31 @@ class IQuery(ISQLNode):
 
     @property
     @abstractmethod
-    def joins(self) -> list[IJoin]:
+    def joins(self) -> tuple[IJoin, ...]:
         """Get JOIN clauses."""
         pass
 
     @property
     @abstractmethod
-    def where_conditions(self) -> list[IPredicate]:
+    def where_conditions(self) -> tuple[ICondition, ...]:
         """Get WHERE conditions."""
         pass
 
     @property
     @abstractmethod
-    def group_by_fields(self) -> list[ISQLNode]:
+    def group_by_fields(self) -> tuple[ISQLNode, ...]:
         """Get GROUP BY fields."""
         pass
 
     @property
     @abstractmethod
-    def having_conditions(self) -> list[IPredicate]:
+    def having_conditions(self) -> tuple[ICondition, ...]:
         """Get HAVING conditions."""
         pass
 
     @property
     @abstractmethod
-    def order_by_fields(self) -> list[tuple[ISQLNode, str]]:
+    def order_by_fields(self) -> tuple[tuple[ISQLNode, str], ...]:
         """Get ORDER BY fields with direction."""
         pass
 
@@ -211,10 +301,54 @@ class IQuery(ISQLNode):
         """Get OFFSET value."""
         pass
 
+    @property
+    @abstractmethod
+    def ctes(self) -> tuple["ICommonTableExpression", ...]:
+        """Get the common table expressions of the WITH clause."""
+        pass
+
+
+class ICommonTableExpression(ISQLNode):
+    """Interface for a named subquery of a WITH clause."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Get the name the statement refers to the CTE by."""
+        pass
+
+    @property
+    @abstractmethod
+    def query(self) -> IQuery:
+        """Get the query, the anchor member of a recursive CTE."""
+        pass
+
+    @property
+    @abstractmethod
+    def step(self) -> IQuery | None:
+        """Get the recursive member joined by UNION ALL, if recursive."""
+        pass
+
+    @property
+    @abstractmethod
+    def column_names(self) -> tuple[str, ...]:
+        """Get the declared column names."""
+        pass
+
+    @property
+    @abstractmethod
+    def materialized(self) -> bool | None:
+        """Get the MATERIALIZED hint, None to let the planner decide."""
+        pass
+
 
 class IOperator(ISQLNode):
     """Interface for SQL operators (COUNT, SUM, etc.)."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def operator_name(self) -> str:
@@ -223,7 +357,7 @@ class IOperator(ISQLNode):
 
     @property
     @abstractmethod
-    def arguments(self) -> list[ISQLNode]:
+    def arguments(self) -> tuple[ISQLNode, ...]:
         """Get operator arguments."""
         pass
 
@@ -237,8 +371,82 @@ class IOperator(ISQLNode):
 class IRawSQL(ISQLNode):
     """Interface for raw SQL injection."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def sql(self) -> str:
         """Get raw SQL string."""
         pass
+
+
+class ILiteral(ISQLNode):
+    """Interface for literal values."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def value(self) -> Any:
+        """Get literal value."""
+        pass
+
+    @property
+    @abstractmethod
+    def inline(self) -> bool:
+        """Get whether the value must always be rendered inline."""
+        pass
+
+
+class IOnConflict(ABC):
+    """Interface for the ON CONFLICT clause of an INSERT."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def target(self) -> tuple[str, ...]:
+        """Get the conflict target column names."""
+        pass
+
+    @property
+    @abstractmethod
+    def updates(self) -> tuple[tuple[str, ISQLNode], ...] | None:
+        """Get the SET assignments, or None for DO NOTHING."""
+        pass
+
+    @property
+    @abstractmethod
+    def where(self) -> ICondition | None:
+        """Get the condition guarding the update."""
+        pass
+
+
+class IInsert(ISQLNode):
+    """Interface for INSERT statements."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def table(self) -> ITable:
+        """Get the target table."""
+        pass
+
+    @property
+    @abstractmethod
+    def column_names(self) -> tuple[str, ...]:
+        """Get the target column names."""
+        pass
+
+    @property
+    @abstractmethod
+    def rows(self) -> tuple[tuple[ISQLNode, ...], ...]:
+        """Get the rows of values."""
+        pass
+
+    @property
+    @abstractmethod
+    def on_conflict(self) -> IOnConflict | None:
+        """Get the ON CONFLICT clause."""
+        pass
@@ -1,6 +1,8 @@
 """Value objects for smolql."""
 
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any
 
 
 class Dialect(Enum):
@@ -8,3 +10,62 @@ class Dialect(Enum):
 
     POSTGRESQL = "postgresql"
     SQLITE = "sqlite"
+
+
+class ParamStyle(Enum):
+    """Parameter marker styles understood by database drivers."""
+
+    NAMED = "named"  # :name
+    NUMERIC = "numeric"  # $1, $2, ... as used by PostgreSQL drivers
+    QMARK = "qmark"  # ?
+    PYFORMAT = "pyformat"  # %(name)s
+
+
+class CopyFormat(Enum):
+    """PostgreSQL COPY data formats."""
+
+    TEXT = "text"
+    CSV = "csv"
+
+
+@dataclass(frozen=True)
+class DialectSpec:
+    """What sets one SQL dialect apart from another when compiling."""
+
+    dialect: Dialect
+    supports_schema: bool = True
+    identifier_quote: str = '"'
+    # Most bound parameters a single statement may carry
+    max_parameters: int = 65535
+    # Whether a list binds as one array parameter; otherwise IN lists are
+    # bound as a JSON array and expanded with json_each()
+    array_params: bool = True
+    # Whether CTEs accept AS [NOT] MATERIALIZED; otherwise the hint is dropped
+    cte_materialized: bool = True
+
+    def quote(self, name: str) -> str:
+        """Quote an identifier name."""
+        return f"{self.identifier_quote}{name}{self.identifier_quote}"
+
+
+@dataclass(frozen=True)
+class CompiledStatement:
+    """Compiled SQL together with the names of its placeholders.
+
+    ``param_names`` lists one name per parameter slot in the order the driver
+    expects them: a name used several times takes a single slot, except with
+    ``ParamStyle.QMARK`` where every ``?`` is its own slot. ``positions`` maps
+    each name to its 1-based slot. ``params`` holds the values of literals that
+    were extracted into generated parameters.
+    """
+
+    sql: str
+    param_names: tuple[str, ...] = ()
+    params: dict[str, Any] = field(default_factory=dict)
+    paramstyle: ParamStyle = ParamStyle.NAMED
+    positions: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def is_positional(self) -> bool:
+        """Get whether parameters are passed as a sequence rather than a mapping."""
+        return self.paramstyle in (ParamStyle.NUMERIC, ParamStyle.QMARK)
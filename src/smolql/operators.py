@@ -9,57 +9,57 @@ def count(
 ) -> Operator:
     """Create a COUNT operator."""
     if field is None:
-        args: list[interfaces.ISQLNode] = [RawSQL(_sql="*")]
+        args: tuple[interfaces.ISQLNode, ...] = (RawSQL(_sql="*"),)
     else:
-        args = [_to_sql_node(field)]
+        args = (_to_sql_node(field),)
     return Operator(_operator_name="COUNT", _arguments=args, _alias=alias)
 
 
 def sum_(field: interfaces.ISQLNode | str, alias: str | None = None) -> Operator:
     """Create a SUM operator."""
     return Operator(
-        _operator_name="SUM", _arguments=[_to_sql_node(field)], _alias=alias
+        _operator_name="SUM", _arguments=(_to_sql_node(field),), _alias=alias
     )
 
 
 def avg(field: interfaces.ISQLNode | str, alias: str | None = None) -> Operator:
     """Create an AVG operator."""
     return Operator(
-        _operator_name="AVG", _arguments=[_to_sql_node(field)], _alias=alias
+        _operator_name="AVG", _arguments=(_to_sql_node(field),), _alias=alias
     )
 
 
 def min_(field: interfaces.ISQLNode | str, alias: str | None = None) -> Operator:
     """Create a MIN operator."""
     return Operator(
-        _operator_name="MIN", _arguments=[_to_sql_node(field)], _alias=alias
+        _operator_name="MIN", _arguments=(_to_sql_node(field),), _alias=alias
     )
 
 
 def max_(field: interfaces.ISQLNode | str, alias: str | None = None) -> Operator:
     """Create a MAX operator."""
     return Operator(
-        _operator_name="MAX", _arguments=[_to_sql_node(field)], _alias=alias
+        _operator_name="MAX", _arguments=(_to_sql_node(field),), _alias=alias
     )
 
 
 def lower(field: interfaces.ISQLNode | str, alias: str | None = None) -> Operator:
     """Create a LOWER operator."""
     return Operator(
-        _operator_name="LOWER", _arguments=[_to_sql_node(field)], _alias=alias
+        _operator_name="LOWER", _arguments=(_to_sql_node(field),), _alias=alias
     )
 
 
 def upper(field: interfaces.ISQLNode | str, alias: str | None = None) -> Operator:
     """Create an UPPER operator."""
     return Operator(
-        _operator_name="UPPER", _arguments=[_to_sql_node(field)], _alias=alias
+        _operator_name="UPPER", _arguments=(_to_sql_node(field),), _alias=alias
     )
 
 
 def concat(*fields: interfaces.ISQLNode | str, alias: str | None = None) -> Operator:
     """Create a CONCAT operator."""
-    args = [_to_sql_node(f) for f in fields]
+    args = tuple(_to_sql_node(f) for f in fields)
     return Operator(_operator_name="CONCAT", _arguments=args, _alias=alias)
 
 
@@ -67,7 +67,7 @@ def coalesce(
     *fields: interfaces.ISQLNode | str | None, alias: str | None = None
 ) -> Operator:
     """Create a COALESCE operator."""
-    args = [_to_sql_node(f) for f in fields]
+    args = tuple(_to_sql_node(f) for f in fields)
     return Operator(_operator_name="COALESCE", _arguments=args, _alias=alias)
 
 
@@ -77,24 +77,24 @@ def cast(
     """Create a CAST operator."""
     return Operator(
         _operator_name="CAST",
-        _arguments=[_to_sql_node(field), RawSQL(_sql=f"AS {type_name}")],
+        _arguments=(_to_sql_node(field), RawSQL(_sql=f"AS {type_name}")),
         _alias=alias,
     )
 
 
 def now(alias: str | None = None) -> Operator:
     """Create a NOW operator."""
-    return Operator(_operator_name="NOW", _arguments=[], _alias=alias)
+    return Operator(_operator_name="NOW", _arguments=(), _alias=alias)
 
 
 def current_date(alias: str | None = None) -> Operator:
     """Create a CURRENT_DATE operator."""
-    return Operator(_operator_name="CURRENT_DATE", _arguments=[], _alias=alias)
+    return Operator(_operator_name="CURRENT_DATE", _arguments=(), _alias=alias)
 
 
 def current_timestamp(alias: str | None = None) -> Operator:
     """Create a CURRENT_TIMESTAMP operator."""
-    return Operator(_operator_name="CURRENT_TIMESTAMP", _arguments=[], _alias=alias)
+    return Operator(_operator_name="CURRENT_TIMESTAMP", _arguments=(), _alias=alias)
 
 
 def date_trunc(
@@ -103,7 +103,7 @@ def date_trunc(
     """Create a DATE_TRUNC operator."""
     return Operator(
         _operator_name="DATE_TRUNC",
-        _arguments=[RawSQL(_sql=f"'{precision}'"), _to_sql_node(field)],
+        _arguments=(RawSQL(_sql=f"'{precision}'"), _to_sql_node(field)),
         _alias=alias,
     )
 
@@ -114,7 +114,7 @@ def extract(
     """Create an EXTRACT operator."""
     return Operator(
         _operator_name="EXTRACT",
-        _arguments=[RawSQL(_sql=f"{part} FROM"), _to_sql_node(field)],
+        _arguments=(RawSQL(_sql=f"{part} FROM"), _to_sql_node(field)),
         _alias=alias,
     )
 
@@ -122,23 +122,23 @@ def extract(
 def distinct(field: interfaces.ISQLNode | str, alias: str | None = None) -> Operator:
     """Create a DISTINCT operator."""
     return Operator(
-        _operator_name="DISTINCT", _arguments=[_to_sql_node(field)], _alias=alias
+        _operator_name="DISTINCT", _arguments=(_to_sql_node(field),), _alias=alias
     )
 
 
 def row_number(alias: str | None = None) -> Operator:
     """Create a ROW_NUMBER window function."""
-    return Operator(_operator_name="ROW_NUMBER", _arguments=[], _alias=alias)
+    return Operator(_operator_name="ROW_NUMBER", _arguments=(), _alias=alias)
 
 
 def rank(alias: str | None = None) -> Operator:
     """Create a RANK window function."""
-    return Operator(_operator_name="RANK", _arguments=[], _alias=alias)
+    return Operator(_operator_name="RANK", _arguments=(), _alias=alias)
 
 
 def dense_rank(alias: str | None = None) -> Operator:
     """Create a DENSE_RANK window function."""
-    return Operator(_operator_name="DENSE_RANK", _arguments=[], _alias=alias)
+    return Operator(_operator_name="DENSE_RANK", _arguments=(), _alias=alias)
 
 
 def lag(
@@ -147,7 +147,7 @@ def lag(
     """Create a LAG window function."""
     return Operator(
         _operator_name="LAG",
-        _arguments=[_to_sql_node(field), _to_sql_node(offset)],
+        _arguments=(_to_sql_node(field), _to_sql_node(offset)),
         _alias=alias,
     )
 
@@ -158,6 +158,13 @@ def lead(
     """Create a LEAD window function."""
     return Operator(
         _operator_name="LEAD",
-        _arguments=[_to_sql_node(field), _to_sql_node(offset)],
+        _arguments=(_to_sql_node(field), _to_sql_node(offset)),
         _alias=alias,
     )
+
+
+def tuple_(*fields: interfaces.ISQLNode | str) -> Operator:
+    """Create a row value such as ``(a, b)``, comparable with another one."""
+    return Operator(
+        _operator_name="", _arguments=tuple(_to_sql_node(f) for f in fields)
+    )
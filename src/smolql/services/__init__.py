@@ -1,13 +1,94 @@
 """Services layer exports."""
 
+from smolql.services.async_executor import (
+    AsyncDriver,
+    AsyncExecutor,
+    ThreadedDriver,
+)
+from smolql.services.bulk_insert import iter_insert_chunks, rows_per_chunk
+from smolql.services.compile_cache import (
+    CacheInfo,
+    CompileCache,
+    default_compile_cache,
+)
 from smolql.services.compiler_service import (
     PostgreSQLVisitor,
+    SQLCompiler,
     SQLiteVisitor,
     compile_query,
+    compile_statement,
+    get_compiler,
+    normalized_sql,
+)
+from smolql.services.copy_from import CopyFrom
+from smolql.services.executor import Executor, StatementCache, driver_paramstyle
+from smolql.services.explain import PlanNode, QueryPlan, explain, explain_sql
+from smolql.services.fingerprint import fingerprint
+from smolql.services.index_advisor import (
+    IndexCheck,
+    IndexSuggestion,
+    advise_indexes,
+    check_indexes,
+)
+from smolql.services.instrumentation import (
+    CompileEvent,
+    CompileObserver,
+    CompileStats,
+    CompileSummary,
+    add_compile_observer,
+    count_nodes,
+    remove_compile_observer,
 )
+from smolql.services.keyset import Keyset, decode_cursor, encode_cursor
+from smolql.services.prepared_query import PreparedQuery, prepare_query
+from smolql.services.sqlite_pool import PoolMetrics, SQLitePool, SQLitePragmas
+from smolql.services.streaming import ServerCursor, iter_batches, server_cursor
 
 __all__ = [
+    "AsyncDriver",
+    "AsyncExecutor",
+    "CacheInfo",
+    "CompileCache",
+    "CompileEvent",
+    "CompileObserver",
+    "CompileStats",
+    "CompileSummary",
+    "CopyFrom",
+    "Executor",
+    "IndexCheck",
+    "IndexSuggestion",
+    "Keyset",
+    "PlanNode",
+    "PoolMetrics",
     "PostgreSQLVisitor",
+    "PreparedQuery",
+    "QueryPlan",
+    "SQLCompiler",
+    "SQLitePool",
+    "SQLitePragmas",
     "SQLiteVisitor",
+    "ServerCursor",
+    "StatementCache",
+    "ThreadedDriver",
+    "add_compile_observer",
+    "advise_indexes",
+    "check_indexes",
     "compile_query",
+    "compile_statement",
+    "count_nodes",
+    "decode_cursor",
+    "default_compile_cache",
+    "driver_paramstyle",
+    "encode_cursor",
+    "explain",
+    "explain_sql",
+    "fingerprint",
+    "get_compiler",
+    "iter_batches",
+    "iter_insert_chunks",
+    "normalized_sql",
+    "prepare_query",
+    "remove_compile_observer",
+    "rows_per_chunk",
+    "server_cursor",
 ]
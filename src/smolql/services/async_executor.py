@@ -0,0 +1,335 @@
+"""Asyncio execution on top of pluggable drivers."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from smolql.domain import interfaces
+from smolql.domain.value_objects import Dialect, ParamStyle
+from smolql.services.compile_cache import CacheInfo
+from smolql.services.executor import StatementCache, driver_paramstyle
+from smolql.services.prepared_query import PreparedQuery
+
+__all__ = ["AsyncDriver", "AsyncExecutor", "ThreadedDriver"]
+
+_T = TypeVar("_T")
+
+
+class AsyncDriver(ABC):
+    """Runs compiled SQL for an ``AsyncExecutor``.
+
+    Native async drivers implement this directly; blocking DB-API drivers are
+    wrapped in a ``ThreadedDriver``.
+    """
+
+    @property
+    @abstractmethod
+    def paramstyle(self) -> ParamStyle:
+        """Get the parameter marker style the driver expects."""
+        pass
+
+    @abstractmethod
+    async def fetchall(
+        self, sql: str, params: Any, timeout: float | None = None
+    ) -> list[Any]:
+        """Execute SQL and get all result rows."""
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        sql: str,
+        params: Any,
+        batch_size: int = 1000,
+        timeout: float | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """Execute SQL and yield its rows in batches."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the driver's resources."""
+        pass
+
+
+class _Lease:
+    """A connection checked out of a ``ThreadedDriver``."""
+
+    __slots__ = ("connection", "pending")
+
+    def __init__(self, connection: Any) -> None:
+        """Create a lease on a connection."""
+        self.connection = connection
+        # Last call submitted to a worker thread for this connection
+        self.pending: asyncio.Future[Any] | None = None
+
+
+class ThreadedDriver(AsyncDriver):
+    """Runs a blocking DB-API driver on a bounded pool of worker threads.
+
+    ``connect`` is called to open up to ``max_workers`` connections, each used
+    by one call at a time, so at most ``max_workers`` statements run at once
+    and other callers wait on the event loop instead of queueing behind them
+    in a thread. Connections move between threads, so ``sqlite3`` ones must
+    be opened with ``check_same_thread=False``.
+
+    When a call times out or is cancelled the driver interrupts it where the
+    connection supports it (``sqlite3``'s ``interrupt()``), and the connection
+    is closed, not reused, once the worker thread has finished with it.
+
+    Connections are opened on worker threads as calls need them. Only when
+    ``paramstyle`` is not given does the constructor open one connection
+    itself, to infer it; inside a coroutine use ``await ThreadedDriver.open()``
+    instead, which does so on a worker thread.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        max_workers: int = 4,
+        paramstyle: ParamStyle | None = None,
+    ) -> None:
+        """Create a driver, connecting now only to infer a missing paramstyle."""
+        if max_workers <= 0:
+            raise ValueError(
+                f"max_workers must be a positive integer, got {max_workers}"
+            )
+        self._connect = connect
+        self._max_workers = max_workers
+        self._threads = ThreadPoolExecutor(max_workers, thread_name_prefix="smolql")
+        self._slots = asyncio.Semaphore(max_workers)
+        self._idle: list[Any] = []
+        if paramstyle is None:
+            first = connect()
+            self._idle.append(first)
+            paramstyle = driver_paramstyle(first)
+        self._paramstyle = paramstyle
+
+    @classmethod
+    async def open(
+        cls,
+        connect: Callable[[], Any],
+        max_workers: int = 4,
+        paramstyle: ParamStyle | None = None,
+    ) -> "ThreadedDriver":
+        """Create a driver without blocking the event loop on ``connect``."""
+        if paramstyle is not None:
+            return cls(connect, max_workers, paramstyle)
+        first = await asyncio.to_thread(connect)
+        try:
+            driver = cls(connect, max_workers, driver_paramstyle(first))
+        except BaseException:
+            first.close()
+            raise
+        driver._idle.append(first)
+        return driver
+
+    @property
+    def paramstyle(self) -> ParamStyle:
+        """Get the parameter marker style of the wrapped driver."""
+        return self._paramstyle
+
+    @property
+    def max_workers(self) -> int:
+        """Get the most statements run at once."""
+        return self._max_workers
+
+    async def fetchall(
+        self, sql: str, params: Any, timeout: float | None = None
+    ) -> list[Any]:
+        """Execute SQL on a worker thread and get all result rows."""
+        async with self._lease() as lease:
+            return await self._call(lease, _fetchall, sql, params, timeout=timeout)
+
+    async def stream(
+        self,
+        sql: str,
+        params: Any,
+        batch_size: int = 1000,
+        timeout: float | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """Execute SQL and yield its rows in batches, one worker call each.
+
+        The connection stays checked out until the stream is exhausted or
+        closed, but no worker thread is held while the consumer is busy.
+        """
+        async with self._lease() as lease:
+            cursor = await self._call(lease, _execute, sql, params, timeout=timeout)
+            try:
+                while True:
+                    rows = await self._call(
+                        lease, _fetchmany, cursor, batch_size, timeout=timeout
+                    )
+                    if not rows:
+                        break
+                    yield rows
+                    if len(rows) < batch_size:
+                        break
+            finally:
+                if lease.pending is None or lease.pending.done():
+                    cursor.close()
+
+    async def close(self) -> None:
+        """Close idle connections and stop the worker threads."""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+        await asyncio.get_running_loop().run_in_executor(None, self._threads.shutdown)
+
+    @asynccontextmanager
+    async def _lease(self) -> AsyncIterator[_Lease]:
+        """Check out a connection for the duration of a call or stream."""
+        await self._slots.acquire()
+        try:
+            if self._idle:
+                lease = _Lease(self._idle.pop())
+            else:
+                loop = asyncio.get_running_loop()
+                lease = _Lease(await loop.run_in_executor(self._threads, self._connect))
+        except BaseException:
+            self._slots.release()
+            raise
+
+        try:
+            yield lease
+        finally:
+            pending = lease.pending
+            if pending is not None and not pending.done():
+                # Still running after a timeout: retire it once the call ends
+                pending.add_done_callback(lambda _: self._retire(lease.connection))
+            else:
+                self._idle.append(lease.connection)
+                self._slots.release()
+
+    def _retire(self, connection: Any) -> None:
+        """Close a connection abandoned mid-call and free its slot."""
+        try:
+            connection.close()
+        finally:
+            self._slots.release()
+
+    async def _call(
+        self,
+        lease: _Lease,
+        func: Callable[..., _T],
+        *args: Any,
+        timeout: float | None,
+    ) -> _T:
+        """Run ``func(connection, *args)`` on a worker thread."""
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._threads, func, lease.connection, *args)
+        lease.pending = future
+        try:
+            # Shielded, so a timeout never leaves the thread racing a new call
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except BaseException:
+            if not future.done():
+                interrupt = getattr(lease.connection, "interrupt", None)
+                if interrupt is not None:
+                    interrupt()
+            raise
+
+
+def _execute(connection: Any, sql: str, params: Any) -> Any:
+    """Execute SQL and get the open cursor."""
+    cursor = connection.cursor()
+    cursor.execute(sql, params)
+    return cursor
+
+
+def _fetchall(connection: Any, sql: str, params: Any) -> list[Any]:
+    """Execute SQL and get all result rows."""
+    cursor = _execute(connection, sql, params)
+    try:
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def _fetchmany(connection: Any, cursor: Any, size: int) -> list[Any]:
+    """Get the next batch of rows of an open cursor."""
+    return cursor.fetchmany(size)
+
+
+class AsyncExecutor:
+    """Runs smolql statements from asyncio code.
+
+    Cached statements are bound on the event loop; a cache miss is compiled
+    in a thread so large statements never stall the loop. Blocking work
+    happens in the driver, which bounds how many statements run at once.
+    """
+
+    def __init__(
+        self,
+        driver: AsyncDriver,
+        dialect: Dialect,
+        extract_literals: bool = True,
+        cache_size: int = 256,
+        timeout: float | None = None,
+    ) -> None:
+        """Create an executor with a default per-call timeout in seconds."""
+        self._driver = driver
+        self._dialect = dialect
+        self._timeout = timeout
+        self._cache = StatementCache(
+            dialect, driver.paramstyle, extract_literals, cache_size
+        )
+
+    @property
+    def driver(self) -> AsyncDriver:
+        """Get the driver running the statements."""
+        return self._driver
+
+    @property
+    def dialect(self) -> Dialect:
+        """Get the SQL dialect."""
+        return self._dialect
+
+    async def prepare(self, statement: interfaces.ISQLNode) -> PreparedQuery:
+        """Get the compiled template of a statement, compiling misses off-loop."""
+        key, prepared = self._cache.lookup(statement)
+        if prepared is None:
+            prepared = await asyncio.to_thread(self._cache.compile, statement, key)
+        return prepared
+
+    async def execute(
+        self,
+        statement: interfaces.ISQLNode,
+        params: Mapping[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> list[Any]:
+        """Execute a statement and get all result rows."""
+        prepared = await self.prepare(statement)
+        sql, bound = prepared.bind(**(params or {}))
+        if timeout is None:
+            timeout = self._timeout
+        return await self._driver.fetchall(sql, bound, timeout)
+
+    async def stream(
+        self,
+        statement: interfaces.ISQLNode,
+        params: Mapping[str, Any] | None = None,
+        batch_size: int = 1000,
+        timeout: float | None = None,
+    ) -> AsyncIterator[Any]:
+        """Execute a statement and yield its rows, fetched in batches."""
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+        prepared = await self.prepare(statement)
+        sql, bound = prepared.bind(**(params or {}))
+        if timeout is None:
+            timeout = self._timeout
+        batches = self._driver.stream(sql, bound, batch_size, timeout)
+        try:
+            async for batch in batches:
+                for row in batch:
+                    yield row
+        finally:
+            await batches.aclose()  # type: ignore[attr-defined]
+
+    def cache_info(self) -> CacheInfo:
+        """Get a snapshot of the compiled statement cache statistics."""
+        return self._cache.info()
@@ -0,0 +1,154 @@
+"""Chunked multi-row INSERT compilation."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator, Mapping, Sequence
+from dataclasses import replace
+from itertools import islice
+from typing import Any
+
+from smolql.domain import interfaces
+from smolql.domain.entities import (
+    BulkInsert,
+    Insert,
+    Placeholder,
+    _field_getter,
+    _structural_key,
+)
+from smolql.domain.value_objects import CompiledStatement, Dialect, ParamStyle
+from smolql.services.sql_compiler import get_compiler
+
+__all__ = ["iter_insert_chunks", "rows_per_chunk"]
+
+
+def rows_per_chunk(columns: int, dialect: Dialect, max_rows: int | None = None) -> int:
+    """Get how many rows of ``columns`` values fit in one statement."""
+    limit = get_compiler(dialect).spec.max_parameters
+    rows = limit // columns
+    if rows == 0:
+        raise ValueError(
+            f"{columns} columns exceed the {dialect.value} limit of {limit} parameters"
+        )
+    if max_rows is not None:
+        if max_rows <= 0:
+            raise ValueError(f"max_rows must be a positive integer, got {max_rows}")
+        rows = min(rows, max_rows)
+    return rows
+
+
+# (insert structure, rows, dialect, paramstyle) -> compiled chunk template,
+# least recently used first
+_chunk_statements: OrderedDict[Hashable, CompiledStatement] = OrderedDict()
+_chunk_statements_lock = threading.Lock()
+_MAX_CHUNK_STATEMENTS = 128
+
+
+def _chunk_statement(
+    insert: Insert, rows: int, dialect: Dialect, paramstyle: ParamStyle
+) -> CompiledStatement:
+    """Compile the INSERT for a chunk of ``rows`` rows, once per shape."""
+    try:
+        key: Hashable | None = (_structural_key(insert), rows, dialect, paramstyle)
+    except TypeError:
+        # Unhashable literals in an ON CONFLICT clause cannot be keyed
+        key = None
+    if key is not None:
+        with _chunk_statements_lock:
+            statement = _chunk_statements.get(key)
+            if statement is not None:
+                _chunk_statements.move_to_end(key)
+                return statement
+
+    # A user placeholder sharing a generated name would silently take the
+    # value of a row, so any placeholder outside VALUES is rejected up front
+    if _has_placeholder(insert.on_conflict):
+        raise ValueError("Bulk inserts cannot bind placeholders outside VALUES")
+    width = len(insert.column_names)
+    template = replace(
+        insert,
+        _rows=tuple(
+            tuple(Placeholder(_name=f"_p{row * width + i + 1}") for i in range(width))
+            for row in range(rows)
+        ),
+    )
+    statement = get_compiler(dialect).compile(template, paramstyle=paramstyle)
+
+    if key is not None:
+        with _chunk_statements_lock:
+            _chunk_statements[key] = statement
+            _chunk_statements.move_to_end(key)
+            if len(_chunk_statements) > _MAX_CHUNK_STATEMENTS:
+                _chunk_statements.popitem(last=False)
+    return statement
+
+
+def _has_placeholder(root: Any) -> bool:
+    """Check whether a node tree contains a placeholder."""
+    stack: list[Any] = [root]
+    while stack:
+        value = stack.pop()
+        if type(value) is tuple or type(value) is list:
+            stack.extend(value)
+        elif isinstance(value, interfaces.IPlaceholder):
+            return True
+        else:
+            getter = _field_getter(value)
+            if not isinstance(getter, int):
+                stack.extend(getter(value))
+    return False
+
+
+def _flatten(rows: list[Any], columns: tuple[str, ...]) -> list[Any]:
+    """Flatten rows into one list of values in column order."""
+    width = len(columns)
+    values: list[Any] = []
+    extend = values.extend
+    for row in rows:
+        # Tuples and lists skip the slow ABC checks below
+        row_type = type(row)
+        if (row_type is tuple or row_type is list) and len(row) == width:
+            extend(row)
+        elif isinstance(row, Mapping):
+            extend([row[column] for column in columns])
+        elif (
+            isinstance(row, Sequence)
+            and not isinstance(row, (str, bytes))
+            and len(row) == width
+        ):
+            extend(row)
+        else:
+            raise ValueError(f"Expected a row of {width} values, got {row!r}")
+    return values
+
+
+def iter_insert_chunks(
+    bulk: BulkInsert,
+    dialect: Dialect,
+    paramstyle: ParamStyle = ParamStyle.NAMED,
+    max_rows: int | None = None,
+) -> Iterator[tuple[str, dict[str, Any] | tuple[Any, ...]]]:
+    """Yield ``(sql, params)`` for each chunk of a bulk insert.
+
+    Rows are read lazily, one chunk at a time. Each chunk holds as many rows
+    as fit in the dialect's bound-parameter limit (capped by ``max_rows``),
+    so every full chunk renders the exact same SQL and only the final one
+    may differ. Parameters are a tuple for positional paramstyles and a dict
+    otherwise.
+    """
+    insert = replace(bulk.insert, _rows=())
+    columns = insert.column_names
+    size = rows_per_chunk(len(columns), dialect, max_rows)
+
+    rows = iter(bulk.rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        statement = _chunk_statement(insert, len(chunk), dialect, paramstyle)
+        values = _flatten(chunk, columns)
+        if statement.is_positional:
+            yield statement.sql, tuple(values)
+        else:
+            yield statement.sql, dict(zip(statement.param_names, values))
+        if len(chunk) < size:
+            return
@@ -0,0 +1,127 @@
+"""Bounded LRU cache for compiled SQL."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from time import perf_counter
+
+from smolql.domain import interfaces
+from smolql.domain.entities import _structural_key
+from smolql.domain.value_objects import Dialect
+from smolql.services.compiler_service import get_compiler
+from smolql.services.instrumentation import _observers, _publish_cache_hit
+
+__all__ = ["CacheInfo", "CompileCache", "default_compile_cache"]
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Snapshot of compile cache statistics."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class CompileCache:
+    """LRU cache of compiled SQL keyed by query structure and dialect.
+
+    The key is derived from the query tree, never from object identity, so two
+    queries with the same structure share an entry and a derived query never
+    receives the SQL of its parent. Immutable queries memoize their key.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Create a cache holding at most ``maxsize`` compiled statements."""
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be a positive integer, got {maxsize}")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Get the maximum number of cached statements."""
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """Get the number of cache hits."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of cache misses."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Get the number of entries evicted to respect ``maxsize``."""
+        return self._evictions
+
+    def __len__(self) -> int:
+        """Get the number of cached statements."""
+        return len(self._entries)
+
+    def info(self) -> CacheInfo:
+        """Get a snapshot of the cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Drop all cached statements and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def compile(
+        self, query: interfaces.IQuery | interfaces.IInsert, dialect: Dialect
+    ) -> str:
+        """Compile a query, reusing the cached SQL for identical structures."""
+        started = perf_counter() if _observers else 0.0
+        try:
+            key: Hashable = (dialect, _structural_key(query))
+        except TypeError:
+            # Queries holding unhashable values cannot be keyed; compile directly
+            with self._lock:
+                self._misses += 1
+            return get_compiler(dialect).to_sql(query, cache_hit=False)
+
+        with self._lock:
+            sql = self._entries.get(key)
+            if sql is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if sql is not None:
+            if _observers:
+                _publish_cache_hit(query, dialect, sql, started)
+            return sql
+
+        sql = get_compiler(dialect).to_sql(query, cache_hit=False)
+
+        with self._lock:
+            self._entries[key] = sql
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return sql
+
+
+default_compile_cache = CompileCache()
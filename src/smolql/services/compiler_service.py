@@ -1,21 +1,49 @@
 """Compiler service for converting queries to SQL strings."""
 
 from smolql.domain import interfaces
-from smolql.domain.value_objects import Dialect
+from smolql.domain.value_objects import CompiledStatement, Dialect, ParamStyle
 from smolql.services.postgres_visitor import PostgreSQLVisitor
+from smolql.services.sql_compiler import SQLCompiler, get_compiler
 from smolql.services.sqlite_visitor import SQLiteVisitor
 
-__all__ = ["PostgreSQLVisitor", "SQLiteVisitor", "compile_query"]
+__all__ = [
+    "PostgreSQLVisitor",
+    "SQLCompiler",
+    "SQLiteVisitor",
+    "compile_query",
+    "compile_statement",
+    "get_compiler",
+    "normalized_sql",
+]
 
 
-def compile_query(query: interfaces.IQuery, dialect: Dialect) -> str:
+def compile_query(
+    query: interfaces.IQuery | interfaces.IInsert, dialect: Dialect
+) -> str:
     """Compile a query to SQL string for the given dialect."""
-    visitor: interfaces.IVisitor
-    if dialect == Dialect.POSTGRESQL:
-        visitor = PostgreSQLVisitor()
-    elif dialect == Dialect.SQLITE:
-        visitor = SQLiteVisitor()
-    else:
-        raise ValueError(f"Unsupported dialect: {dialect}")
-
-    return query.accept(visitor)
+    return get_compiler(dialect).to_sql(query)
+
+
+def compile_statement(
+    query: interfaces.IQuery | interfaces.IInsert,
+    dialect: Dialect,
+    extract_literals: bool = False,
+    paramstyle: ParamStyle = ParamStyle.NAMED,
+) -> CompiledStatement:
+    """Compile a query to SQL and collect its parameter names.
+
+    With ``extract_literals`` every literal not marked inline is replaced by a
+    generated ``_pN`` parameter, so one query shape always compiles to the
+    same SQL. LIMIT and OFFSET values are always rendered inline. Parameter
+    markers are rendered directly in ``paramstyle``.
+    """
+    return get_compiler(dialect).compile(query, extract_literals, paramstyle)
+
+
+def normalized_sql(query: interfaces.ISQLNode, dialect: Dialect) -> str:
+    """Render a query with its values replaced by ``?`` markers.
+
+    Literals (inline ones included), placeholders and LIMIT/OFFSET values
+    all render as ``?``, so queries sharing a ``fingerprint`` render alike.
+    """
+    return get_compiler(dialect).normalized_sql(query)
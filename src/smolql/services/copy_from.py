@@ -0,0 +1,208 @@
+"""PostgreSQL COPY FROM STDIN statements and streaming payload encoding."""
+
+import datetime
+import decimal
+import uuid
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from smolql.domain import interfaces
+from smolql.domain.value_objects import CopyFormat, Dialect
+from smolql.services.sql_compiler import get_compiler
+
+__all__ = ["CopyFrom"]
+
+# Characters with a backslash escape in the text format, besides the delimiter
+_TEXT_ESCAPES = {
+    "\\": "\\\\",
+    "\n": "\\n",
+    "\r": "\\r",
+    "\b": "\\b",
+    "\f": "\\f",
+    "\v": "\\v",
+}
+_TEXT_NULL = "\\N"
+# Delimiters PostgreSQL rejects in the text format, where they would be
+# confused with escape sequences, the end-of-data marker or encoded values
+_TEXT_RESERVED = "\\.abcdefghijklmnopqrstuvwxyz0123456789"
+
+# Types whose str() is already the PostgreSQL input representation
+_PLAIN_TYPES = (int, float, decimal.Decimal, uuid.UUID)
+
+
+class CopyFrom:
+    """A ``COPY table (columns) FROM STDIN`` load for PostgreSQL.
+
+    ``sql`` is the statement to execute and ``encode`` turns Python rows into
+    the matching payload in chunks of roughly ``chunk_size`` bytes, so a load
+    of any size is streamed with constant memory.
+    """
+
+    __slots__ = ("_columns", "_delimiter", "_escapes", "_format", "_sql", "_table")
+
+    def __init__(
+        self,
+        table: interfaces.ITable,
+        columns: Iterable[str | interfaces.IIdentifier] | None = None,
+        format: CopyFormat = CopyFormat.TEXT,
+        delimiter: str | None = None,
+    ) -> None:
+        """Create a COPY load, defaulting to the table's declared columns."""
+        if columns is None:
+            columns = getattr(table, "columns", None) or ()
+        names = tuple(c if isinstance(c, str) else c.name for c in columns)
+        if delimiter is None:
+            delimiter = "," if format is CopyFormat.CSV else "\t"
+        # PostgreSQL takes a single one-byte character other than a line break,
+        # and in CSV the quote character
+        reserved = _TEXT_RESERVED if format is CopyFormat.TEXT else '"'
+        if (
+            len(delimiter) != 1
+            or not delimiter.isascii()
+            or delimiter in "\r\n"
+            or delimiter in reserved
+        ):
+            raise ValueError(f"Invalid COPY delimiter: {delimiter!r}")
+
+        self._table = table
+        self._columns = names
+        self._format = format
+        self._delimiter = delimiter
+        escapes = {**_TEXT_ESCAPES, delimiter: f"\\{delimiter}"}
+        if delimiter == "\t":
+            escapes["\t"] = "\\t"
+        self._escapes = str.maketrans(escapes)
+        self._sql = self._render()
+
+    @property
+    def sql(self) -> str:
+        """Get the COPY statement."""
+        return self._sql
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """Get the target column names, empty for all columns."""
+        return self._columns
+
+    @property
+    def format(self) -> CopyFormat:
+        """Get the payload format."""
+        return self._format
+
+    def _render(self) -> str:
+        """Render the COPY statement."""
+        quote = get_compiler(Dialect.POSTGRESQL).spec.quote
+        table = self._table
+        target = quote(table.name)
+        if table.schema:
+            target = f"{quote(table.schema)}.{target}"
+        if self._columns:
+            target += f" ({', '.join(quote(name) for name in self._columns)})"
+
+        options = []
+        if self._format is CopyFormat.CSV:
+            options.append("FORMAT csv")
+            default_delimiter = ","
+        else:
+            default_delimiter = "\t"
+        if self._delimiter != default_delimiter:
+            if not options:
+                options.append("FORMAT text")
+            delimiter = self._delimiter.replace("'", "''")
+            options.append(f"DELIMITER '{delimiter}'")
+
+        sql = f"COPY {target} FROM STDIN"
+        if options:
+            sql += f" WITH ({', '.join(options)})"
+        return sql
+
+    def encode(
+        self,
+        rows: Iterable[Sequence[Any] | Mapping[str, Any]],
+        chunk_size: int = 64 * 1024,
+        encoding: str = "utf-8",
+    ) -> Iterator[bytes]:
+        """Encode rows into COPY payload chunks of about ``chunk_size`` bytes.
+
+        Rows are sequences in column order or mappings keyed by column name.
+        ``None`` becomes NULL, booleans ``t``/``f``, bytes ``bytea`` hex and
+        dates and times ISO 8601. A chunk always ends on a row boundary.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+        if self._format is CopyFormat.CSV:
+            encode_row = self._encode_csv_row
+        else:
+            encode_row = self._encode_text_row
+        columns = self._columns
+
+        lines: list[bytes] = []
+        size = 0
+        for row in rows:
+            # Tuples and lists skip the slow ABC check
+            row_type = type(row)
+            if (
+                row_type is not tuple
+                and row_type is not list
+                and isinstance(row, Mapping)
+            ):
+                if not columns:
+                    raise ValueError("Mapping rows require explicit COPY columns")
+                row = [row[column] for column in columns]
+            line = encode_row(row).encode(encoding)
+            lines.append(line)
+            size += len(line)
+            if size >= chunk_size:
+                yield b"".join(lines)
+                lines.clear()
+                size = 0
+        if lines:
+            yield b"".join(lines)
+
+    def _encode_text_row(self, row: Iterable[Any]) -> str:
+        """Encode one row in the text format."""
+        escapes = self._escapes
+        fields = []
+        for value in row:
+            if value is None:
+                fields.append(_TEXT_NULL)
+            else:
+                fields.append(_to_text(value).translate(escapes))
+        return self._delimiter.join(fields) + "\n"
+
+    def _encode_csv_row(self, row: Iterable[Any]) -> str:
+        """Encode one row in the CSV format."""
+        delimiter = self._delimiter
+        fields = []
+        for value in row:
+            if value is None:
+                # An unquoted empty field is NULL, so empty strings get quoted
+                fields.append("")
+                continue
+            text = _to_text(value)
+            if (
+                not text
+                or text == "\\."
+                or delimiter in text
+                or '"' in text
+                or "\n" in text
+                or "\r" in text
+            ):
+                text = '"' + text.replace('"', '""') + '"'
+            fields.append(text)
+        return delimiter.join(fields) + "\n"
+
+
+def _to_text(value: Any) -> str:
+    """Convert a Python value to its PostgreSQL input representation."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, _PLAIN_TYPES):
+        return str(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
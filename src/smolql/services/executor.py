@@ -0,0 +1,373 @@
+"""Execution of compiled statements on DB-API 2.0 connections."""
+
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import (
+    Callable,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from contextlib import suppress
+from time import perf_counter
+from typing import Any
+
+from smolql.domain import interfaces
+from smolql.domain.entities import BulkInsert, Literal, _shape_key, _structural_key
+from smolql.domain.value_objects import Dialect, ParamStyle
+from smolql.services.compile_cache import CacheInfo
+from smolql.services.instrumentation import _observers, _publish_cache_hit
+from smolql.services.prepared_query import PreparedQuery
+from smolql.services.sql_compiler import get_compiler
+from smolql.services.sql_emitter import LiteralSource
+from smolql.services.streaming import iter_batches, server_cursor
+
+__all__ = ["Executor", "StatementCache", "driver_paramstyle"]
+
+# Extracted parameter name, index of its literal in the statement shape and
+# the conversion of the literal's value, if any
+_Binder = tuple[str, int, Callable[[Any], Any] | None]
+
+# DB-API ``paramstyle`` values and the marker style rendered for them
+_DBAPI_PARAMSTYLES = {
+    "qmark": ParamStyle.QMARK,
+    "named": ParamStyle.NAMED,
+    "pyformat": ParamStyle.PYFORMAT,
+    # format drivers (%s) also accept %(name)s with a mapping
+    "format": ParamStyle.PYFORMAT,
+}
+
+
+def driver_paramstyle(connection: Any) -> ParamStyle:
+    """Get the parameter style of the DB-API module a connection belongs to."""
+    package = type(connection).__module__.split(".")[0]
+    style = getattr(sys.modules.get(package), "paramstyle", None)
+    paramstyle = _DBAPI_PARAMSTYLES.get(style)  # type: ignore[arg-type]
+    if paramstyle is None:
+        raise ValueError(
+            f"Cannot infer a supported paramstyle for {package} ({style!r}); "
+            "pass paramstyle explicitly"
+        )
+    return paramstyle
+
+
+class StatementCache:
+    """LRU cache of prepared statements for one dialect and paramstyle.
+
+    When literals are extracted, statements are keyed by their shape without
+    the literal values, which are read from each statement looked up, so
+    statements differing only in those values share one compiled template.
+    Lookups are split from compilation so callers can compile a miss
+    elsewhere, e.g. off an event loop.
+    """
+
+    def __init__(
+        self,
+        dialect: Dialect,
+        paramstyle: ParamStyle,
+        extract_literals: bool = True,
+        maxsize: int = 256,
+    ) -> None:
+        """Create a cache holding at most ``maxsize`` prepared statements."""
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be a positive integer, got {maxsize}")
+        self._dialect = dialect
+        self._paramstyle = paramstyle
+        self._extract_literals = extract_literals
+        self._maxsize = maxsize
+        self._entries: OrderedDict[
+            Hashable, tuple[PreparedQuery, tuple[_Binder, ...]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def paramstyle(self) -> ParamStyle:
+        """Get the parameter marker style of compiled statements."""
+        return self._paramstyle
+
+    def lookup(
+        self, statement: interfaces.ISQLNode
+    ) -> tuple[Hashable | None, PreparedQuery | None]:
+        """Get the cache key of a statement and its cached template, if any."""
+        started = perf_counter() if _observers else 0.0
+        literals: list[Literal] = []
+        try:
+            if self._extract_literals:
+                key: Hashable | None
+                key, literals = _shape_key(statement)
+            else:
+                key = _structural_key(statement)
+        except TypeError:
+            # Statements holding unhashable values cannot be keyed
+            with self._lock:
+                self._misses += 1
+            return None, None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if entry is None:
+            return key, None
+        prepared, binders = entry
+        if binders:
+            values = {}
+            for name, index, convert in binders:
+                value = literals[index]._value
+                values[name] = value if convert is None else convert(value)
+            prepared = prepared.with_literals(values)
+        if _observers:
+            _publish_cache_hit(statement, self._dialect, prepared.sql, started)
+        return key, prepared
+
+    def compile(
+        self, statement: interfaces.ISQLNode, key: Hashable | None
+    ) -> PreparedQuery:
+        """Compile a statement and cache it under ``key`` unless that is None."""
+        compiled, sources = get_compiler(self._dialect).compile_with_sources(
+            statement, self._extract_literals, self._paramstyle, cache_hit=False
+        )
+        prepared = PreparedQuery(compiled)
+        binders: tuple[_Binder, ...] | None = ()
+        if self._extract_literals and key is not None:
+            binders = _literal_binders(statement, sources)
+        if key is not None and binders is not None:
+            with self._lock:
+                self._entries[key] = (prepared, binders)
+                self._entries.move_to_end(key)
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return prepared
+
+    def prepare(self, statement: interfaces.ISQLNode) -> PreparedQuery:
+        """Get the template of a statement, compiling it on a miss."""
+        key, prepared = self.lookup(statement)
+        if prepared is None:
+            prepared = self.compile(statement, key)
+        return prepared
+
+    def info(self) -> CacheInfo:
+        """Get a snapshot of the cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Drop all cached statements and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+def _literal_binders(
+    statement: interfaces.ISQLNode, sources: dict[str, LiteralSource]
+) -> tuple[_Binder, ...] | None:
+    """Map extracted parameters to the shape's literals, or None if they can't be."""
+    _, literals = _shape_key(statement)
+    indexes = {id(literal): index for index, literal in enumerate(literals)}
+    if len(indexes) < len(literals):
+        # A node used twice holds one value here but may hold two next time
+        return None
+    binders = []
+    for name, (source, convert) in sources.items():
+        index = indexes.get(id(source))
+        if index is None:
+            return None
+        binders.append((name, index, convert))
+    if len({index for _, index, _ in binders}) < len(literals):
+        # Some literal was rendered into the SQL text, e.g. by a custom node
+        return None
+    return tuple(binders)
+
+
+class Executor:
+    """Runs smolql statements on one DB-API connection.
+
+    Compiled statements are cached per executor, and so per connection, keyed
+    by statement structure. Literals are extracted into parameters by default,
+    so statements of the same shape send the same SQL text and the driver's
+    own prepared-statement cache (e.g. ``sqlite3``'s ``cached_statements``)
+    stays warm.
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        dialect: Dialect,
+        paramstyle: ParamStyle | None = None,
+        extract_literals: bool = True,
+        cache_size: int = 256,
+    ) -> None:
+        """Create an executor, inferring the paramstyle from the driver."""
+        self._connection = connection
+        self._dialect = dialect
+        self._cache = StatementCache(
+            dialect,
+            paramstyle or driver_paramstyle(connection),
+            extract_literals,
+            cache_size,
+        )
+
+    @property
+    def connection(self) -> Any:
+        """Get the underlying DB-API connection."""
+        return self._connection
+
+    @property
+    def dialect(self) -> Dialect:
+        """Get the SQL dialect."""
+        return self._dialect
+
+    @property
+    def paramstyle(self) -> ParamStyle:
+        """Get the parameter marker style sent to the driver."""
+        return self._cache.paramstyle
+
+    def prepare(self, statement: interfaces.ISQLNode) -> PreparedQuery:
+        """Get the compiled template of a statement, compiling on a miss."""
+        return self._cache.prepare(statement)
+
+    def execute(
+        self,
+        statement: interfaces.ISQLNode,
+        params: Mapping[str, Any] | None = None,
+    ) -> Any:
+        """Execute a statement with placeholder values and get the cursor."""
+        sql, bound = self.prepare(statement).bind(**(params or {}))
+        cursor = self._connection.cursor()
+        cursor.execute(sql, bound)
+        return cursor
+
+    def executemany(
+        self,
+        statement: interfaces.ISQLNode,
+        params: Iterable[Mapping[str, Any]],
+    ) -> Any:
+        """Execute a statement once per set of placeholder values.
+
+        The statement is compiled once and the parameter sets are bound lazily
+        into a single driver ``executemany`` call.
+        """
+        prepared = self.prepare(statement)
+        bind = prepared.bind
+        cursor = self._connection.cursor()
+        cursor.executemany(prepared.sql, (bind(**values)[1] for values in params))
+        return cursor
+
+    def insert_many(self, bulk: BulkInsert, max_rows: int | None = None) -> int:
+        """Execute a bulk insert chunk by chunk and get the rows inserted."""
+        cursor = self._connection.cursor()
+        total = 0
+        try:
+            for sql, params in bulk.chunks(self._dialect, self.paramstyle, max_rows):
+                cursor.execute(sql, params)
+                total += cursor.rowcount
+        finally:
+            cursor.close()
+        return total
+
+    def fetchall(
+        self,
+        statement: interfaces.ISQLNode,
+        params: Mapping[str, Any] | None = None,
+    ) -> list[Any]:
+        """Execute a statement and get all result rows."""
+        cursor = self.execute(statement, params)
+        try:
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def fetchone(
+        self,
+        statement: interfaces.ISQLNode,
+        params: Mapping[str, Any] | None = None,
+    ) -> Any:
+        """Execute a statement and get its first result row, or None."""
+        cursor = self.execute(statement, params)
+        try:
+            return cursor.fetchone()
+        finally:
+            cursor.close()
+
+    def stream(
+        self,
+        statement: interfaces.ISQLNode,
+        params: Mapping[str, Any] | None = None,
+        batch_size: int = 1000,
+    ) -> Generator[Any, None, None]:
+        """Execute a statement and yield its rows one by one."""
+        for batch in self.stream_batches(statement, params, batch_size):
+            yield from batch
+
+    def stream_batches(
+        self,
+        statement: interfaces.ISQLNode,
+        params: Mapping[str, Any] | None = None,
+        batch_size: int = 1000,
+    ) -> Generator[list[Any], None, None]:
+        """Execute a statement and yield its rows in batches of ``batch_size``.
+
+        At most one batch is held in memory. On PostgreSQL the rows are read
+        through a server-side cursor (``DECLARE`` / ``FETCH FORWARD`` /
+        ``CLOSE``), which must run inside a transaction; other dialects page
+        through the driver cursor with ``fetchmany``.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+        sql, bound = self.prepare(statement).bind(**(params or {}))
+        cursor = self._connection.cursor()
+        try:
+            if self._dialect is Dialect.POSTGRESQL:
+                yield from self._stream_server_cursor(cursor, sql, bound, batch_size)
+            else:
+                cursor.execute(sql, bound)
+                yield from iter_batches(cursor, batch_size)
+        finally:
+            cursor.close()
+
+    def _stream_server_cursor(
+        self, cursor: Any, sql: str, params: Any, batch_size: int
+    ) -> Iterator[list[Any]]:
+        """Yield batches read from a PostgreSQL server-side cursor."""
+        server = server_cursor(sql, batch_size)
+        cursor.execute(server.declare_sql, params)
+        try:
+            while True:
+                cursor.execute(server.fetch_sql)
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                yield rows
+                if len(rows) < batch_size:
+                    break
+        except BaseException:
+            # The transaction may be aborted, so the original error wins
+            with suppress(Exception):
+                cursor.execute(server.close_sql)
+            raise
+        cursor.execute(server.close_sql)
+
+    def cache_info(self) -> CacheInfo:
+        """Get a snapshot of the compiled statement cache statistics."""
+        return self._cache.info()
+
+    def clear_cache(self) -> None:
+        """Drop all cached statements and reset the counters."""
+        self._cache.clear()
@@ -0,0 +1,253 @@
+"""EXPLAIN statements and structured query plans."""
+
+import json
+import re
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any, overload
+
+from smolql.domain import interfaces
+from smolql.domain.value_objects import CompiledStatement, Dialect, ParamStyle
+from smolql.services.executor import driver_paramstyle
+from smolql.services.prepared_query import PreparedQuery
+from smolql.services.sql_compiler import get_compiler
+
+__all__ = [
+    "PlanNode",
+    "QueryPlan",
+    "explain",
+    "explain_sql",
+    "parse_postgresql_plan",
+    "parse_sqlite_plan",
+]
+
+# SQLite "SCAN t ...", "SEARCH TABLE t AS x ..." (older releases add TABLE)
+_SQLITE_ACCESS = re.compile(r"(SCAN|SEARCH) (?:TABLE )?(\S+)(?: AS \S+)?(.*)")
+_SQLITE_INDEX = re.compile(r"USING (?:COVERING )?INDEX (\S+)")
+_SQLITE_TEMP_BTREE = re.compile(r"USE TEMP B-TREE FOR (.+)")
+# SCAN targets that are not tables: constant rows and subqueries
+_SQLITE_NOT_TABLES = ("CONSTANT", "SUBQUERY")
+
+_POSTGRESQL_SORTS = ("Sort", "Incremental Sort")
+
+
+@dataclass(frozen=True)
+class PlanNode:
+    """One step of a query plan, in a dialect-independent shape.
+
+    ``full_scan`` marks steps reading a whole table, and ``missing_index``
+    those that do so without any index, or with an index the database had to
+    build on the fly. ``temp_btree`` names the clause a temporary B-tree (or,
+    on PostgreSQL, an explicit sort) is built for.
+    """
+
+    operation: str
+    detail: str
+    table: str | None = None
+    index: str | None = None
+    full_scan: bool = False
+    missing_index: bool = False
+    temp_btree: str | None = None
+    children: tuple["PlanNode", ...] = ()
+    # Remaining dialect-specific properties, e.g. PostgreSQL costs
+    extra: dict[str, Any] = field(default_factory=dict, compare=False)
+
+    def walk(self) -> Iterator["PlanNode"]:
+        """Yield this node and its descendants, depth first."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """The parsed plan of a query."""
+
+    sql: str
+    nodes: tuple[PlanNode, ...]
+    raw: Any = field(default=None, compare=False, repr=False)
+
+    def walk(self) -> Iterator[PlanNode]:
+        """Yield every plan node, depth first."""
+        for node in self.nodes:
+            yield from node.walk()
+
+    @property
+    def full_scans(self) -> list[PlanNode]:
+        """Get the steps reading whole tables."""
+        return [node for node in self.walk() if node.full_scan]
+
+    @property
+    def missing_indexes(self) -> list[PlanNode]:
+        """Get the steps that would benefit from an index on their table."""
+        return [node for node in self.walk() if node.missing_index]
+
+    @property
+    def temp_btrees(self) -> list[PlanNode]:
+        """Get the steps sorting or grouping through a temporary B-tree."""
+        return [node for node in self.walk() if node.temp_btree]
+
+    @property
+    def uses_index(self) -> bool:
+        """Get whether any step reads through an index."""
+        return any(node.index for node in self.walk())
+
+
+def explain_sql(sql: str, dialect: Dialect, analyze: bool = False) -> str:
+    """Wrap compiled SQL in the dialect's EXPLAIN statement."""
+    if dialect is Dialect.POSTGRESQL:
+        options = "FORMAT JSON, ANALYZE, BUFFERS" if analyze else "FORMAT JSON"
+        return f"EXPLAIN ({options}) {sql}"
+    if dialect is Dialect.SQLITE:
+        if analyze:
+            raise ValueError("EXPLAIN ANALYZE is not supported by SQLite")
+        return f"EXPLAIN QUERY PLAN {sql}"
+    raise ValueError(f"Unsupported dialect: {dialect}")
+
+
+@overload
+def explain(
+    query: interfaces.ISQLNode,
+    dialect: Dialect,
+    analyze: bool = ...,
+    connection: None = ...,
+    params: Mapping[str, Any] | None = ...,
+    paramstyle: ParamStyle | None = ...,
+) -> CompiledStatement: ...
+
+
+@overload
+def explain(
+    query: interfaces.ISQLNode,
+    dialect: Dialect,
+    analyze: bool = ...,
+    *,
+    connection: Any,
+    params: Mapping[str, Any] | None = ...,
+    paramstyle: ParamStyle | None = ...,
+) -> QueryPlan: ...
+
+
+def explain(
+    query: interfaces.ISQLNode,
+    dialect: Dialect,
+    analyze: bool = False,
+    connection: Any = None,
+    params: Mapping[str, Any] | None = None,
+    paramstyle: ParamStyle | None = None,
+) -> CompiledStatement | QueryPlan:
+    """Render the EXPLAIN of a query, or run it on ``connection`` and parse it.
+
+    Without a connection the EXPLAIN statement is returned with the query's
+    placeholders. With a DB-API connection it is executed with ``params``
+    bound and the plan is returned as a ``QueryPlan``. ``analyze`` runs the
+    query for real on PostgreSQL.
+    """
+    if paramstyle is None:
+        if connection is None:
+            paramstyle = ParamStyle.NAMED
+        else:
+            paramstyle = driver_paramstyle(connection)
+    statement = get_compiler(dialect).compile(query, True, paramstyle)
+    wrapped = CompiledStatement(
+        sql=explain_sql(statement.sql, dialect, analyze),
+        param_names=statement.param_names,
+        params=statement.params,
+        paramstyle=statement.paramstyle,
+        positions=statement.positions,
+    )
+    if connection is None:
+        return wrapped
+
+    sql, bound = PreparedQuery(wrapped).bind(**(params or {}))
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql, bound)
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    if dialect is Dialect.POSTGRESQL:
+        return parse_postgresql_plan(statement.sql, rows)
+    return parse_sqlite_plan(statement.sql, rows)
+
+
+def parse_sqlite_plan(sql: str, rows: list[Any]) -> QueryPlan:
+    """Parse ``EXPLAIN QUERY PLAN`` rows of ``(id, parent, notused, detail)``."""
+    children: dict[int, list[tuple[int, str]]] = {}
+    for row in rows:
+        node_id, parent, _, detail = tuple(row)[:4]
+        children.setdefault(parent, []).append((node_id, detail))
+
+    def build(node_id: int, detail: str) -> PlanNode:
+        nested = tuple(build(*child) for child in children.get(node_id, ()))
+        return _sqlite_node(detail, nested)
+
+    nodes = tuple(build(*child) for child in children.get(0, ()))
+    return QueryPlan(sql=sql, nodes=nodes, raw=rows)
+
+
+def _sqlite_node(detail: str, children: tuple[PlanNode, ...]) -> PlanNode:
+    """Classify one line of an SQLite plan."""
+    temp = _SQLITE_TEMP_BTREE.match(detail)
+    if temp:
+        return PlanNode("TEMP B-TREE", detail, temp_btree=temp[1], children=children)
+    access = _SQLITE_ACCESS.match(detail)
+    if not access or access[2].startswith("(") or access[2] in _SQLITE_NOT_TABLES:
+        return PlanNode(detail.split(" ")[0], detail, children=children)
+
+    operation, table, using = access[1], access[2], access[3]
+    automatic = "AUTOMATIC" in using
+    index = None
+    if "PRIMARY KEY" in using:
+        index = "PRIMARY KEY"
+    elif not automatic:
+        named = _SQLITE_INDEX.search(using)
+        index = named[1] if named else None
+    full_scan = operation == "SCAN"
+    return PlanNode(
+        operation,
+        detail,
+        table=table,
+        index=index,
+        full_scan=full_scan,
+        missing_index=automatic or (full_scan and index is None),
+        children=children,
+    )
+
+
+def parse_postgresql_plan(sql: str, rows: list[Any]) -> QueryPlan:
+    """Parse the output of ``EXPLAIN (FORMAT JSON)``.
+
+    Drivers return it as one row holding either the decoded JSON or its text.
+    """
+    output = next(iter(rows[0])) if rows else "[]"
+    if isinstance(output, (str, bytes)):
+        output = json.loads(output)
+    nodes = tuple(_postgresql_node(entry["Plan"]) for entry in output)
+    return QueryPlan(sql=sql, nodes=nodes, raw=output)
+
+
+def _postgresql_node(plan: dict[str, Any]) -> PlanNode:
+    """Convert one PostgreSQL plan node and its children."""
+    operation = plan["Node Type"]
+    table = plan.get("Relation Name")
+    index = plan.get("Index Name")
+    detail = operation
+    if table:
+        detail += f" on {table}"
+    if index:
+        detail += f" using {index}"
+    full_scan = operation == "Seq Scan"
+    return PlanNode(
+        operation,
+        detail,
+        table=table,
+        index=index,
+        full_scan=full_scan,
+        missing_index=full_scan,
+        temp_btree="SORT" if operation in _POSTGRESQL_SORTS else None,
+        children=tuple(_postgresql_node(child) for child in plan.get("Plans", ())),
+        extra={key: value for key, value in plan.items() if key != "Plans"},
+    )
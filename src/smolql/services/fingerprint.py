@@ -0,0 +1,121 @@
+"""Value-independent fingerprints of statements."""
+
+import hashlib
+from dataclasses import MISSING, fields, is_dataclass
+from typing import Any
+
+from smolql.domain import interfaces
+from smolql.domain.entities import Query, _mark_positions, _Position
+
+__all__ = ["fingerprint"]
+
+# Clause values rendered inline rather than bound, normalized like literals
+_VALUE_FIELDS = frozenset({"_limit_value", "_offset_value"})
+# Clauses whose integer literals are column positions, which are structure
+_POSITION_FIELDS = frozenset({"_group_by_fields", "_order_by_fields"})
+
+# Token standing for any literal, placeholder or clause value
+_MARKER = "?"
+# Stands in for a clause value on the walk stack
+_MASKED = object()
+
+# Per node type: name and default of its structural fields, in reverse order
+_FIELDS: dict[type, tuple[tuple[str, Any], ...]] = {}
+
+
+class _FieldName(str):
+    """Name of the node field whose value follows on the walk stack."""
+
+    __slots__ = ()
+
+
+def fingerprint(node: interfaces.ISQLNode) -> str:
+    """Get a stable hash of a statement with its values left out.
+
+    Statements differing only in literal values, placeholder names, IN-list
+    lengths or LIMIT/OFFSET values share a fingerprint. The hash is built
+    from one iterative walk of the tree and does not depend on the process
+    or Python version. Fingerprints of queries are memoized.
+    """
+    if isinstance(node, Query):
+        cached = node._fingerprint
+        if cached is None:
+            cached = _digest(node)
+            object.__setattr__(node, "_fingerprint", cached)
+        return cached
+    return _digest(node)
+
+
+def _digest(root: interfaces.ISQLNode) -> str:
+    """Hash the token sequence of a pre-order walk."""
+    # Nodes contribute their type name and each field not left at its default
+    # as its name then its value, containers their length and plain values a
+    # type-tagged rendering, so the flat sequence identifies the tree and
+    # fields added with a default later keep existing fingerprints unchanged
+    tokens: list[str] = []
+    emit = tokens.append
+    stack: list[Any] = [root]
+    pop = stack.pop
+    while stack:
+        value = pop()
+        if isinstance(value, (interfaces.ILiteral, interfaces.IPlaceholder)):
+            emit(_MARKER)
+        elif type(value) is tuple or type(value) is list:
+            emit(f"({len(value)}")
+            stack.extend(value[::-1])
+        elif isinstance(value, interfaces.ISQLNode):
+            value_type = type(value)
+            specs = _FIELDS.get(value_type)
+            if specs is None:
+                specs = _field_specs(value)
+            emit(value_type.__qualname__)
+            for name, default in specs:
+                field_value = getattr(value, name)
+                if field_value is default or (
+                    type(field_value) is type(default) and field_value == default
+                ):
+                    continue
+                if name in _VALUE_FIELDS:
+                    field_value = _MASKED
+                elif name in _POSITION_FIELDS:
+                    field_value = _mark_positions(field_value)
+                stack.append(field_value)
+                stack.append(name)
+        elif type(value) is _FieldName:
+            emit(f"@{value}")
+        elif type(value) is _Position:
+            emit(f"#{value}")
+        elif value is _MASKED:
+            emit(_MARKER)
+        else:
+            emit(_scalar_token(value))
+    digest = hashlib.blake2b("\x1f".join(tokens).encode(), digest_size=8)
+    return digest.hexdigest()
+
+
+def _field_specs(node: Any) -> tuple[tuple[str, Any], ...]:
+    """Get and remember the structural fields of a node type."""
+    if not is_dataclass(node):
+        raise TypeError(f"Cannot fingerprint {type(node).__name__}")
+    # Caches and declarations that do not affect the SQL are not structure;
+    # required fields get a default no value can be
+    specs = tuple(
+        (_FieldName(f.name), _MASKED if f.default is MISSING else f.default)
+        for f in reversed(fields(node))
+        if f.init and f.compare
+    )
+    _FIELDS[type(node)] = specs
+    return specs
+
+
+def _scalar_token(value: Any) -> str:
+    """Render a plain structural value, such as a name or an operator."""
+    if value is None:
+        return "N"
+    if isinstance(value, bool):
+        return "T" if value else "F"
+    if isinstance(value, str):
+        return f"s{len(value)}:{value}"
+    if isinstance(value, (int, float)):
+        return f"{type(value).__name__[0]}{value!r}"
+    raise TypeError(f"Cannot fingerprint a value of type {type(value).__name__}")
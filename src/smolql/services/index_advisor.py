@@ -0,0 +1,322 @@
+"""Index suggestions derived from a workload of queries."""
+
+import re
+import sqlite3
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from smolql.domain import interfaces
+from smolql.domain.entities import Query
+from smolql.domain.value_objects import Dialect, ParamStyle
+from smolql.services.explain import QueryPlan, explain_sql, parse_sqlite_plan
+from smolql.services.sql_compiler import get_compiler
+
+__all__ = ["IndexCheck", "IndexSuggestion", "advise_indexes", "check_indexes"]
+
+# (schema, name) of a table
+_TableKey = tuple[str | None, str]
+
+_EQUALITY_OPERATORS = frozenset({"=", "IS"})
+_RANGE_OPERATORS = frozenset({"<", "<=", ">", ">="})
+# The operator seen from the other side, for ``value < column``
+_FLIPPED = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", "=": "=", "IS": "IS"}
+
+
+@dataclass(frozen=True)
+class IndexSuggestion:
+    """A composite index proposed for a table.
+
+    ``columns`` holds ``(name, direction)`` pairs in index order. ``weight``
+    sums the weights of the workload queries the index serves.
+    """
+
+    schema: str | None
+    table: str
+    columns: tuple[tuple[str, str], ...]
+    weight: float
+    sql: str
+    queries: tuple[Query, ...] = field(default=(), compare=False, repr=False)
+
+    @property
+    def name(self) -> str:
+        """Get the index name used in ``sql``."""
+        names = "_".join(name for name, _ in self.columns)
+        return re.sub(r"\W", "_", f"ix_{self.table}_{names}")[:63]
+
+
+@dataclass(frozen=True)
+class IndexCheck:
+    """Plans of a suggestion's queries without and with the index."""
+
+    suggestion: IndexSuggestion
+    before: tuple[QueryPlan, ...]
+    after: tuple[QueryPlan, ...]
+
+    @property
+    def used(self) -> bool:
+        """Get whether the planner picks the index for any query."""
+        name = self.suggestion.name
+        return any(node.index == name for plan in self.after for node in plan.walk())
+
+    @property
+    def improves(self) -> bool:
+        """Get whether the index removes full scans or temporary B-trees."""
+        return _plan_cost(self.after) < _plan_cost(self.before)
+
+
+class _TableUsage:
+    """How one query filters, joins, groups and sorts one table."""
+
+    __slots__ = ("equality", "group_by", "order_by", "ranges")
+
+    def __init__(self) -> None:
+        """Create an empty usage."""
+        self.equality: dict[str, None] = {}
+        self.ranges: dict[str, None] = {}
+        self.group_by: list[str] | None = None
+        self.order_by: list[tuple[str, str]] | None = None
+
+    def columns(self) -> tuple[tuple[str, str], ...]:
+        """Order columns as equality, then sort or grouping, then range."""
+        columns = [(name, "ASC") for name in self.equality]
+        seen = set(self.equality)
+        trailing: list[tuple[str, str]] = []
+        if self.order_by:
+            directions = {direction for _, direction in self.order_by}
+            # Uniform directions are read backwards, only mixed ones are kept
+            mixed = len(directions) > 1
+            trailing = [(n, d if mixed else "ASC") for n, d in self.order_by]
+        elif self.group_by:
+            trailing = [(name, "ASC") for name in self.group_by]
+        for name, direction in trailing:
+            if name not in seen:
+                columns.append((name, direction))
+                seen.add(name)
+        # Only the first range column can narrow an index seek
+        for name in self.ranges:
+            if name not in seen:
+                columns.append((name, "ASC"))
+            break
+        return tuple(columns)
+
+
+def advise_indexes(
+    workload: Iterable[Query] | Mapping[Query, float],
+    dialect: Dialect,
+) -> list[IndexSuggestion]:
+    """Propose composite indexes for a workload, most valuable first.
+
+    ``workload`` lists queries, or maps them to weights such as execution
+    frequency. Per query and table, equality filters and join keys come
+    first, then the ORDER BY (or GROUP BY) columns when they all belong to
+    the table, then the first range filter. An index whose columns are a
+    prefix of another suggestion on the same table is folded into it.
+    """
+    weighted = (
+        workload.items()
+        if isinstance(workload, Mapping)
+        else ((query, 1.0) for query in workload)
+    )
+    candidates: dict[tuple[_TableKey, tuple[tuple[str, str], ...]], Any] = {}
+    for query, weight in weighted:
+        for key, usage in _analyze(query).items():
+            columns = usage.columns()
+            if not columns:
+                continue
+            entry = candidates.setdefault((key, columns), [0.0, []])
+            entry[0] += weight
+            entry[1].append(query)
+
+    # Fold indexes that are a prefix of a longer one on the same table
+    ordered = sorted(candidates, key=lambda item: -len(item[1]))
+    kept: dict[tuple[_TableKey, tuple[tuple[str, str], ...]], Any] = {}
+    for table_key, columns in ordered:
+        weight, queries = candidates[(table_key, columns)]
+        for (kept_key, kept_columns), entry in kept.items():
+            if kept_key == table_key and kept_columns[: len(columns)] == columns:
+                entry[0] += weight
+                entry[1].extend(queries)
+                break
+        else:
+            kept[(table_key, columns)] = [weight, list(queries)]
+
+    suggestions = []
+    for ((schema, table), columns), (weight, queries) in kept.items():
+        suggestion = IndexSuggestion(
+            schema, table, columns, weight, "", tuple(dict.fromkeys(queries))
+        )
+        suggestions.append(_with_sql(suggestion, dialect))
+    suggestions.sort(key=lambda s: (-s.weight, s.table, s.columns))
+    return suggestions
+
+
+def check_indexes(
+    suggestions: Iterable[IndexSuggestion], connection: sqlite3.Connection
+) -> list[IndexCheck]:
+    """Compare SQLite query plans without and with each suggested index.
+
+    The schema and planner statistics of ``connection`` are copied into a
+    scratch in-memory database, so the real database is never modified and
+    no data is copied. Each index is created, checked and dropped on its own.
+    """
+    scratch = _scratch_copy(connection)
+    try:
+        checks = []
+        for suggestion in suggestions:
+            sql = _with_sql(suggestion, Dialect.SQLITE).sql
+            before = tuple(_sqlite_plan(scratch, q) for q in suggestion.queries)
+            scratch.execute(sql)
+            try:
+                after = tuple(_sqlite_plan(scratch, q) for q in suggestion.queries)
+            finally:
+                scratch.execute(f'DROP INDEX "{suggestion.name}"')
+            checks.append(IndexCheck(suggestion, before, after))
+        return checks
+    finally:
+        scratch.close()
+
+
+def _with_sql(suggestion: IndexSuggestion, dialect: Dialect) -> IndexSuggestion:
+    """Render the CREATE INDEX statement of a suggestion."""
+    compiler = get_compiler(dialect)
+    quote = compiler.spec.quote
+    target = quote(suggestion.table)
+    if suggestion.schema and compiler.spec.supports_schema:
+        target = f"{quote(suggestion.schema)}.{target}"
+    columns = ", ".join(
+        quote(name) + (" DESC" if direction == "DESC" else "")
+        for name, direction in suggestion.columns
+    )
+    sql = f"CREATE INDEX {quote(suggestion.name)} ON {target} ({columns})"
+    return replace(suggestion, sql=sql)
+
+
+def _analyze(query: Query) -> dict[_TableKey, _TableUsage]:
+    """Collect per-table index-relevant column usage of a query."""
+    tables = [query.from_table] if query.from_table is not None else []
+    tables.extend(join.table for join in query.joins)
+    default = tables[0] if len(tables) == 1 else None
+    # References to the query's CTEs are not tables that can be indexed
+    cte_names = {cte.name for cte in query.ctes}
+    usages: dict[_TableKey, _TableUsage] = {}
+
+    def usage_of(table: interfaces.ITable) -> _TableUsage:
+        key = (table.schema, table.name)
+        usage = usages.get(key)
+        if usage is None:
+            usage = usages[key] = _TableUsage()
+        return usage
+
+    def column(node: interfaces.ISQLNode) -> tuple[interfaces.ITable, str] | None:
+        if not isinstance(node, interfaces.IIdentifier) or node.name == "*":
+            return None
+        table = node.table or default
+        if table is None or (table.schema is None and table.name in cte_names):
+            return None
+        return table, node.name
+
+    def add_condition(condition: interfaces.ICondition) -> None:
+        if isinstance(condition, interfaces.ICompoundPredicate):
+            # OR branches cannot share one composite index
+            if condition.operator.upper() == "AND":
+                for child in condition.conditions:
+                    add_condition(child)
+        elif isinstance(condition, interfaces.IInList):
+            target = column(condition.operand)
+            if target is not None and not condition.negated:
+                usage_of(target[0]).equality[target[1]] = None
+        elif isinstance(condition, interfaces.IPredicate):
+            add_predicate(condition)
+
+    def add_predicate(predicate: interfaces.IPredicate) -> None:
+        operator = predicate.operator.upper()
+        left, right = column(predicate.left), column(predicate.right)
+        if left is not None and right is not None:
+            # Join keys: either side can be looked up through an index
+            if operator == "=":
+                for table, name in (left, right):
+                    usage_of(table).equality[name] = None
+            return
+        if left is None:
+            left, operator = right, _FLIPPED.get(operator, "")
+        if left is None:
+            return
+        table, name = left
+        if operator in _EQUALITY_OPERATORS:
+            usage_of(table).equality[name] = None
+        elif operator in _RANGE_OPERATORS:
+            usage_of(table).ranges[name] = None
+
+    for condition in query.where_conditions:
+        add_condition(condition)
+    for join in query.joins:
+        if join.on_condition is not None:
+            add_condition(join.on_condition)
+
+    group_by = _single_table([column(field) for field in query.group_by_fields])
+    if group_by is not None:
+        table, names = group_by
+        usage_of(table).group_by = names
+
+    sort_columns, directions = [], []
+    for sort_field, direction in query.order_by_fields:
+        sort_columns.append(column(sort_field))
+        directions.append(direction.strip().upper())
+    order_by = _single_table(sort_columns)
+    if order_by is not None:
+        table, names = order_by
+        usage_of(table).order_by = list(zip(names, directions))
+    return usages
+
+
+def _single_table(
+    columns: list[tuple[interfaces.ITable, str] | None],
+) -> tuple[interfaces.ITable, list[str]] | None:
+    """Get the table and names of columns that all belong to one table."""
+    if not columns or None in columns:
+        return None
+    tables = {(table.schema, table.name) for table, _ in columns}  # type: ignore[misc]
+    if len(tables) != 1:
+        return None
+    return columns[0][0], [name for _, name in columns]  # type: ignore[index,misc]
+
+
+def _sqlite_plan(connection: sqlite3.Connection, query: Query) -> QueryPlan:
+    """Get the SQLite plan of a query with every parameter bound to NULL."""
+    statement = get_compiler(Dialect.SQLITE).compile(query, True, ParamStyle.QMARK)
+    params = tuple(statement.params.get(name) for name in statement.param_names)
+    rows = connection.execute(explain_sql(statement.sql, Dialect.SQLITE), params)
+    return parse_sqlite_plan(statement.sql, rows.fetchall())
+
+
+def _scratch_copy(connection: sqlite3.Connection) -> sqlite3.Connection:
+    """Copy the schema and planner statistics into an in-memory database."""
+    scratch = sqlite3.connect(":memory:")
+    try:
+        schema = connection.execute(
+            "SELECT sql FROM sqlite_master "
+            "WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' ORDER BY rowid"
+        ).fetchall()
+        for (sql,) in schema:
+            scratch.execute(sql)
+        has_stats = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        if has_stats:
+            stats = connection.execute("SELECT * FROM sqlite_stat1").fetchall()
+            scratch.execute("ANALYZE")
+            scratch.execute("DELETE FROM sqlite_stat1")
+            scratch.executemany("INSERT INTO sqlite_stat1 VALUES (?, ?, ?)", stats)
+            # Reload the copied statistics into the planner
+            scratch.execute("ANALYZE sqlite_master")
+        scratch.commit()
+    except BaseException:
+        scratch.close()
+        raise
+    return scratch
+
+
+def _plan_cost(plans: tuple[QueryPlan, ...]) -> int:
+    """Count the plan steps an index can remove."""
+    return sum(len(plan.missing_indexes) + len(plan.temp_btrees) for plan in plans)
@@ -0,0 +1,271 @@
+"""Compile-time instrumentation through registered observers."""
+
+import hashlib
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+from smolql.domain import interfaces
+from smolql.domain.entities import _field_getter
+from smolql.domain.value_objects import Dialect
+from smolql.services.fingerprint import fingerprint
+
+__all__ = [
+    "CompileEvent",
+    "CompileObserver",
+    "CompileStats",
+    "CompileSummary",
+    "add_compile_observer",
+    "count_nodes",
+    "remove_compile_observer",
+]
+
+# Registered observers; mutated in place so importers can test it cheaply
+_observers: list["CompileObserver"] = []
+_observers_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CompileEvent:
+    """What one compilation, or one compile cache hit, cost.
+
+    ``clause_times`` maps WITH, SELECT, FROM, JOIN, WHERE, GROUP and ORDER to
+    the seconds spent emitting them, including nested subqueries.
+    ``cache_hit`` is None when no cache was involved; for a hit, ``duration``
+    is the time of the cache lookup and nothing was compiled.
+    """
+
+    node: interfaces.ISQLNode = field(repr=False)
+    dialect: Dialect
+    sql: str = field(repr=False)
+    duration: float
+    node_count: int
+    clause_times: dict[str, float] = field(default_factory=dict)
+    cache_hit: bool | None = None
+
+    @property
+    def sql_length(self) -> int:
+        """Get the length of the rendered SQL."""
+        return len(self.sql)
+
+    @property
+    def fingerprint(self) -> str:
+        """Get the value-independent fingerprint of the statement."""
+        try:
+            key = fingerprint(self.node)
+        except TypeError:
+            # Custom nodes that cannot be walked are grouped by their SQL
+            key = hashlib.blake2b(self.sql.encode(), digest_size=8).hexdigest()
+        return f"{self.dialect.value}:{key}"
+
+
+class CompileObserver(ABC):
+    """Receives an event for every compilation while registered.
+
+    Observers are called synchronously on the compiling thread, so they
+    should be quick and thread-safe.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def on_compile(self, event: CompileEvent) -> None:
+        """Handle one compile event."""
+        pass
+
+
+def add_compile_observer(observer: CompileObserver) -> None:
+    """Register an observer for every following compilation."""
+    with _observers_lock:
+        if observer not in _observers:
+            _observers[:] = [*_observers, observer]
+
+
+def remove_compile_observer(observer: CompileObserver) -> None:
+    """Unregister an observer; unknown observers are ignored."""
+    with _observers_lock:
+        _observers[:] = [o for o in _observers if o is not observer]
+
+
+def _publish(event: CompileEvent) -> None:
+    """Send an event to every registered observer."""
+    for observer in tuple(_observers):
+        observer.on_compile(event)
+
+
+def _publish_cache_hit(
+    node: interfaces.ISQLNode, dialect: Dialect, sql: str, started: float
+) -> None:
+    """Report a cache hit whose lookup began at ``started``."""
+    _publish(CompileEvent(node, dialect, sql, perf_counter() - started, 0, {}, True))
+
+
+def count_nodes(root: interfaces.ISQLNode) -> int:
+    """Count the SQL nodes of a tree with one iterative walk."""
+    count = 0
+    stack: list[Any] = [root]
+    while stack:
+        value = stack.pop()
+        if type(value) is tuple or type(value) is list:
+            stack.extend(value)
+            continue
+        if isinstance(value, interfaces.ISQLNode):
+            count += 1
+        getter = _field_getter(value)
+        if not isinstance(getter, int):
+            stack.extend(getter(value))
+    return count
+
+
+@dataclass(frozen=True)
+class CompileSummary:
+    """Rolling compile statistics of one statement fingerprint.
+
+    Durations and percentiles, in seconds, cover the most recent compiles
+    kept in the window; counters cover every event since the last reset.
+    ``sql`` is the statement as first compiled, values included.
+    """
+
+    fingerprint: str
+    sql: str = field(repr=False)
+    compiles: int
+    cache_hits: int
+    cache_misses: int
+    total_time: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    node_count: int
+    sql_length: int
+    clause_times: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Get the share of cache lookups that hit."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+
+class _Series:
+    """Samples and counters of one fingerprint."""
+
+    __slots__ = (
+        "cache_hits",
+        "cache_misses",
+        "clause_times",
+        "compiles",
+        "durations",
+        "node_count",
+        "sql",
+        "total_time",
+    )
+
+    def __init__(self, sql: str, window: int) -> None:
+        """Create an empty series with a bounded sample window."""
+        self.sql = sql
+        self.durations: deque[float] = deque(maxlen=window)
+        self.compiles = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.total_time = 0.0
+        self.node_count = 0
+        self.clause_times: dict[str, float] = {}
+
+
+class CompileStats(CompileObserver):
+    """Observer keeping rolling compile-time percentiles per fingerprint.
+
+    The last ``window`` compile durations of each fingerprint are kept, and
+    at most ``max_fingerprints`` fingerprints are tracked, dropping the
+    least recently seen. Clause times are summed over all compiles.
+    """
+
+    __slots__ = ("_lock", "_max_fingerprints", "_series", "_window")
+
+    def __init__(self, window: int = 1024, max_fingerprints: int = 1000) -> None:
+        """Create an empty aggregator."""
+        if window <= 0:
+            raise ValueError(f"window must be a positive integer, got {window}")
+        if max_fingerprints <= 0:
+            raise ValueError(
+                f"max_fingerprints must be a positive integer, got {max_fingerprints}"
+            )
+        self._window = window
+        self._max_fingerprints = max_fingerprints
+        self._series: OrderedDict[str, _Series] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_compile(self, event: CompileEvent) -> None:
+        """Record one compile event."""
+        fingerprint = event.fingerprint
+        with self._lock:
+            series = self._series.get(fingerprint)
+            if series is None:
+                series = self._series[fingerprint] = _Series(event.sql, self._window)
+                if len(self._series) > self._max_fingerprints:
+                    self._series.popitem(last=False)
+            else:
+                self._series.move_to_end(fingerprint)
+            if event.cache_hit:
+                series.cache_hits += 1
+                return
+            if event.cache_hit is False:
+                series.cache_misses += 1
+            series.durations.append(event.duration)
+            series.compiles += 1
+            series.total_time += event.duration
+            series.node_count = event.node_count
+            totals = series.clause_times
+            for clause, seconds in event.clause_times.items():
+                totals[clause] = totals.get(clause, 0.0) + seconds
+
+    def summary(self, fingerprint: str) -> CompileSummary | None:
+        """Get the statistics of one fingerprint, or None if unseen."""
+        with self._lock:
+            series = self._series.get(fingerprint)
+            return None if series is None else _summarize(fingerprint, series)
+
+    def summaries(self) -> list[CompileSummary]:
+        """Get the statistics of every fingerprint, most total time first."""
+        with self._lock:
+            result = [_summarize(key, series) for key, series in self._series.items()]
+        result.sort(key=lambda summary: -summary.total_time)
+        return result
+
+    def reset(self) -> None:
+        """Drop all recorded statistics."""
+        with self._lock:
+            self._series.clear()
+
+
+def _summarize(fingerprint: str, series: _Series) -> CompileSummary:
+    """Compute the summary of one series."""
+    durations = sorted(series.durations)
+    return CompileSummary(
+        fingerprint=fingerprint,
+        sql=series.sql,
+        compiles=series.compiles,
+        cache_hits=series.cache_hits,
+        cache_misses=series.cache_misses,
+        total_time=series.total_time,
+        p50=_percentile(durations, 0.50),
+        p95=_percentile(durations, 0.95),
+        p99=_percentile(durations, 0.99),
+        max=durations[-1] if durations else 0.0,
+        node_count=series.node_count,
+        sql_length=len(series.sql),
+        clause_times=dict(series.clause_times),
+    )
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Get the nearest-rank percentile of sorted samples."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(len(ordered) * fraction))
+    return ordered[rank - 1]
@@ -0,0 +1,246 @@
+"""Keyset (seek) pagination derived from a query's ORDER BY."""
+
+import base64
+import binascii
+import datetime
+import decimal
+import json
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import replace
+from typing import Any
+
+from smolql.domain import interfaces
+from smolql.domain.entities import (
+    Identifier,
+    Literal,
+    Operator,
+    Query,
+    _combine,
+    _structural_key,
+)
+from smolql.operators import tuple_
+
+__all__ = ["Keyset", "decode_cursor", "encode_cursor"]
+
+# Operators only valid after grouping, so a seek on them goes in HAVING
+_AGGREGATES = frozenset({"COUNT", "SUM", "AVG", "MIN", "MAX"})
+# Operators computed after WHERE and HAVING, so rows cannot be sought by them
+_WINDOW_FUNCTIONS = frozenset({"ROW_NUMBER", "RANK", "DENSE_RANK", "LAG", "LEAD"})
+
+
+class Keyset:
+    """Pages through a query by seeking past the last row seen.
+
+    The ORDER BY fields form the key, so they must identify rows uniquely
+    (end with a primary key) and must not be NULL. Instead of skipping
+    ``OFFSET`` rows, each page filters on ``key > last key``, which an index
+    on the key answers in the same time for every page. Grouped queries
+    may order by aggregates, which are then sought in HAVING.
+    """
+
+    __slots__ = ("_descending", "_fields", "_having", "_names", "_positions", "_query")
+
+    def __init__(self, query: Query) -> None:
+        """Create a paginator for an ordered query."""
+        if not query.order_by_fields:
+            raise ValueError("Keyset pagination requires an ORDER BY")
+        if query.offset_value is not None:
+            raise ValueError("Keyset pagination cannot be combined with OFFSET")
+
+        fields: list[Identifier | Operator] = []
+        descending = []
+        having = False
+        for field, direction in query.order_by_fields:
+            if not isinstance(field, (Identifier, Operator)):
+                raise TypeError(
+                    "Keyset pagination requires ORDER BY columns or expressions, "
+                    f"got {type(field).__name__}"
+                )
+            operators = _operator_names(field)
+            if not operators.isdisjoint(_WINDOW_FUNCTIONS):
+                raise TypeError("Keyset pagination cannot seek by window functions")
+            if not operators.isdisjoint(_AGGREGATES):
+                if not query.group_by_fields:
+                    raise TypeError(
+                        "Keyset pagination by aggregates requires a GROUP BY"
+                    )
+                having = True
+            normalized = direction.strip().upper()
+            if normalized not in ("ASC", "DESC"):
+                raise ValueError(
+                    f"Keyset pagination supports ASC and DESC only, got {direction!r}"
+                )
+            # Aliases belong to the select list, not to comparisons
+            if getattr(field, "alias", None):
+                field = replace(field, _alias=None)
+            fields.append(field)
+            descending.append(normalized == "DESC")
+
+        self._query = query
+        self._fields: tuple[Identifier | Operator, ...] = tuple(fields)
+        self._descending: tuple[bool, ...] = tuple(descending)
+        self._having = having
+        self._names = tuple(_key_name(field) for field, _ in query.order_by_fields)
+        self._positions = _select_positions(query, self._fields)
+
+    @property
+    def query(self) -> Query:
+        """Get the paginated query."""
+        return self._query
+
+    def page(self, size: int, after: str | None = None) -> Query:
+        """Get the query for ``size`` rows following the ``after`` cursor."""
+        if size <= 0:
+            raise ValueError(f"size must be a positive integer, got {size}")
+        query = self._query
+        if after is not None:
+            condition = self.seek(decode_cursor(after))
+            query = query.having(condition) if self._having else query.where(condition)
+        return query.limit(size)
+
+    def seek(self, values: Sequence[Any]) -> interfaces.ICondition:
+        """Get the condition selecting rows after the given key values."""
+        fields = self._fields
+        if len(values) != len(fields):
+            raise ValueError(f"Expected {len(fields)} key values, got {len(values)}")
+        if any(value is None for value in values):
+            raise ValueError("Keyset pagination keys cannot be NULL")
+        descending = self._descending
+
+        if len(fields) == 1:
+            field, literal = fields[0], Literal(_value=values[0])
+            return field < literal if descending[0] else field > literal
+        if all(descending) or not any(descending):
+            # One row-value comparison, which databases match to an index range
+            row = tuple_(*fields)
+            after = tuple_(*(Literal(_value=value) for value in values))
+            return row < after if descending[0] else row > after
+
+        # Mixed directions: (a > x) OR (a = x AND b < y) OR ...
+        # Each use gets its own literal, as cached statements bind by node
+        branches: list[interfaces.ICondition] = []
+        for i, field in enumerate(fields):
+            literal = Literal(_value=values[i])
+            step = field < literal if descending[i] else field > literal
+            ties: list[interfaces.ICondition] = [
+                fields[j] == Literal(_value=values[j]) for j in range(i)
+            ]
+            branches.append(_combine("AND", *ties, step) if ties else step)
+        return _combine("OR", *branches)
+
+    def cursor(self, row: Any) -> str:
+        """Get the cursor of a row, to fetch the rows that follow it.
+
+        ``row`` is a mapping (or ``sqlite3.Row``) keyed by column name or
+        alias, or a sequence in select-list order.
+        """
+        return encode_cursor(self.key(row))
+
+    def key(self, row: Any) -> tuple[Any, ...]:
+        """Get the key values of a row."""
+        if hasattr(row, "keys"):
+            names = self._names
+            if None in names:
+                raise ValueError("Mapping rows require named ORDER BY fields")
+            return tuple(row[name] for name in names)
+        positions = self._positions
+        if positions is None:
+            raise ValueError("ORDER BY fields are not all in the select list")
+        return tuple(row[position] for position in positions)
+
+
+def _operator_names(field: interfaces.ISQLNode) -> frozenset[str]:
+    """Get the names of the operators a key field is computed with."""
+    names = set()
+    stack = [field]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, interfaces.IOperator):
+            names.add(node.operator_name.upper())
+            stack.extend(node.arguments)
+    return frozenset(names)
+
+
+def _key_name(field: interfaces.ISQLNode) -> str | None:
+    """Get the result column name of an ORDER BY field."""
+    alias = getattr(field, "alias", None)
+    if alias:
+        return alias
+    if isinstance(field, interfaces.IIdentifier):
+        return field.name
+    return None
+
+
+def _select_positions(
+    query: Query, fields: tuple[interfaces.ISQLNode, ...]
+) -> tuple[int, ...] | None:
+    """Get the select-list position of each key field, if all are selected."""
+    selected: dict[Any, int] = {}
+    for index, field in enumerate(query.select_fields):
+        if getattr(field, "alias", None):
+            field = replace(field, _alias=None)  # type: ignore[type-var]
+        try:
+            selected.setdefault(_structural_key(field), index)
+        except TypeError:
+            continue
+    try:
+        positions = tuple(selected[_structural_key(field)] for field in fields)
+    except (KeyError, TypeError):
+        return None
+    return positions
+
+
+# Non-JSON types a cursor can carry: type, tag and text encoder, in order
+_ENCODERS: tuple[tuple[type, str, Callable[[Any], str]], ...] = (
+    (datetime.datetime, "datetime", datetime.datetime.isoformat),
+    (datetime.date, "date", datetime.date.isoformat),
+    (datetime.time, "time", datetime.time.isoformat),
+    (decimal.Decimal, "decimal", str),
+    (uuid.UUID, "uuid", str),
+    (bytes, "bytes", bytes.hex),
+)
+
+_DECODERS: dict[str, Callable[[str], Any]] = {
+    "datetime": datetime.datetime.fromisoformat,
+    "date": datetime.date.fromisoformat,
+    "time": datetime.time.fromisoformat,
+    "decimal": decimal.Decimal,
+    "uuid": uuid.UUID,
+    "bytes": bytes.fromhex,
+}
+
+
+def _encode_value(value: Any) -> dict[str, str]:
+    """Encode a value JSON cannot represent as a tagged object."""
+    for value_type, tag, encode in _ENCODERS:
+        if isinstance(value, value_type):
+            return {"$": tag, "v": encode(value)}
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def _decode_value(obj: dict[str, Any]) -> Any:
+    """Decode a tagged object back into its value."""
+    decoder = _DECODERS.get(obj.get("$"))  # type: ignore[arg-type]
+    if decoder is None or set(obj) != {"$", "v"}:
+        raise ValueError("Invalid cursor")
+    return decoder(obj["v"])
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode key values into an opaque, URL-safe cursor token."""
+    data = json.dumps(list(values), default=_encode_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str) -> tuple[Any, ...]:
+    """Decode a cursor token back into key values."""
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(data, object_hook=_decode_value)
+    except (binascii.Error, ValueError, TypeError, ArithmeticError) as error:
+        raise ValueError("Invalid cursor") from error
+    if type(values) is not list:
+        # A well-formed token holding something else is still a bad cursor
+        raise ValueError("Invalid cursor")
+    return tuple(values)
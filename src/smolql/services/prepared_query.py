@@ -0,0 +1,92 @@
+"""Prepared query templates with fast parameter binding."""
+
+from dataclasses import replace
+from typing import Any
+
+from smolql.domain import interfaces
+from smolql.domain.value_objects import CompiledStatement, Dialect, ParamStyle
+from smolql.services.compiler_service import compile_statement
+
+__all__ = ["PreparedQuery", "prepare_query"]
+
+
+class PreparedQuery:
+    """A compiled query that can be bound repeatedly without recompiling."""
+
+    __slots__ = ("_name_set", "_statement")
+
+    def __init__(self, statement: CompiledStatement) -> None:
+        """Create a template from a compiled statement."""
+        self._statement = statement
+        # Extracted literals are bound automatically, callers only pass the rest
+        self._name_set = frozenset(statement.param_names) - statement.params.keys()
+
+    @property
+    def sql(self) -> str:
+        """Get the compiled SQL."""
+        return self._statement.sql
+
+    @property
+    def param_names(self) -> tuple[str, ...]:
+        """Get placeholder names in the order they appear in the SQL."""
+        return self._statement.param_names
+
+    @property
+    def statement(self) -> CompiledStatement:
+        """Get the underlying compiled statement."""
+        return self._statement
+
+    @property
+    def paramstyle(self) -> ParamStyle:
+        """Get the parameter marker style of the SQL."""
+        return self._statement.paramstyle
+
+    def with_literals(self, values: dict[str, Any]) -> "PreparedQuery":
+        """Get the template with other values for its extracted literals."""
+        prepared = object.__new__(PreparedQuery)
+        prepared._statement = replace(self._statement, params=values)
+        prepared._name_set = self._name_set
+        return prepared
+
+    def bind(self, **params: Any) -> tuple[str, dict[str, Any] | tuple[Any, ...]]:
+        """Bind parameter values and return the SQL with driver-ready parameters.
+
+        Positional paramstyles get a tuple in slot order, named ones a dict.
+        """
+        if params.keys() != self._name_set:
+            self._raise_mismatch(params)
+        statement = self._statement
+        if statement.params:
+            params = {**statement.params, **params}
+        names = statement.param_names
+        if statement.is_positional:
+            return statement.sql, tuple([params[name] for name in names])
+        return statement.sql, {name: params[name] for name in names}
+
+    def _raise_mismatch(self, params: dict[str, Any]) -> None:
+        """Raise an error describing missing and unexpected parameters."""
+        names = self._statement.param_names
+        missing = [n for n in names if n in self._name_set and n not in params]
+        unexpected = sorted(name for name in params if name not in self._name_set)
+        problems = []
+        if missing:
+            problems.append(f"missing {', '.join(missing)}")
+        if unexpected:
+            problems.append(f"unexpected {', '.join(unexpected)}")
+        raise ValueError(f"Parameter mismatch: {'; '.join(problems)}")
+
+    def __repr__(self) -> str:
+        """Get a debug representation."""
+        return f"PreparedQuery(sql={self.sql!r}, param_names={self.param_names!r})"
+
+
+def prepare_query(
+    query: interfaces.IQuery,
+    dialect: Dialect,
+    extract_literals: bool = False,
+    paramstyle: ParamStyle = ParamStyle.NAMED,
+) -> PreparedQuery:
+    """Compile a query once into a reusable template."""
+    return PreparedQuery(
+        compile_statement(query, dialect, extract_literals, paramstyle)
+    )
@@ -0,0 +1,665 @@
+"""Reusable, dialect-parameterized SQL compiler."""
+
+import datetime
+import decimal
+import json
+import sqlite3
+import threading
+import uuid
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from operator import itemgetter
+from time import perf_counter
+from typing import Any
+
+from smolql.domain import entities, interfaces
+from smolql.domain.value_objects import (
+    CompiledStatement,
+    Dialect,
+    DialectSpec,
+    ParamStyle,
+)
+from smolql.services.instrumentation import (
+    CompileEvent,
+    _observers,
+    _publish,
+    count_nodes,
+)
+from smolql.services.sql_emitter import LiteralSource, SQLEmitter
+
+__all__ = ["DIALECT_SPECS", "SQLCompiler", "get_compiler"]
+
+# SQLITE_MAX_VARIABLE_NUMBER defaults to 999 before SQLite 3.32.0
+_SQLITE_MAX_PARAMETERS = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+# MATERIALIZED hints on CTEs are parsed since SQLite 3.35.0
+_SQLITE_CTE_MATERIALIZED = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+DIALECT_SPECS: dict[Dialect, DialectSpec] = {
+    Dialect.POSTGRESQL: DialectSpec(Dialect.POSTGRESQL, max_parameters=65535),
+    # SQLite doesn't support schemas in the same way
+    Dialect.SQLITE: DialectSpec(
+        Dialect.SQLITE,
+        supports_schema=False,
+        max_parameters=_SQLITE_MAX_PARAMETERS,
+        array_params=False,
+        cte_materialized=_SQLITE_CTE_MATERIALIZED,
+    ),
+}
+
+# Emits one node into the buffer of an SQLEmitter
+_Emitter = Callable[[SQLEmitter, Any], None]
+
+# Separator and remaining conditions of a compound predicate being emitted
+_GroupFrame = tuple[str, Iterator[interfaces.ICondition]]
+
+# Node interfaces and the emitter method rendering them, checked in order
+_EMITTER_NAMES: tuple[tuple[type, str], ...] = (
+    (interfaces.IIdentifier, "_emit_identifier"),
+    (interfaces.ILiteral, "_emit_literal"),
+    (interfaces.IPredicate, "_emit_predicate"),
+    (interfaces.ICompoundPredicate, "_emit_compound_predicate"),
+    (interfaces.IPlaceholder, "_emit_placeholder"),
+    (interfaces.IOperator, "_emit_operator"),
+    (interfaces.ITable, "_emit_table"),
+    (interfaces.IJoin, "_emit_join"),
+    (interfaces.IQuery, "_emit_query"),
+    (interfaces.IRawSQL, "_emit_raw_sql"),
+    (interfaces.IInsert, "_emit_insert"),
+    (interfaces.IInList, "_emit_in_list"),
+    (interfaces.ICommonTableExpression, "_emit_cte"),
+)
+
+# Values json_each() hands back unchanged, for IN lists bound as one parameter
+_JSON_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Operator -> its rendering with surrounding spaces, shared by every compiler
+_OPERATOR_TOKENS: dict[str, str] = {}
+_LOGICAL_TOKENS = frozenset({" AND ", " OR "})
+
+
+def _lap(clause_times: dict[str, float], clause: str, started: float) -> float:
+    """Add the time since ``started`` to a clause and get the current time."""
+    now = perf_counter()
+    clause_times[clause] = clause_times.get(clause, 0.0) + now - started
+    return now
+
+
+def _operator_token(operator: str) -> str:
+    """Get the spaced, upper-cased token for a binary operator."""
+    token = _OPERATOR_TOKENS.get(operator)
+    if token is None:
+        token = _OPERATOR_TOKENS[operator] = f" {operator.upper()} "
+    return token
+
+
+class SQLCompiler:
+    """Compiler for one dialect, shared by every compilation.
+
+    Node types are dispatched through a table built once per compiler, and
+    quoted table and column references are memoized in bounded LRU caches.
+    All per-call state lives on the ``SQLEmitter`` created for each compile,
+    so a single compiler can be used from any number of threads.
+    """
+
+    def __init__(self, spec: DialectSpec, name_cache_size: int = 4096) -> None:
+        """Create a compiler for a dialect specification."""
+        self._spec = spec
+        # Rendered columns of declared tables are cached on the node itself
+        default = DIALECT_SPECS.get(spec.dialect)
+        self._fragment_key: Any = spec.dialect if spec == default else spec
+        self._emitters: dict[type, _Emitter] = {
+            entities.Identifier: self._emit_identifier,
+            entities.Literal: self._emit_literal,
+            entities.Predicate: self._emit_predicate,
+            entities.CompoundPredicate: self._emit_compound_predicate,
+            entities.Placeholder: self._emit_placeholder,
+            entities.Operator: self._emit_operator,
+            entities.Table: self._emit_table,
+            entities.Join: self._emit_join,
+            entities.Query: self._emit_query,
+            entities.RawSQL: self._emit_raw_sql,
+            entities.Insert: self._emit_insert,
+            entities.InList: self._emit_in_list,
+            entities.CommonTableExpression: self._emit_cte,
+        }
+        self._table_sql = lru_cache(maxsize=name_cache_size)(self._render_table)
+        self._column_sql = lru_cache(maxsize=name_cache_size)(self._render_column)
+
+    @property
+    def spec(self) -> DialectSpec:
+        """Get the dialect specification."""
+        return self._spec
+
+    @property
+    def dialect(self) -> Dialect:
+        """Get the dialect."""
+        return self._spec.dialect
+
+    def compile(
+        self,
+        node: interfaces.ISQLNode,
+        extract_literals: bool = False,
+        paramstyle: ParamStyle = ParamStyle.NAMED,
+        cache_hit: bool | None = None,
+    ) -> CompiledStatement:
+        """Compile a node to SQL and collect its parameters.
+
+        ``cache_hit`` is reported to compile observers, which callers caching
+        the result set to False.
+        """
+        compiled, _ = self.compile_with_sources(
+            node, extract_literals, paramstyle, cache_hit
+        )
+        return compiled
+
+    def compile_with_sources(
+        self,
+        node: interfaces.ISQLNode,
+        extract_literals: bool = False,
+        paramstyle: ParamStyle = ParamStyle.NAMED,
+        cache_hit: bool | None = None,
+    ) -> tuple[CompiledStatement, dict[str, LiteralSource]]:
+        """Compile a node and tell where each extracted parameter came from."""
+        emitter = SQLEmitter(self, extract_literals, paramstyle)
+        if _observers:
+            sql = self._render_observed(emitter, node, cache_hit)
+        else:
+            sql = emitter.render(node)
+        compiled = CompiledStatement(
+            sql=sql,
+            param_names=emitter.placeholder_names,
+            params=emitter.literal_params,
+            paramstyle=paramstyle,
+            positions=emitter.positions,
+        )
+        return compiled, emitter.literal_sources
+
+    def normalized_sql(self, node: interfaces.ISQLNode) -> str:
+        """Render a node with every literal, placeholder and LIMIT/OFFSET as ``?``."""
+        emitter = SQLEmitter(self, True, ParamStyle.QMARK)
+        emitter.normalize = True
+        return emitter.render(node)
+
+    def to_sql(self, node: interfaces.ISQLNode, cache_hit: bool | None = None) -> str:
+        """Compile a node to an SQL string with named placeholders."""
+        if _observers:
+            return self._render_observed(SQLEmitter(self), node, cache_hit)
+        return SQLEmitter(self).render(node)
+
+    def _render_observed(
+        self, emitter: SQLEmitter, node: interfaces.ISQLNode, cache_hit: bool | None
+    ) -> str:
+        """Render a node with clause timings and report it to the observers."""
+        clause_times: dict[str, float] = {}
+        emitter.clause_times = clause_times
+        started = perf_counter()
+        sql = emitter.render(node)
+        duration = perf_counter() - started
+        _publish(
+            CompileEvent(
+                node=node,
+                dialect=self.dialect,
+                sql=sql,
+                duration=duration,
+                node_count=count_nodes(node),
+                clause_times=clause_times,
+                cache_hit=cache_hit,
+            )
+        )
+        return sql
+
+    def emit(self, emitter: SQLEmitter, node: interfaces.ISQLNode) -> None:
+        """Emit any node into the buffer of ``emitter``."""
+        method = self._emitters.get(type(node)) or self._resolve_emitter(type(node))
+        method(emitter, node)
+
+    def _resolve_emitter(self, node_type: type) -> _Emitter:
+        """Find and remember the emitter for a node type outside the table."""
+        for interface, name in _EMITTER_NAMES:
+            if issubclass(node_type, interface):
+                method = getattr(self, name)
+                break
+        else:
+            method = self._emit_foreign
+        self._emitters[node_type] = method
+        return method
+
+    def _emit_foreign(self, emitter: SQLEmitter, node: interfaces.ISQLNode) -> None:
+        """Emit a node of an unknown type through its own ``accept``."""
+        emitter.out.append(node.accept(emitter))
+
+    def _emit_separated(
+        self,
+        emitter: SQLEmitter,
+        nodes: tuple[interfaces.ISQLNode, ...],
+        separator: str,
+    ) -> None:
+        """Emit nodes with a separator between each pair."""
+        out = emitter.out
+        emitters = self._emitters
+        pending = ""
+        for node in nodes:
+            out.append(pending)
+            method = emitters.get(type(node)) or self._resolve_emitter(type(node))
+            method(emitter, node)
+            pending = separator
+
+    def _render_table(self, schema: str | None, name: str, alias: str | None) -> str:
+        """Render a table reference."""
+        quote = self._spec.quote
+        result = quote(name)
+        if schema and self._spec.supports_schema:
+            result = f"{quote(schema)}.{result}"
+        if alias:
+            result += f" AS {quote(alias)}"
+        return result
+
+    def _emit_table(self, emitter: SQLEmitter, table: interfaces.ITable) -> None:
+        """Emit a table reference."""
+        emitter.out.append(self._table_sql(table.schema, table.name, table.alias))
+
+    def _render_column(
+        self, table_ref: str | None, name: str, alias: str | None
+    ) -> str:
+        """Render a column reference."""
+        quote = self._spec.quote
+        result = quote(name)
+        if table_ref:
+            result = f"{quote(table_ref)}.{result}"
+        if alias:
+            result += f" AS {quote(alias)}"
+        return result
+
+    def _emit_identifier(
+        self, emitter: SQLEmitter, identifier: interfaces.IIdentifier
+    ) -> None:
+        """Emit an identifier, reusing the rendering cached on shared columns."""
+        # Columns of declared tables are shared, so render them once per dialect
+        fragments = getattr(identifier, "_fragments", None)
+        if fragments is not None:
+            sql = fragments.get(self._fragment_key)
+            if sql is None:
+                sql = fragments[self._fragment_key] = self._identifier_sql(identifier)
+            emitter.out.append(sql)
+        else:
+            emitter.out.append(self._identifier_sql(identifier))
+
+    def _identifier_sql(self, identifier: interfaces.IIdentifier) -> str:
+        """Get the rendering of an identifier from the column cache."""
+        table = identifier.table
+        table_ref = None if table is None else table.alias or table.name
+        return self._column_sql(table_ref, identifier.name, identifier.alias)
+
+    def _emit_predicate(
+        self, emitter: SQLEmitter, predicate: interfaces.IPredicate
+    ) -> None:
+        """Emit a binary predicate."""
+        out = emitter.out
+        emitters = self._emitters
+        operator = predicate.operator
+        token = _OPERATOR_TOKENS.get(operator) or _operator_token(operator)
+        left = predicate.left
+        right = predicate.right
+
+        # Handle logical operators
+        logical = token in _LOGICAL_TOKENS
+        if logical:
+            out.append("(")
+
+        # Predicates are the bulk of large filters, so dispatch inline
+        method = emitters.get(type(left)) or self._resolve_emitter(type(left))
+        method(emitter, left)
+        out.append(token)
+        method = emitters.get(type(right)) or self._resolve_emitter(type(right))
+        method(emitter, right)
+
+        if logical:
+            out.append(")")
+
+    def _emit_compound_predicate(
+        self, emitter: SQLEmitter, compound: interfaces.ICompoundPredicate
+    ) -> None:
+        """Emit an n-ary AND/OR predicate."""
+        # Nested groups use an explicit stack so huge generated filters never
+        # hit the recursion limit; each group gets a single pair of parentheses
+        out = emitter.out
+        out.append("(")
+        stack: list[_GroupFrame] = [
+            (_operator_token(compound.operator), iter(compound.conditions))
+        ]
+        needs_separator = False
+        while stack:
+            separator, conditions = stack[-1]
+            for condition in conditions:
+                if needs_separator:
+                    out.append(separator)
+                if isinstance(condition, interfaces.ICompoundPredicate):
+                    out.append("(")
+                    token = _operator_token(condition.operator)
+                    stack.append((token, iter(condition.conditions)))
+                    needs_separator = False
+                    break
+                self.emit(emitter, condition)
+                needs_separator = True
+            else:
+                stack.pop()
+                out.append(")")
+                needs_separator = True
+
+    def _emit_in_list(self, emitter: SQLEmitter, in_list: interfaces.IInList) -> None:
+        """Emit an IN / NOT IN condition.
+
+        Bound values take a single parameter, ``= ANY(...)`` over an array or
+        a JSON array expanded by ``json_each``, so the SQL never depends on
+        the number of values. Values JSON cannot carry, such as dates or
+        bytes, are bound one parameter each instead. Inline values render as
+        a plain IN list.
+        """
+        out = emitter.out
+        negated = in_list.negated
+        values = in_list.values
+        if isinstance(values, interfaces.IPlaceholder):
+            self.emit(emitter, in_list.operand)
+            # Markers are registered after the operand to keep positional order
+            marker = emitter.placeholder_marker(values.name)
+            self._emit_in_marker(emitter, marker, negated)
+            return
+
+        items = values.value
+        bound = emitter.extract_literals and (not values.inline or emitter.normalize)
+        if not bound and not items:
+            # An empty list matches nothing, and everything when negated
+            out.append("1 = 1" if negated else "1 = 0")
+            return
+
+        self.emit(emitter, in_list.operand)
+        if not bound:
+            out.append(" NOT IN (" if negated else " IN (")
+            out.append(", ".join(self._literal_sql(emitter, item) for item in items))
+            out.append(")")
+        elif self._spec.array_params:
+            marker = emitter.literal_marker(list(items), values, list)
+            self._emit_in_marker(emitter, marker, negated)
+        elif all(type(item) in _JSON_TYPES for item in items):
+            marker = emitter.literal_marker(_json_array(items), values, _json_array)
+            self._emit_in_marker(emitter, marker, negated)
+        elif emitter.normalize:
+            # Normalized SQL keeps one marker whatever the values are
+            self._emit_in_marker(emitter, emitter.literal_marker(items), negated)
+        else:
+            out.append(" NOT IN (" if negated else " IN (")
+            markers = [
+                emitter.literal_marker(item, values, itemgetter(index))
+                for index, item in enumerate(items)
+            ]
+            out.append(", ".join(markers))
+            out.append(")")
+
+    def _emit_in_marker(self, emitter: SQLEmitter, marker: str, negated: bool) -> None:
+        """Emit the test of an IN condition against one bound list parameter."""
+        out = emitter.out
+        if self._spec.array_params:
+            out.append(f" <> ALL({marker})" if negated else f" = ANY({marker})")
+        else:
+            out.append(" NOT IN" if negated else " IN")
+            out.append(f" (SELECT value FROM json_each({marker}))")
+
+    def _emit_placeholder(
+        self, emitter: SQLEmitter, placeholder: interfaces.IPlaceholder
+    ) -> None:
+        """Emit a parameter marker for a placeholder."""
+        emitter.out.append(emitter.placeholder_marker(placeholder.name))
+
+    def _emit_query(self, emitter: SQLEmitter, query: interfaces.IQuery) -> None:
+        """Emit a SELECT statement."""
+        out = emitter.out
+        emit = self.emit
+        # Only set while observers are registered
+        clause_times = emitter.clause_times
+        started = perf_counter() if clause_times is not None else 0.0
+
+        # WITH clause
+        if query.ctes:
+            self._emit_with(emitter, query.ctes)
+            if clause_times is not None:
+                started = _lap(clause_times, "WITH", started)
+
+        # SELECT clause
+        if query.select_fields:
+            out.append("SELECT ")
+            self._emit_separated(emitter, query.select_fields, ", ")
+        else:
+            out.append("SELECT *")
+        if clause_times is not None:
+            started = _lap(clause_times, "SELECT", started)
+
+        # FROM clause
+        if query.from_table:
+            out.append(" FROM ")
+            emit(emitter, query.from_table)
+            if clause_times is not None:
+                started = _lap(clause_times, "FROM", started)
+
+        # JOIN clauses
+        if query.joins:
+            for join in query.joins:
+                out.append(" ")
+                emit(emitter, join)
+            if clause_times is not None:
+                started = _lap(clause_times, "JOIN", started)
+
+        # WHERE clause
+        if query.where_conditions:
+            out.append(" WHERE ")
+            self._emit_separated(emitter, query.where_conditions, " AND ")
+            if clause_times is not None:
+                started = _lap(clause_times, "WHERE", started)
+
+        # GROUP BY clause
+        if query.group_by_fields:
+            out.append(" GROUP BY ")
+            for index, field in enumerate(query.group_by_fields):
+                if index:
+                    out.append(", ")
+                self._emit_sort_key(emitter, field)
+
+        # HAVING clause
+        if query.having_conditions:
+            out.append(" HAVING ")
+            self._emit_separated(emitter, query.having_conditions, " AND ")
+        if clause_times is not None and (
+            query.group_by_fields or query.having_conditions
+        ):
+            started = _lap(clause_times, "GROUP", started)
+
+        # ORDER BY clause
+        if query.order_by_fields:
+            out.append(" ORDER BY ")
+            for index, (field, direction) in enumerate(query.order_by_fields):
+                if index:
+                    out.append(", ")
+                self._emit_sort_key(emitter, field)
+                out.append(f" {direction}")
+            if clause_times is not None:
+                _lap(clause_times, "ORDER", started)
+
+        # LIMIT clause
+        if query.limit_value is not None:
+            limit = "?" if emitter.normalize else query.limit_value
+            out.append(f" LIMIT {limit}")
+
+        # OFFSET clause
+        if query.offset_value is not None:
+            offset = "?" if emitter.normalize else query.offset_value
+            out.append(f" OFFSET {offset}")
+
+    def _emit_sort_key(self, emitter: SQLEmitter, field: interfaces.ISQLNode) -> None:
+        """Emit a GROUP BY or ORDER BY item, keeping column positions inline."""
+        # Bound as a parameter, a position would group or sort by a constant
+        if isinstance(field, interfaces.ILiteral) and type(field.value) is int:
+            emitter.out.append(str(field.value))
+        else:
+            self.emit(emitter, field)
+
+    def _emit_with(
+        self,
+        emitter: SQLEmitter,
+        ctes: tuple[interfaces.ICommonTableExpression, ...],
+    ) -> None:
+        """Emit a WITH clause, RECURSIVE if any of its CTEs is."""
+        recursive = any(cte.step is not None for cte in ctes)
+        emitter.out.append("WITH RECURSIVE " if recursive else "WITH ")
+        self._emit_separated(emitter, ctes, ", ")
+        emitter.out.append(" ")
+
+    def _emit_cte(
+        self, emitter: SQLEmitter, cte: interfaces.ICommonTableExpression
+    ) -> None:
+        """Emit one common table expression of a WITH clause."""
+        out = emitter.out
+        quote = self._spec.quote
+        out.append(quote(cte.name))
+        if cte.column_names:
+            out.append(f" ({', '.join(quote(name) for name in cte.column_names)})")
+        materialized = cte.materialized
+        if materialized is None or not self._spec.cte_materialized:
+            out.append(" AS (")
+        elif materialized:
+            out.append(" AS MATERIALIZED (")
+        else:
+            out.append(" AS NOT MATERIALIZED (")
+        self.emit(emitter, cte.query)
+        if cte.step is not None:
+            out.append(" UNION ALL ")
+            self.emit(emitter, cte.step)
+        out.append(")")
+
+    def _emit_insert(self, emitter: SQLEmitter, insert: interfaces.IInsert) -> None:
+        """Emit an INSERT ... VALUES statement."""
+        if not insert.rows:
+            raise ValueError("INSERT requires at least one row of values")
+        out = emitter.out
+        table = insert.table
+        out.append("INSERT INTO ")
+        out.append(self._table_sql(table.schema, table.name, None))
+        if insert.column_names:
+            quote = self._spec.quote
+            out.append(f" ({', '.join(quote(name) for name in insert.column_names)})")
+        out.append(" VALUES ")
+        pending = ""
+        for row in insert.rows:
+            out.append(pending)
+            out.append("(")
+            self._emit_separated(emitter, row, ", ")
+            out.append(")")
+            pending = ", "
+
+        on_conflict = insert.on_conflict
+        if on_conflict is not None:
+            self._emit_on_conflict(emitter, on_conflict)
+
+    def _emit_on_conflict(
+        self, emitter: SQLEmitter, on_conflict: interfaces.IOnConflict
+    ) -> None:
+        """Emit an ON CONFLICT clause."""
+        out = emitter.out
+        quote = self._spec.quote
+        out.append(" ON CONFLICT")
+        if on_conflict.target:
+            out.append(f" ({', '.join(quote(name) for name in on_conflict.target)})")
+        updates = on_conflict.updates
+        if updates is None:
+            out.append(" DO NOTHING")
+            return
+
+        out.append(" DO UPDATE SET ")
+        pending = ""
+        for name, value in updates:
+            out.append(pending)
+            out.append(f"{quote(name)} = ")
+            self.emit(emitter, value)
+            pending = ", "
+        if on_conflict.where is not None:
+            out.append(" WHERE ")
+            self.emit(emitter, on_conflict.where)
+
+    def _emit_join(self, emitter: SQLEmitter, join: interfaces.IJoin) -> None:
+        """Emit a JOIN clause."""
+        out = emitter.out
+        out.append(f"{join.join_type.upper()} JOIN ")
+        self.emit(emitter, join.table)
+        if join.on_condition:
+            out.append(" ON ")
+            self.emit(emitter, join.on_condition)
+
+    def _emit_operator(
+        self, emitter: SQLEmitter, operator: interfaces.IOperator
+    ) -> None:
+        """Emit an algebraic operator or a function call."""
+        out = emitter.out
+        op_name = operator.operator_name.upper()
+
+        # Handle algebraic operators
+        if op_name in ("+", "-", "*", "/", "%"):
+            out.append("(")
+            separator = f" {emitter.escape_percent(op_name)} "
+            self._emit_separated(emitter, operator.arguments, separator)
+            out.append(")")
+        # Handle function operators
+        else:
+            out.append(f"{op_name}(")
+            self._emit_separated(emitter, operator.arguments, ", ")
+            out.append(")")
+
+        if operator.alias:
+            out.append(f" AS {self._spec.quote(operator.alias)}")
+
+    def _emit_raw_sql(self, emitter: SQLEmitter, raw_sql: interfaces.IRawSQL) -> None:
+        """Emit a raw SQL fragment."""
+        emitter.out.append(emitter.escape_percent(raw_sql.sql))
+
+    def _emit_literal(self, emitter: SQLEmitter, literal: interfaces.ILiteral) -> None:
+        """Emit a literal inline or as an extracted parameter."""
+        value = literal.value
+        if emitter.extract_literals and (not literal.inline or emitter.normalize):
+            emitter.out.append(emitter.literal_marker(value, literal))
+        else:
+            emitter.out.append(self._literal_sql(emitter, value))
+
+    def _literal_sql(self, emitter: SQLEmitter, value: Any) -> str:
+        """Render a literal value inline."""
+        if isinstance(value, str):
+            escaped = emitter.escape_percent(value.replace("'", "''"))
+            return f"'{escaped}'"
+        elif value is None:
+            return "NULL"
+        elif isinstance(value, (bool, int, float, decimal.Decimal)):
+            return str(value)
+        elif isinstance(value, datetime.datetime):
+            return f"'{value.isoformat(' ')}'"
+        elif isinstance(value, (datetime.date, datetime.time, uuid.UUID)):
+            return f"'{value}'"
+        elif isinstance(value, (bytes, bytearray)):
+            return f"X'{value.hex()}'"
+        raise TypeError(f"Cannot render a {type(value).__name__} value inline")
+
+
+def _json_array(items: Any) -> str:
+    """Encode IN list values as the JSON array read by ``json_each``."""
+    return json.dumps(list(items))
+
+
+_compilers: dict[Dialect, SQLCompiler] = {}
+_compilers_lock = threading.Lock()
+
+
+def get_compiler(dialect: Dialect) -> SQLCompiler:
+    """Get the shared compiler for a dialect."""
+    compiler = _compilers.get(dialect)
+    if compiler is None:
+        spec = DIALECT_SPECS.get(dialect)
+        if spec is None:
+            raise ValueError(f"Unsupported dialect: {dialect}")
+        with _compilers_lock:
+            compiler = _compilers.setdefault(dialect, SQLCompiler(spec))
+    return compiler
@@ -0,0 +1,182 @@
+"""Per-compilation state shared by the dialect visitors."""
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from smolql.domain import interfaces
+from smolql.domain.value_objects import ParamStyle
+
+if TYPE_CHECKING:
+    from smolql.services.sql_compiler import SQLCompiler
+
+__all__ = ["SQLEmitter"]
+
+# Literal node a generated parameter was extracted from, and the conversion
+# applied to its value, if any
+LiteralSource = tuple[interfaces.ILiteral | None, Callable[[Any], Any] | None]
+
+
+class SQLEmitter(interfaces.IVisitor):
+    """Output buffer and parameters of one compilation.
+
+    The rendering rules live on a shared, stateless ``SQLCompiler``; this
+    object only carries what changes from one compile to the next. It is
+    also the visitor handed to nodes the compiler does not know, so their
+    ``accept`` methods can render children through the public API.
+    """
+
+    def __init__(
+        self,
+        compiler: "SQLCompiler",
+        extract_literals: bool = False,
+        paramstyle: ParamStyle = ParamStyle.NAMED,
+    ) -> None:
+        """Create the state of one compilation."""
+        self.compiler = compiler
+        self.extract_literals = extract_literals
+        self.paramstyle = paramstyle
+        self.out: list[str] = []
+        self._placeholder_names: dict[str, None] = {}
+        self._positions: dict[str, int] = {}
+        self._qmark_slots: list[str] = []
+        self._literal_params: dict[str, Any] = {}
+        self._literal_sources: dict[str, LiteralSource] = {}
+        # Seconds per clause, collected only while compile observers exist
+        self.clause_times: dict[str, float] | None = None
+        # Render every value, even inline ones, as a marker
+        self.normalize = False
+
+    @property
+    def placeholder_names(self) -> tuple[str, ...]:
+        """Get parameter names in driver order, one per parameter slot."""
+        if self.paramstyle is ParamStyle.QMARK:
+            return tuple(self._qmark_slots)
+        return tuple(self._placeholder_names)
+
+    @property
+    def positions(self) -> dict[str, int]:
+        """Get the 1-based slot of each parameter name, in order."""
+        return self._positions
+
+    @property
+    def literal_params(self) -> dict[str, Any]:
+        """Get the values of literals extracted into parameters."""
+        return self._literal_params
+
+    @property
+    def literal_sources(self) -> dict[str, LiteralSource]:
+        """Get the literal node and value conversion of each extracted parameter."""
+        return self._literal_sources
+
+    def render(self, node: interfaces.ISQLNode) -> str:
+        """Emit a node into a fresh buffer and join it into a string."""
+        saved = self.out
+        out: list[str] = []
+        self.out = out
+        try:
+            self.compiler.emit(self, node)
+        finally:
+            self.out = saved
+        return "".join(out)
+
+    def parameter_marker(self, name: str) -> str:
+        """Register a parameter and render its marker in the target paramstyle."""
+        position = self._positions.get(name)
+        if position is None:
+            position = len(self._positions) + 1
+            self._positions[name] = position
+            self._placeholder_names[name] = None
+
+        style = self.paramstyle
+        if style is ParamStyle.NAMED:
+            return f":{name}"
+        elif style is ParamStyle.NUMERIC:
+            return f"${position}"
+        elif style is ParamStyle.PYFORMAT:
+            return f"%({name})s"
+        else:
+            # Positional markers cannot be reused, every occurrence is a slot
+            self._qmark_slots.append(name)
+            return "?"
+
+    def placeholder_marker(self, name: str) -> str:
+        """Render the marker of a user placeholder."""
+        if name in self._literal_params:
+            raise ValueError(f"Placeholder name '{name}' is reserved for literals")
+        return self.parameter_marker(name)
+
+    def literal_marker(
+        self,
+        value: Any,
+        source: interfaces.ILiteral | None = None,
+        convert: Callable[[Any], Any] | None = None,
+    ) -> str:
+        """Extract a literal into a generated parameter and render its marker.
+
+        ``source`` is the literal node the value comes from, and ``convert``
+        turns the node's value into the bound one when they differ.
+        """
+        name = f"_p{len(self._literal_params) + 1}"
+        if name in self._placeholder_names:
+            raise ValueError(f"Placeholder name '{name}' is reserved for literals")
+        self._literal_params[name] = value
+        self._literal_sources[name] = (source, convert)
+        return self.parameter_marker(name)
+
+    def escape_percent(self, sql: str) -> str:
+        """Escape literal percent signs when rendering pyformat SQL."""
+        if self.paramstyle is ParamStyle.PYFORMAT:
+            return sql.replace("%", "%%")
+        return sql
+
+    def visit_table(self, table: interfaces.ITable) -> str:
+        """Visit a table node."""
+        return self.render(table)
+
+    def visit_identifier(self, identifier: interfaces.IIdentifier) -> str:
+        """Visit an identifier node."""
+        return self.render(identifier)
+
+    def visit_predicate(self, predicate: interfaces.IPredicate) -> str:
+        """Visit a predicate node."""
+        return self.render(predicate)
+
+    def visit_compound_predicate(self, compound: interfaces.ICompoundPredicate) -> str:
+        """Visit an n-ary AND/OR predicate node."""
+        return self.render(compound)
+
+    def visit_placeholder(self, placeholder: interfaces.IPlaceholder) -> str:
+        """Visit a placeholder node."""
+        return self.render(placeholder)
+
+    def visit_query(self, query: interfaces.IQuery) -> str:
+        """Visit a query node."""
+        return self.render(query)
+
+    def visit_join(self, join: interfaces.IJoin) -> str:
+        """Visit a join node."""
+        return self.render(join)
+
+    def visit_operator(self, operator: interfaces.IOperator) -> str:
+        """Visit an operator node."""
+        return self.render(operator)
+
+    def visit_raw_sql(self, raw_sql: interfaces.IRawSQL) -> str:
+        """Visit a raw SQL node."""
+        return self.render(raw_sql)
+
+    def visit_literal(self, literal: interfaces.ILiteral) -> str:
+        """Visit a literal value node."""
+        return self.render(literal)
+
+    def visit_insert(self, insert: interfaces.IInsert) -> str:
+        """Visit an INSERT statement node."""
+        return self.render(insert)
+
+    def visit_in_list(self, in_list: interfaces.IInList) -> str:
+        """Visit an IN list condition node."""
+        return self.render(in_list)
+
+    def visit_cte(self, cte: interfaces.ICommonTableExpression) -> str:
+        """Visit a common table expression node."""
+        return self.render(cte)
@@ -0,0 +1,294 @@
+"""Pooled, tuned SQLite connections."""
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from smolql.domain.value_objects import Dialect
+from smolql.services.executor import Executor
+
+__all__ = ["PoolMetrics", "SQLitePool", "SQLitePragmas"]
+
+
+@dataclass(frozen=True)
+class SQLitePragmas:
+    """PRAGMAs applied to every pooled connection, None to keep the default."""
+
+    journal_mode: str | None = "wal"
+    # Bytes of the database file memory-mapped for reads
+    mmap_size: int | None = 256 * 1024 * 1024
+    # Pages when positive, KiB when negative
+    cache_size: int | None = -64 * 1024
+    synchronous: str | None = "normal"
+    temp_store: str | None = "memory"
+    busy_timeout: int | None = 5000
+
+    def statements(self) -> list[str]:
+        """Get the PRAGMA statements to run on a new connection."""
+        settings = (
+            ("journal_mode", self.journal_mode),
+            ("mmap_size", self.mmap_size),
+            ("cache_size", self.cache_size),
+            ("synchronous", self.synchronous),
+            ("temp_store", self.temp_store),
+            ("busy_timeout", self.busy_timeout),
+        )
+        result = []
+        for name, value in settings:
+            if value is None:
+                continue
+            if not isinstance(value, int) and not str(value).isidentifier():
+                raise ValueError(f"Invalid value for PRAGMA {name}: {value!r}")
+            result.append(f"PRAGMA {name} = {value}")
+        return result
+
+
+@dataclass(frozen=True)
+class PoolMetrics:
+    """Snapshot of connection pool statistics."""
+
+    max_size: int
+    size: int
+    in_use: int
+    peak_in_use: int
+    checkouts: int
+    timeouts: int
+    discarded: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def utilization(self) -> float:
+        """Get the share of the maximum size currently checked out."""
+        return self.in_use / self.max_size
+
+    @property
+    def mean_wait(self) -> float:
+        """Get the mean checkout wait in seconds."""
+        return self.total_wait / self.checkouts if self.checkouts else 0.0
+
+
+class _Pooled:
+    """A pooled connection and its bookkeeping."""
+
+    __slots__ = ("connection", "executor", "released_at")
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """Wrap a new connection."""
+        self.connection = connection
+        self.executor: Executor | None = None
+        self.released_at = time.monotonic()
+
+
+class SQLitePool:
+    """Bounded pool of SQLite connections tuned with PRAGMAs.
+
+    Connections are opened lazily up to ``max_size``; further checkouts wait
+    up to ``timeout`` seconds for one to be returned. A connection idle for
+    longer than ``health_check_interval`` seconds is checked with ``SELECT 1``
+    before reuse and replaced if it fails. Each pooled connection keeps its
+    own ``Executor``, so its compiled statements stay cached between
+    checkouts. Connections are opened with ``check_same_thread=False`` and
+    may be used by one thread at a time.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        max_size: int = 8,
+        pragmas: SQLitePragmas | None = None,
+        timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+        **connect_kwargs: Any,
+    ) -> None:
+        """Create a pool for a database file (or URI with ``uri=True``)."""
+        if max_size <= 0:
+            raise ValueError(f"max_size must be a positive integer, got {max_size}")
+        self._database = database
+        self._max_size = max_size
+        self._pragmas = (pragmas or SQLitePragmas()).statements()
+        self._timeout = timeout
+        self._health_check_interval = health_check_interval
+        self._connect_kwargs = {**connect_kwargs, "check_same_thread": False}
+        self._idle: list[_Pooled] = []
+        self._checked_out: dict[int, _Pooled] = {}
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._peak_in_use = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._discarded = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def max_size(self) -> int:
+        """Get the most connections the pool opens."""
+        return self._max_size
+
+    def acquire(self, timeout: float | None = None) -> sqlite3.Connection:
+        """Check out a connection, waiting up to ``timeout`` seconds."""
+        return self._checkout(self._timeout if timeout is None else timeout).connection
+
+    def release(self, connection: sqlite3.Connection) -> None:
+        """Return a checked-out connection to the pool."""
+        with self._cond:
+            pooled = self._checked_out.pop(id(connection), None)
+        if pooled is None:
+            raise ValueError("Connection is not checked out from this pool")
+        if connection.in_transaction:
+            try:
+                connection.rollback()
+            except BaseException:
+                # The connection's state is unknown: drop it and free its slot
+                with self._cond:
+                    self._size -= 1
+                    self._discarded += 1
+                    self._cond.notify()
+                connection.close()
+                raise
+        pooled.released_at = time.monotonic()
+        with self._cond:
+            if self._closed:
+                self._size -= 1
+                connection.close()
+            else:
+                self._idle.append(pooled)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, timeout: float | None = None) -> Iterator[sqlite3.Connection]:
+        """Check out a connection for the duration of a ``with`` block."""
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    @contextmanager
+    def executor(self, timeout: float | None = None) -> Iterator[Executor]:
+        """Check out a connection and get its statement-caching executor."""
+        pooled = self._checkout(self._timeout if timeout is None else timeout)
+        try:
+            if pooled.executor is None:
+                pooled.executor = Executor(pooled.connection, Dialect.SQLITE)
+            yield pooled.executor
+        finally:
+            self.release(pooled.connection)
+
+    def thread_connection(self) -> sqlite3.Connection:
+        """Get the connection pinned to the calling thread, checking one out.
+
+        The connection stays checked out until ``release_thread_connection``
+        is called from the same thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self.acquire()
+        return connection
+
+    def release_thread_connection(self) -> None:
+        """Return the calling thread's pinned connection, if any."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            self._local.connection = None
+            self.release(connection)
+
+    def metrics(self) -> PoolMetrics:
+        """Get a snapshot of the pool statistics."""
+        with self._cond:
+            return PoolMetrics(
+                max_size=self._max_size,
+                size=self._size,
+                in_use=len(self._checked_out),
+                peak_in_use=self._peak_in_use,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                discarded=self._discarded,
+                total_wait=self._total_wait,
+                max_wait=self._max_wait,
+            )
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones close when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            pooled.connection.close()
+
+    def _checkout(self, timeout: float) -> _Pooled:
+        """Take an idle connection or open one, waiting while at max size."""
+        start = time.monotonic()
+        deadline = start + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Pool is closed")
+                if self._idle:
+                    pooled: _Pooled | None = self._idle.pop()
+                    break
+                if self._size < self._max_size:
+                    # Reserve the slot, the connection is opened unlocked
+                    self._size += 1
+                    pooled = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise TimeoutError(
+                        f"No connection available within {timeout} seconds"
+                    )
+                self._cond.wait(remaining)
+
+        try:
+            if pooled is not None and not self._is_healthy(pooled):
+                pooled.connection.close()
+                with self._cond:
+                    self._discarded += 1
+                pooled = None
+            if pooled is None:
+                pooled = _Pooled(self._open())
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        waited = time.monotonic() - start
+        with self._cond:
+            self._checked_out[id(pooled.connection)] = pooled
+            self._peak_in_use = max(self._peak_in_use, len(self._checked_out))
+            self._checkouts += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        return pooled
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a connection and apply the PRAGMAs."""
+        connection = sqlite3.connect(self._database, **self._connect_kwargs)
+        try:
+            for pragma in self._pragmas:
+                connection.execute(pragma)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    def _is_healthy(self, pooled: _Pooled) -> bool:
+        """Check a connection that sat idle past the health check interval."""
+        if time.monotonic() - pooled.released_at < self._health_check_interval:
+            return True
+        try:
+            pooled.connection.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
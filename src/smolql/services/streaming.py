@@ -0,0 +1,72 @@
+"""Constant-memory result streaming."""
+
+import itertools
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from smolql.domain.value_objects import Dialect
+from smolql.services.sql_compiler import get_compiler
+
+__all__ = ["ServerCursor", "iter_batches", "server_cursor"]
+
+_cursor_ids = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class ServerCursor:
+    """The statements driving a PostgreSQL server-side cursor.
+
+    ``declare_sql`` carries the parameters of the wrapped query. The cursor
+    lives until ``close_sql`` or the end of the transaction, so it must be
+    used inside one.
+    """
+
+    name: str
+    query_sql: str
+    batch_size: int = 1000
+
+    @property
+    def quoted_name(self) -> str:
+        """Get the quoted cursor name."""
+        return get_compiler(Dialect.POSTGRESQL).spec.quote(self.name)
+
+    @property
+    def declare_sql(self) -> str:
+        """Get the DECLARE statement opening the cursor."""
+        return f"DECLARE {self.quoted_name} NO SCROLL CURSOR FOR {self.query_sql}"
+
+    @property
+    def fetch_sql(self) -> str:
+        """Get the FETCH statement reading the next batch."""
+        return f"FETCH FORWARD {self.batch_size} FROM {self.quoted_name}"
+
+    @property
+    def close_sql(self) -> str:
+        """Get the CLOSE statement releasing the cursor."""
+        return f"CLOSE {self.quoted_name}"
+
+
+def server_cursor(
+    query_sql: str, batch_size: int = 1000, name: str | None = None
+) -> ServerCursor:
+    """Create a server-side cursor over compiled SQL, with a unique name."""
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+    if name is None:
+        name = f"smolql_cursor_{next(_cursor_ids)}"
+    return ServerCursor(name, query_sql, batch_size)
+
+
+def iter_batches(cursor: Any, batch_size: int = 1000) -> Iterator[list[Any]]:
+    """Yield the remaining rows of an executed DB-API cursor in batches."""
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+    fetchmany = cursor.fetchmany
+    while True:
+        rows = fetchmany(batch_size)
+        if not rows:
+            return
+        yield rows
+        if len(rows) < batch_size:
+            return
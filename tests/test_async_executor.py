@@ -0,0 +1,164 @@
+"""Test the asyncio execution API."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Hashable
+from typing import Any
+
+import pytest
+
+from smolql import (
+    Dialect,
+    ParamStyle,
+    ThreadedDriver,
+    aexecute,
+    astream,
+    async_executor,
+    placeholder,
+    query,
+    raw,
+    table,
+)
+from smolql.domain import interfaces
+from smolql.services.prepared_query import PreparedQuery
+
+
+def connect() -> sqlite3.Connection:
+    """Open an in-memory database with a slow() function tracking concurrency."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(250)])
+    conn.create_function("slow", 1, _slow)
+    return conn
+
+
+_running = 0
+_peak = 0
+_counter_lock = threading.Lock()
+
+
+def _slow(seconds: float) -> int:
+    """Sleep in the database call and record how many run at once."""
+    global _running, _peak
+    with _counter_lock:
+        _running += 1
+        _peak = max(_peak, _running)
+    time.sleep(seconds)
+    with _counter_lock:
+        _running -= 1
+    return 1
+
+
+def test_aexecute_and_astream() -> None:
+    """Test fetching and streaming rows from a coroutine."""
+    t = table("t")
+
+    async def main() -> tuple[list, list, int]:
+        db = async_executor(connect, Dialect.SQLITE)
+        q = query().select(t.id).from_(t).where(t.id < placeholder("n"))
+        rows = await aexecute(db, q, {"n": 3})
+        streamed = [row async for row in astream(db, q, {"n": 200}, batch_size=64)]
+        await aexecute(db, q, {"n": 5})
+        await db.driver.close()
+        return rows, streamed, db.cache_info().hits
+
+    rows, streamed, hits = asyncio.run(main())
+    assert rows == [(0,), (1,), (2,)]
+    assert streamed == [(i,) for i in range(200)]
+    assert hits == 2
+
+
+def test_cache_misses_compile_off_loop() -> None:
+    """Test that a cache miss compiles on a worker thread."""
+    t = table("t")
+    threads = []
+
+    async def main() -> list[list[Any]]:
+        db = async_executor(connect, Dialect.SQLITE)
+        compile_ = db._cache.compile
+
+        def recording_compile(
+            statement: interfaces.ISQLNode, key: Hashable | None
+        ) -> PreparedQuery:
+            threads.append(threading.get_ident())
+            return compile_(statement, key)
+
+        db._cache.compile = recording_compile  # type: ignore[method-assign]
+        # Literal values are rebound into the statement compiled first
+        rows = [
+            await db.execute(query().select(t.id).from_(t).where(t.id == n))
+            for n in (5, 7, 9)
+        ]
+        await db.driver.close()
+        return rows
+
+    assert asyncio.run(main()) == [[(5,)], [(7,)], [(9,)]]
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+
+
+def test_concurrency_is_bounded_and_loop_stays_free() -> None:
+    """Test the worker limit while the event loop keeps running."""
+    global _peak
+    _peak = 0
+    slow = query().select(raw("slow(0.05)"))
+
+    async def main() -> int:
+        db = async_executor(connect, Dialect.SQLITE, max_workers=2)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticking = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(db.execute(slow) for _ in range(6)))
+        ticking.cancel()
+        await db.driver.close()
+        assert results == [[(1,)]] * 6
+        return ticks
+
+    ticks = asyncio.run(main())
+    assert _peak == 2
+    assert ticks >= 10
+
+
+def test_timeout_interrupts_and_frees_the_slot() -> None:
+    """Test that a timed-out call is interrupted and its slot recovered."""
+    t = table("t")
+
+    async def main() -> list:
+        db = async_executor(connect, Dialect.SQLITE, max_workers=1, timeout=0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await db.execute(query().select(raw("slow(0.3)")))
+        # The only slot comes back once the abandoned call finishes
+        return await db.execute(query().select(t.id).from_(t).limit(1), timeout=5)
+
+    assert asyncio.run(main()) == [(0,)]
+
+
+def test_connections_open_off_loop() -> None:
+    """Test that drivers built in a coroutine connect on worker threads."""
+    threads = []
+
+    def recording_connect() -> sqlite3.Connection:
+        threads.append(threading.get_ident())
+        return connect()
+
+    async def main() -> list[Any]:
+        lazy = ThreadedDriver(recording_connect, paramstyle=ParamStyle.QMARK)
+        assert threads == []
+        opened = await ThreadedDriver.open(recording_connect)
+        assert opened.paramstyle is ParamStyle.QMARK
+        rows = await lazy.fetchall("SELECT COUNT(*) FROM t", ())
+        await lazy.close()
+        await opened.close()
+        return rows
+
+    assert asyncio.run(main()) == [(250,)]
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
@@ -0,0 +1,74 @@
+"""Test the benchmark suite helpers."""
+
+from pathlib import Path
+
+from smolql.bench.__main__ import main
+from smolql.bench.suite import (
+    BenchCase,
+    BenchResult,
+    default_cases,
+    find_regressions,
+    load_baseline,
+    run_case,
+    save_baseline,
+)
+
+
+def test_default_cases_cover_shapes_and_dialects() -> None:
+    """Test that every shape is built and compiled for both dialects."""
+    names = {case.name for case in default_cases()}
+
+    for shape in ("simple", "wide", "deep", "join"):
+        assert f"build.{shape}" in names
+        assert f"compile.{shape}.postgresql" in names
+        assert f"compile_cached.{shape}.sqlite" in names
+        assert f"build_compile.{shape}.postgresql" in names
+        assert f"build_compile_cached.{shape}.sqlite" in names
+    assert "bind.simple" in names
+
+
+def test_run_case_reports_throughput() -> None:
+    """Test that a case reports positive ops/sec and allocations."""
+    result = run_case(BenchCase("list", lambda: [0] * 1000), min_time=0.001)
+
+    assert result.name == "list"
+    assert result.ops_per_sec > 0
+    assert result.peak_bytes >= 8000
+
+
+def test_baseline_round_trip(tmp_path: Path) -> None:
+    """Test that saved results load back unchanged."""
+    results = [BenchResult("a", 100.0, 10), BenchResult("b", 50.5, 0)]
+    path = tmp_path / "bench.json"
+
+    save_baseline(results, path)
+
+    assert load_baseline(path) == {"a": results[0], "b": results[1]}
+
+
+def test_regressions_respect_tolerance() -> None:
+    """Test that only slowdowns beyond the tolerance are flagged."""
+    baseline = {
+        "fast": BenchResult("fast", 1000.0, 0),
+        "slow": BenchResult("slow", 1000.0, 0),
+    }
+    results = [
+        BenchResult("fast", 950.0, 0),
+        BenchResult("slow", 700.0, 0),
+        BenchResult("new", 1.0, 0),
+    ]
+
+    regressions = find_regressions(results, baseline, tolerance=0.1)
+
+    assert [r.name for r in regressions] == ["slow"]
+    assert round(regressions[0].slowdown, 2) == 0.3
+
+
+def test_main_flags_regressions(tmp_path: Path) -> None:
+    """Test that the entry point fails against a much faster baseline."""
+    path = tmp_path / "bench.json"
+    save_baseline([BenchResult("bind.simple", 1e12, 0)], path)
+
+    status = main(["-k", "bind", "--min-time", "0.001", "--compare", str(path)])
+
+    assert status == 1
@@ -0,0 +1,127 @@
+"""Test the compiled SQL cache."""
+
+import pytest
+
+from smolql import CompileCache, Dialect, compile_cache, compile_to_sql, query, table
+from smolql.domain.entities import Literal
+
+
+def test_repeat_compile_hits_cache() -> None:
+    """Test that compiling the same structure twice is a cache hit."""
+    cache = CompileCache(maxsize=8)
+    users = table("users", alias="u")
+
+    first = cache.compile(query().select(users.id).from_(users), Dialect.POSTGRESQL)
+    second = cache.compile(query().select(users.id).from_(users), Dialect.POSTGRESQL)
+
+    assert first == second == 'SELECT "u"."id" FROM "users" AS "u"'
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+
+def test_derived_query_is_not_stale() -> None:
+    """Test that a query derived after caching compiles to the new SQL."""
+    cache = CompileCache()
+    users = table("users")
+    q = query().select("*").from_(users)
+
+    before = cache.compile(q, Dialect.SQLITE)
+    after = cache.compile(q.where(users.age > 18), Dialect.SQLITE)
+
+    assert "WHERE" not in before
+    assert 'WHERE "users"."age" > 18' in after
+    assert cache.compile(q, Dialect.SQLITE) == before
+    assert cache.misses == 2
+
+
+def test_dialect_is_part_of_key() -> None:
+    """Test that dialects are cached separately."""
+    cache = CompileCache()
+    q = query().select("*").from_(table("users", schema="public"))
+
+    pg_sql = cache.compile(q, Dialect.POSTGRESQL)
+    sqlite_sql = cache.compile(q, Dialect.SQLITE)
+
+    assert '"public"."users"' in pg_sql
+    assert "public" not in sqlite_sql
+    assert cache.hits == 0
+
+
+def test_literal_types_are_distinguished() -> None:
+    """Test that values which hash equal but render differently stay distinct."""
+    cache = CompileCache()
+    users = table("users")
+
+    as_bool = cache.compile(
+        query().select("*").from_(users).where(users.active == True),  # noqa: E712
+        Dialect.SQLITE,
+    )
+    as_int = cache.compile(
+        query().select("*").from_(users).where(users.active == 1), Dialect.SQLITE
+    )
+
+    assert as_bool.endswith("= True")
+    assert as_int.endswith("= 1")
+
+
+def test_lru_eviction() -> None:
+    """Test that the least recently used entry is evicted first."""
+    cache = CompileCache(maxsize=2)
+    users = table("users")
+    q1 = query().select(users.a).from_(users)
+    q2 = query().select(users.b).from_(users)
+    q3 = query().select(users.c).from_(users)
+
+    cache.compile(q1, Dialect.SQLITE)
+    cache.compile(q2, Dialect.SQLITE)
+    cache.compile(q1, Dialect.SQLITE)
+    cache.compile(q3, Dialect.SQLITE)
+
+    assert cache.evictions == 1
+    assert len(cache) == 2
+    cache.compile(q1, Dialect.SQLITE)
+    assert cache.hits == 2
+
+
+def test_unhashable_values_bypass_cache() -> None:
+    """Test that unkeyable queries still compile."""
+    cache = CompileCache()
+    users = table("users")
+    tags = Literal(_value=bytearray(b"ab"))
+    q = query().select("*").from_(users).where(users.tags == tags)
+
+    assert cache.compile(q, Dialect.SQLITE).endswith("= X'6162'")
+    assert len(cache) == 0
+    assert cache.misses == 1
+
+
+def test_clear_and_info() -> None:
+    """Test clearing the cache resets entries and counters."""
+    cache = CompileCache()
+    cache.compile(query().select("*").from_(table("users")), Dialect.SQLITE)
+    cache.compile(query().select("*").from_(table("users")), Dialect.SQLITE)
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    cache.clear()
+    assert cache.info().currsize == 0
+    assert cache.hits == cache.misses == 0
+
+
+def test_invalid_maxsize() -> None:
+    """Test that the cache must have room for at least one entry."""
+    with pytest.raises(ValueError):
+        CompileCache(maxsize=0)
+
+
+def test_compile_to_sql_uses_default_cache() -> None:
+    """Test that compile_to_sql goes through the shared cache."""
+    compile_cache().clear()
+    q = query().select("*").from_(table("users"))
+
+    compile_to_sql(q, Dialect.POSTGRESQL)
+    compile_to_sql(q, Dialect.POSTGRESQL)
+
+    assert compile_cache().hits == 1
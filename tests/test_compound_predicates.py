@@ -0,0 +1,110 @@
+"""Test n-ary AND/OR predicates."""
+
+import sqlite3
+from functools import reduce
+
+import pytest
+
+from smolql import Dialect, and_, compile_to_sql, or_, query, table
+from smolql.domain.entities import CompoundPredicate, Predicate
+from smolql.services.compiler_service import compile_query
+
+
+def test_and_chain_is_flattened() -> None:
+    """Test that chained & builds one n-ary node."""
+    users = table("users")
+    condition = (users.a == 1) & (users.b == 2) & (users.c == 3)
+
+    assert isinstance(condition, CompoundPredicate)
+    assert condition.operator == "AND"
+    assert len(condition.conditions) == 3
+
+
+def test_mixed_operators_keep_grouping() -> None:
+    """Test that AND and OR groups nest with one pair of parentheses each."""
+    users = table("users", alias="u")
+    active = users.active == True  # noqa: E712
+    condition = (users.age > 18) & active | (users.role == 1)
+
+    sql = compile_to_sql(
+        query().select("*").from_(users).where(condition), Dialect.SQLITE
+    )
+
+    assert sql.endswith(
+        'WHERE (("u"."age" > 18 AND "u"."active" = True) OR "u"."role" = 1)'
+    )
+
+
+def test_large_folded_filter_compiles() -> None:
+    """Test that folding thousands of conditions neither recurses nor nests."""
+    facts = table("facts")
+    conditions: list[Predicate | CompoundPredicate] = [
+        facts.col(f"c{i}") == i for i in range(5000)
+    ]
+    condition = reduce(lambda acc, item: acc & item, conditions)
+
+    sql = compile_to_sql(
+        query().select("*").from_(facts).where(condition), Dialect.POSTGRESQL
+    )
+
+    assert sql.count("(") == 1
+    assert sql.count(" AND ") == 4999
+
+
+def test_deeply_alternating_groups_compile() -> None:
+    """Test that deeply nested AND/OR groups compile without recursion."""
+    facts = table("facts")
+    condition = facts.a == 0
+    for i in range(3000):
+        condition = (condition | (facts.b == i)) & (facts.c == i)
+
+    sql = compile_to_sql(
+        query().select("*").from_(facts).where(condition), Dialect.SQLITE
+    )
+
+    assert sql.count("(") == sql.count(")") == 6000
+
+
+def test_and_or_helpers() -> None:
+    """Test the n-ary and_/or_ helpers."""
+    users = table("users")
+    condition = or_(users.a == 1, and_(users.b == 2, users.c == 3), users.d == 4)
+
+    sql = compile_query(condition, Dialect.SQLITE)  # type: ignore[arg-type]
+
+    assert sql == (
+        '("users"."a" = 1 OR ("users"."b" = 2 AND "users"."c" = 3) OR "users"."d" = 4)'
+    )
+
+
+def test_helpers_require_conditions() -> None:
+    """Test that and_() and or_() reject an empty list of conditions."""
+    with pytest.raises(ValueError, match="at least one condition"):
+        and_()
+    with pytest.raises(ValueError, match="at least one condition"):
+        or_()
+
+
+def test_binary_logical_predicates_still_compile() -> None:
+    """Test that explicitly built binary AND predicates keep working."""
+    users = table("users")
+    condition = Predicate(_operator="AND", _left=users.a == 1, _right=users.b == 2)
+
+    assert compile_query(condition, Dialect.SQLITE) == (  # type: ignore[arg-type]
+        '("users"."a" = 1 AND "users"."b" = 2)'
+    )
+
+
+def test_flattened_filter_runs_on_sqlite() -> None:
+    """Test that a large flattened OR filter executes."""
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE t (id INTEGER)")
+    connection.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(10)])
+    t = table("t")
+    conditions: list[Predicate | CompoundPredicate] = [t.id == i for i in (0, 3, 6, 9)]
+    condition = reduce(lambda acc, item: acc | item, conditions)
+    q = query().select(t.id).from_(t).where(condition).order_by(t.id)
+
+    sql = compile_to_sql(q, Dialect.SQLITE)
+
+    assert [row[0] for row in connection.execute(sql)] == [0, 3, 6, 9]
@@ -0,0 +1,108 @@
+"""Test PostgreSQL COPY statements and payload encoding."""
+
+import csv
+import datetime
+import io
+from decimal import Decimal
+
+import pytest
+
+from smolql import CopyFormat, copy_from, table
+
+
+def test_copy_statement() -> None:
+    """Test that COPY targets the schema-qualified table and columns."""
+    events = table("events", schema="raw", alias="e")
+
+    assert copy_from(events, ["id", events.payload]).sql == (
+        'COPY "raw"."events" ("id", "payload") FROM STDIN'
+    )
+    assert copy_from(events, format=CopyFormat.CSV).sql == (
+        'COPY "raw"."events" FROM STDIN WITH (FORMAT csv)'
+    )
+    assert copy_from(events, ["id"], delimiter="|").sql == (
+        'COPY "raw"."events" ("id") FROM STDIN WITH (FORMAT text, DELIMITER \'|\')'
+    )
+
+
+def test_quote_delimiter_is_escaped() -> None:
+    """Test that a quote delimiter cannot break out of its string literal."""
+    load = copy_from(table("t"), ["a", "b"], delimiter="'")
+
+    assert load.sql.endswith("WITH (FORMAT text, DELIMITER '''')")
+    assert b"".join(load.encode([("x'y", 1)])) == b"x\\'y'1\n"
+    with pytest.raises(ValueError, match="delimiter"):
+        copy_from(table("t"), delimiter="é")
+
+
+def test_copy_defaults_to_declared_columns() -> None:
+    """Test that declared table columns are used when none are given."""
+    users = table("users", columns=["id", "name"])
+
+    assert copy_from(users).sql == 'COPY "users" ("id", "name") FROM STDIN'
+
+
+def test_text_format_escaping() -> None:
+    """Test the documented text format escapes and NULL marker."""
+    load = copy_from(table("t"), ["a", "b", "c", "d"])
+    rows = [
+        ("tab\there", "line\nbreak\r", "back\\slash", None),
+        (True, b"\x00\xff", datetime.date(2024, 1, 31), Decimal("1.50")),
+    ]
+
+    payload = b"".join(load.encode(rows)).decode()
+
+    assert payload == (
+        "tab\\there\tline\\nbreak\\r\tback\\\\slash\t\\N\n"
+        "t\t\\\\x00ff\t2024-01-31\t1.50\n"
+    )
+
+
+def test_csv_format_round_trip() -> None:
+    """Test that CSV output parses back and keeps NULL and '' apart."""
+    load = copy_from(table("t"), ["a", "b", "c"], format=CopyFormat.CSV)
+    rows = [('say "hi"', "a,b", None), ("", "multi\nline", "\\.")]
+
+    payload = b"".join(load.encode(rows)).decode()
+
+    assert payload.splitlines()[0] == '"say ""hi""","a,b",'
+    assert '""' in payload.splitlines()[1]
+    parsed = list(csv.reader(io.StringIO(payload)))
+    assert parsed == [['say "hi"', "a,b", ""], ["", "multi\nline", "\\."]]
+
+
+def test_chunks_end_on_row_boundaries() -> None:
+    """Test that payload chunks are bounded and split between rows."""
+    load = copy_from(table("t"), ["id", "name"])
+    rows = ((i, f"name-{i}") for i in range(10_000))
+
+    chunks = list(load.encode(rows, chunk_size=4096))
+
+    assert len(chunks) > 20
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    assert all(len(chunk) < 4096 + 64 for chunk in chunks)
+    lines = b"".join(chunks).decode().splitlines()
+    assert lines[0] == "0\tname-0"
+    assert len(lines) == 10_000
+
+
+def test_mapping_rows_and_invalid_options() -> None:
+    """Test mapping rows and rejected delimiters and chunk sizes."""
+    load = copy_from(table("t"), ["a", "b"])
+    assert b"".join(load.encode([{"b": 2, "a": 1}])) == b"1\t2\n"
+
+    for delimiter in ("\\", "\r", "\n", ".", "a", "z", "0", "9", "::", ""):
+        with pytest.raises(ValueError, match="delimiter"):
+            copy_from(table("t"), delimiter=delimiter)
+    with pytest.raises(ValueError, match="delimiter"):
+        copy_from(table("t"), format=CopyFormat.CSV, delimiter='"')
+    # Only the text format reserves letters, digits and backslashes
+    assert (
+        "DELIMITER 'x'"
+        in copy_from(table("t"), format=CopyFormat.CSV, delimiter="x").sql
+    )
+    assert "DELIMITER '\"'" in copy_from(table("t"), delimiter='"').sql
+    with pytest.raises(ValueError, match="chunk_size"):
+        list(load.encode([], chunk_size=0))
+    with pytest.raises(ValueError, match="explicit COPY columns"):
+        list(copy_from(table("t")).encode([{"a": 1}]))
@@ -0,0 +1,182 @@
+"""Test common table expressions, recursive CTEs and MATERIALIZED hints."""
+
+import sqlite3
+
+import pytest
+
+from smolql import (
+    Dialect,
+    DialectSpec,
+    ParamStyle,
+    SQLCompiler,
+    advise_indexes,
+    compile_to_sql,
+    count,
+    executor,
+    fingerprint,
+    literal,
+    placeholder,
+    prepare,
+    query,
+    table,
+)
+
+
+def make_db() -> sqlite3.Connection:
+    """Create a database holding a small category hierarchy."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE categories (id INTEGER PRIMARY KEY, parent_id INT, name TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO categories VALUES (?, ?, ?)",
+        [
+            (1, None, "root"),
+            (2, 1, "books"),
+            (3, 2, "fiction"),
+            (4, 3, "crime"),
+            (5, 1, "music"),
+            (6, None, "other"),
+        ],
+    )
+    return conn
+
+
+def test_with_clause() -> None:
+    """Test a named subquery with declared columns in both dialects."""
+    orders, totals = table("orders"), table("totals")
+    per_user = (
+        query()
+        .select(orders.user_id, count())
+        .from_(orders)
+        .where(orders.status == placeholder("status"))
+        .group_by(orders.user_id)
+    )
+    q = (
+        query()
+        .with_("totals", per_user, columns=["user_id", "n"])
+        .select(totals.user_id)
+        .from_(totals)
+        .where(totals.n > placeholder("min"))
+    )
+
+    assert compile_to_sql(q, Dialect.POSTGRESQL) == (
+        'WITH "totals" ("user_id", "n") AS (SELECT "orders"."user_id", COUNT(*) '
+        'FROM "orders" WHERE "orders"."status" = :status '
+        'GROUP BY "orders"."user_id") '
+        'SELECT "totals"."user_id" FROM "totals" WHERE "totals"."n" > :min'
+    )
+    # Parameters of the WITH clause come first in positional order
+    prepared = prepare(q, Dialect.SQLITE, paramstyle=ParamStyle.QMARK)
+    assert prepared.param_names == ("status", "min")
+
+
+def test_materialized_hints() -> None:
+    """Test MATERIALIZED / NOT MATERIALIZED and dialects without them."""
+    users, active = table("users"), table("active")
+    body = query().select(users.id).from_(users).where(users.active == 1)
+    q = (
+        query()
+        .with_("active", body, materialized=True)
+        .with_("inlined", body, materialized=False)
+        .select(active.id)
+        .from_(active)
+    )
+
+    sql = compile_to_sql(q, Dialect.POSTGRESQL)
+    assert sql.startswith('WITH "active" AS MATERIALIZED (SELECT')
+    assert ', "inlined" AS NOT MATERIALIZED (SELECT' in sql
+
+    legacy = SQLCompiler(DialectSpec(Dialect.SQLITE, cte_materialized=False))
+    legacy_sql = legacy.to_sql(q)
+    assert 'WITH "active" AS (SELECT' in legacy_sql
+    assert "MATERIALIZED" not in legacy_sql
+
+
+def test_recursive_walk_runs_as_one_statement() -> None:
+    """Test a category subtree walked level by level in a single query."""
+    categories, tree = table("categories"), table("tree")
+    anchor = (
+        query()
+        .select(categories.id, categories.col("name"), literal(0))
+        .from_(categories)
+        .where(categories.id == placeholder("root"))
+    )
+    step = (
+        query()
+        .select(categories.id, categories.col("name"), tree.depth + 1)
+        .from_(categories)
+        .join(tree, categories.parent_id == tree.id)
+    )
+    q = (
+        query()
+        .with_recursive("tree", anchor, step, columns=["id", "name", "depth"])
+        .select(tree.col("name"), tree.depth)
+        .from_(tree)
+        .order_by(tree.depth)
+        .order_by(tree.col("name"))
+    )
+
+    sql = compile_to_sql(q, Dialect.SQLITE)
+    assert sql.startswith('WITH RECURSIVE "tree" ("id", "name", "depth") AS (SELECT')
+    assert ' UNION ALL SELECT "categories"."id"' in sql
+
+    rows = executor(make_db(), Dialect.SQLITE).fetchall(q, {"root": 2})
+    assert rows == [("books", 0), ("fiction", 1), ("crime", 2)]
+
+
+def test_recursive_keyword_is_rendered_once() -> None:
+    """Test that one recursive CTE makes the whole WITH clause recursive."""
+    numbers, base = table("numbers"), table("base")
+    step = query().select(numbers.n + 1).from_(numbers).where(numbers.n < 5)
+    q = (
+        query()
+        .with_("base", query().select(literal(1)), columns=["n"])
+        .with_recursive("numbers", query().select(base.n).from_(base), step)
+        .select(count())
+        .from_(numbers)
+    )
+
+    sql = compile_to_sql(q, Dialect.POSTGRESQL)
+    assert sql.startswith('WITH RECURSIVE "base" ("n") AS (SELECT 1), "numbers" AS (')
+    assert sql.count("RECURSIVE") == 1
+
+
+def test_duplicate_names_are_rejected() -> None:
+    """Test that a CTE name can only be used once per WITH clause."""
+    users = table("users")
+    q = query().with_("u", query().select(users.id).from_(users))
+    with pytest.raises(ValueError, match="'u' already exists"):
+        q.with_("u", query().select(users.email).from_(users))
+    # The original query is unchanged
+    assert len(q.ctes) == 1
+
+
+def test_hints_are_part_of_the_structure() -> None:
+    """Test that caches and fingerprints tell CTE variants apart."""
+    users, active = table("users"), table("active")
+    body = query().select(users.id).from_(users)
+    base = query().select(active.id).from_(active)
+    plain = base.with_("active", body)
+    hinted = base.with_("active", body, materialized=True)
+
+    assert plain != hinted
+    assert fingerprint(plain) != fingerprint(hinted) != fingerprint(base)
+    assert compile_to_sql(plain, Dialect.POSTGRESQL) != compile_to_sql(
+        hinted, Dialect.POSTGRESQL
+    )
+
+
+def test_index_advisor_skips_cte_references() -> None:
+    """Test that columns of CTEs are never suggested for indexing."""
+    users, recent = table("users"), table("recent")
+    body = query().select(users.id).from_(users).where(users.created > 10)
+    q = (
+        query()
+        .with_("recent", body)
+        .select(recent.id)
+        .from_(recent)
+        .where(recent.id == 1)
+    )
+
+    assert advise_indexes([q], Dialect.SQLITE) == []
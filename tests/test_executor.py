@@ -0,0 +1,128 @@
+"""Test executing statements on DB-API connections."""
+
+import sqlite3
+
+import pytest
+
+from smolql import (
+    Dialect,
+    ParamStyle,
+    executor,
+    insert,
+    placeholder,
+    query,
+    table,
+)
+from smolql.services.executor import driver_paramstyle
+
+
+def make_db() -> sqlite3.Connection:
+    """Create an in-memory database with a users table."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT, age INT)")
+    conn.executemany(
+        "INSERT INTO users VALUES (?, ?, ?)",
+        [(1, "a@x", 30), (2, "b@x", 17), (3, "c@x", 45)],
+    )
+    return conn
+
+
+def test_paramstyle_is_inferred_from_driver() -> None:
+    """Test that sqlite3 connections get qmark markers."""
+    conn = make_db()
+    assert driver_paramstyle(conn) is ParamStyle.QMARK
+    assert executor(conn, Dialect.SQLITE).paramstyle is ParamStyle.QMARK
+    with pytest.raises(ValueError, match="paramstyle"):
+        driver_paramstyle(object())
+
+
+def test_fetch_with_placeholders_and_literals() -> None:
+    """Test binding placeholders together with extracted literals."""
+    db = executor(make_db(), Dialect.SQLITE)
+    users = table("users")
+    q = (
+        query()
+        .select(users.email)
+        .from_(users)
+        .where(users.age > 18, users.id != placeholder("skip"))
+        .order_by(users.id)
+    )
+
+    assert db.fetchall(q, {"skip": 3}) == [("a@x",)]
+    by_id = query().select(users.age).from_(users).where(users.id == 2)
+    assert db.fetchone(by_id) == (17,)
+    with pytest.raises(ValueError, match="missing skip"):
+        db.fetchall(q)
+
+
+def test_statements_are_cached_per_executor() -> None:
+    """Test that shapes differing only in literal values share a statement."""
+    conn = make_db()
+    db = executor(conn, Dialect.SQLITE)
+    users = table("users")
+
+    emails = []
+    for user_id in (1, 2, 3, 4, 2):
+        q = query().select(users.email).from_(users).where(users.id == user_id)
+        emails.append(db.fetchall(q))
+
+    assert emails == [[("a@x",)], [("b@x",)], [("c@x",)], [], [("b@x",)]]
+    info = db.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (4, 1, 1)
+    assert executor(conn, Dialect.SQLITE).cache_info().currsize == 0
+
+    db.clear_cache()
+    assert db.cache_info().currsize == 0
+
+
+def test_cached_statements_rebind_in_lists() -> None:
+    """Test that IN lists of other values but the same length reuse a statement."""
+    db = executor(make_db(), Dialect.SQLITE)
+    users = table("users")
+
+    def emails(ids: list[int]) -> list[tuple[str]]:
+        q = query().select(users.email).from_(users).where(users.id.in_(ids))
+        return db.fetchall(q.order_by(users.id))
+
+    assert emails([1, 3]) == [("a@x",), ("c@x",)]
+    assert emails([2, 9]) == [("b@x",)]
+    assert emails([3, 1]) == [("a@x",), ("c@x",)]
+    assert emails([3, 2, 1]) == [("a@x",), ("b@x",), ("c@x",)]
+    info = db.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+    # Positions in ORDER BY are part of the statement, not bound values
+    by_first = query().select(users.email, users.age).from_(users)
+    assert db.fetchall(by_first.order_by(2))[0] == ("b@x", 17)
+    assert db.fetchall(by_first.order_by(1))[0] == ("a@x", 30)
+
+
+def test_executemany_compiles_once() -> None:
+    """Test batch binds through a single executemany call."""
+    conn = make_db()
+    db = executor(conn, Dialect.SQLITE, paramstyle=ParamStyle.NAMED)
+    stmt = (
+        insert(table("users"))
+        .columns("id", "email", "age")
+        .values(placeholder("id"), placeholder("email"), 20)
+    )
+
+    rows = ({"id": i, "email": f"{i}@x"} for i in range(10, 15))
+    cursor = db.executemany(stmt, rows)
+    assert cursor.rowcount == 5
+    assert db.cache_info().misses == 1
+    assert conn.execute("SELECT count(*) FROM users WHERE age = 20").fetchone() == (5,)
+
+
+def test_insert_many_runs_chunks() -> None:
+    """Test executing a chunked bulk insert."""
+    conn = make_db()
+    db = executor(conn, Dialect.SQLITE)
+    bulk = (
+        insert(table("users"))
+        .columns("id", "email", "age")
+        .values_many((i, f"{i}@x", i) for i in range(100, 350))
+    )
+
+    assert db.insert_many(bulk, max_rows=100) == 250
+    assert conn.execute("SELECT count(*) FROM users").fetchone() == (253,)
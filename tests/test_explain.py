@@ -0,0 +1,116 @@
+"""Test EXPLAIN rendering and plan parsing."""
+
+import json
+import sqlite3
+
+import pytest
+
+from smolql import Dialect, count, explain, placeholder, query, table
+from smolql.services.explain import parse_postgresql_plan
+
+
+def make_db() -> sqlite3.Connection:
+    """Create a database with an indexed users table."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT, age INT)")
+    conn.execute("CREATE INDEX users_email ON users (email)")
+    return conn
+
+
+def test_explain_statements() -> None:
+    """Test the EXPLAIN SQL rendered for each dialect."""
+    users = table("users")
+    q = query().select(users.id).from_(users).where(users.age > 18)
+
+    pg = explain(q, Dialect.POSTGRESQL, analyze=True)
+    assert pg.sql == (
+        'EXPLAIN (FORMAT JSON, ANALYZE, BUFFERS) SELECT "users"."id" '
+        'FROM "users" WHERE "users"."age" > :_p1'
+    )
+    assert pg.params == {"_p1": 18}
+    assert explain(q, Dialect.SQLITE).sql.startswith("EXPLAIN QUERY PLAN SELECT")
+    with pytest.raises(ValueError, match="ANALYZE"):
+        explain(q, Dialect.SQLITE, analyze=True)
+
+
+def test_sqlite_full_scan_and_temp_btree() -> None:
+    """Test flags for unindexed filters and grouping."""
+    users = table("users")
+    q = (
+        query()
+        .select(users.age, count())
+        .from_(users)
+        .where(users.age > 18)
+        .group_by(users.age)
+    )
+
+    plan = explain(q, Dialect.SQLITE, connection=make_db())
+    scan, temp = plan.nodes
+    assert (scan.operation, scan.table, scan.index) == ("SCAN", "users", None)
+    assert plan.full_scans == plan.missing_indexes == [scan]
+    assert plan.temp_btrees == [temp]
+    assert temp.temp_btree == "GROUP BY"
+    assert not plan.uses_index
+
+
+def test_sqlite_index_search() -> None:
+    """Test that index lookups are recognized, with bound placeholders."""
+    users = table("users")
+    q = query().select(users.id).from_(users).where(users.email == placeholder("e"))
+
+    plan = explain(q, Dialect.SQLITE, connection=make_db(), params={"e": "a@b"})
+    (search,) = plan.nodes
+    assert search.operation == "SEARCH"
+    assert search.index == "users_email"
+    assert plan.uses_index and not plan.full_scans
+
+    by_id = query().select(users.email).from_(users).where(users.id == 3)
+    (node,) = explain(by_id, Dialect.SQLITE, connection=make_db()).nodes
+    assert node.index == "PRIMARY KEY"
+
+
+def test_sqlite_automatic_index_is_missing_index() -> None:
+    """Test that transient automatic indexes are reported as missing."""
+    a, b = table("users", alias="a"), table("users", alias="b")
+    q = query().select(a.id).from_(a).join(b, a.age == b.age)
+
+    plan = explain(q, Dialect.SQLITE, connection=make_db())
+    assert {node.table for node in plan.missing_indexes} == {"a", "b"}
+
+
+def test_parse_postgresql_plan() -> None:
+    """Test parsing EXPLAIN (FORMAT JSON) output as text."""
+    output = json.dumps(
+        [
+            {
+                "Plan": {
+                    "Node Type": "Sort",
+                    "Total Cost": 10.5,
+                    "Plans": [
+                        {
+                            "Node Type": "Seq Scan",
+                            "Relation Name": "users",
+                            "Plan Rows": 1000,
+                        },
+                        {
+                            "Node Type": "Index Scan",
+                            "Relation Name": "groups",
+                            "Index Name": "groups_pkey",
+                        },
+                    ],
+                }
+            }
+        ]
+    )
+
+    plan = parse_postgresql_plan("SELECT ...", [(output,)])
+    (root,) = plan.nodes
+    assert root.temp_btree == "SORT"
+    assert root.extra["Total Cost"] == 10.5
+    assert [node.detail for node in plan.walk()] == [
+        "Sort",
+        "Seq Scan on users",
+        "Index Scan on groups using groups_pkey",
+    ]
+    assert [node.table for node in plan.full_scans] == ["users"]
+    assert plan.uses_index
@@ -0,0 +1,175 @@
+"""Test value-independent fingerprints and normalized SQL."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from smolql import (
+    CompileEvent,
+    CompileStats,
+    Dialect,
+    count,
+    fingerprint,
+    literal,
+    normalized_sql,
+    placeholder,
+    query,
+    table,
+)
+from smolql.domain import interfaces
+from smolql.domain.entities import Operator
+
+
+def test_values_do_not_change_the_fingerprint() -> None:
+    """Test that literals, placeholders, IN lists and LIMIT values are ignored."""
+    users = table("users")
+    base = query().select(users.id).from_(users)
+    first = base.where(users.id == 1, users.email.in_([1, 2, 3])).limit(10)
+    second = (
+        base.where(users.id == placeholder("x"))
+        .where(users.email.in_(literal(["a"], inline=True)))
+        .limit(500)
+        .offset(None)  # type: ignore[arg-type]
+    )
+
+    assert fingerprint(first) == fingerprint(second)
+    assert fingerprint(first.offset(20)) == fingerprint(first.offset(40))
+
+
+def test_structure_changes_the_fingerprint() -> None:
+    """Test that columns, operators, sort directions and clauses count."""
+    users = table("users")
+    base = query().select(users.id).from_(users)
+    variants = [
+        base,
+        base.where(users.id == 1),
+        base.where(users.id > 1),
+        base.where(users.age == 1),
+        base.where(users.id.not_in_([1])),
+        base.order_by(users.id),
+        base.order_by(users.id, "DESC"),
+        base.limit(1),
+        base.limit(1).offset(1),
+        query().select(users.id).from_(table("users", alias="u")),
+        query().select(count(users.id)).from_(users),
+    ]
+
+    assert len({fingerprint(q) for q in variants}) == len(variants)
+    # Names are length-prefixed, so identifiers cannot run into each other
+    assert fingerprint(query().select("a", "bc")) != fingerprint(
+        query().select("ab", "c")
+    )
+
+
+def test_column_positions_change_the_fingerprint() -> None:
+    """Test that GROUP BY and ORDER BY positions count as structure."""
+    users = table("users")
+    base = query().select(users.age, count()).from_(users)
+    first = base.group_by(1).order_by(2)
+    second = base.group_by(2).order_by(1)
+
+    assert fingerprint(first) != fingerprint(second)
+    assert normalized_sql(first, Dialect.SQLITE) != normalized_sql(
+        second, Dialect.SQLITE
+    )
+    # Other literals in those clauses are still values
+    assert fingerprint(base.order_by(literal("a"))) == fingerprint(
+        base.order_by(literal("b"))
+    )
+
+
+def test_fingerprint_is_stable_across_processes() -> None:
+    """Test that the fingerprint is pinned and independent of hash seeds."""
+    users = table("users")
+    q = query().select(users.id).from_(users).where(users.id == 1)
+    assert fingerprint(q) == "7c44dbbe9714354c"
+    assert fingerprint(users.id == 1) == "90ae175c13b392ce"
+
+    code = (
+        "from smolql import fingerprint, query, table; u = table('users'); "
+        "print(fingerprint(query().select(u.id).from_(u).where(u.id == 7)))"
+    )
+    for seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert output.strip() == "7c44dbbe9714354c"
+
+
+def test_fingerprint_handles_list_arguments_and_is_memoized() -> None:
+    """Test nodes holding lists and the fingerprint cached on queries."""
+    users = table("users")
+    # Nodes built before arguments became tuples may still hold lists
+    arguments = [users.id, literal(0)]
+    legacy = Operator(_operator_name="COALESCE", _arguments=arguments)  # type: ignore[arg-type]
+    assert fingerprint(legacy) == fingerprint(
+        Operator(_operator_name="COALESCE", _arguments=(users.id, literal(5)))
+    )
+
+    assert query().from_(users)._fingerprint is None
+    q = query().select(users.id).from_(users)
+    key = fingerprint(q)
+    assert q._fingerprint == key
+    # Derived queries get their own fingerprint
+    assert q.where(users.id == 1)._fingerprint is None
+
+
+def test_unsupported_values_raise() -> None:
+    """Test that nodes that cannot be walked are rejected."""
+
+    class Opaque(interfaces.IRawSQL):
+        """A node that is not a dataclass."""
+
+        @property
+        def sql(self) -> str:
+            """Get the SQL."""
+            return "x"
+
+        def accept(self, visitor: interfaces.IVisitor) -> str:
+            """Accept a visitor."""
+            return "x"
+
+    with pytest.raises(TypeError, match="Opaque"):
+        fingerprint(Opaque())
+
+
+def test_normalized_sql() -> None:
+    """Test that every value renders as a marker, whatever the dialect."""
+    users = table("users")
+    q = (
+        query()
+        .select(users.id)
+        .from_(users)
+        .where(users.id == literal(5, inline=True), users.email == placeholder("e"))
+        .where(users.age.in_([1, 2]))
+        .limit(10)
+        .offset(20)
+    )
+
+    assert normalized_sql(q, Dialect.POSTGRESQL) == (
+        'SELECT "users"."id" FROM "users" WHERE "users"."id" = ? '
+        'AND "users"."email" = ? AND "users"."age" = ANY(?) LIMIT ? OFFSET ?'
+    )
+    assert normalized_sql(q, Dialect.SQLITE).endswith(
+        '"users"."age" IN (SELECT value FROM json_each(?)) LIMIT ? OFFSET ?'
+    )
+
+
+def test_compile_stats_group_by_fingerprint() -> None:
+    """Test that the aggregator groups statements differing only in values."""
+    users = table("users")
+    stats = CompileStats()
+    for value in range(5):
+        q = query().select(users.id).from_(users).where(users.id == value)
+        stats.on_compile(CompileEvent(q, Dialect.SQLITE, "", 0.001, 5))
+
+    (summary,) = stats.summaries()
+    assert summary.compiles == 5
+    assert summary.fingerprint == f"sqlite:{fingerprint(q)}"
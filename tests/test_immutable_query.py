@@ -0,0 +1,93 @@
+"""Test the immutable query builder."""
+
+import dataclasses
+
+import pytest
+
+from smolql import Dialect, compile_to_sql, count, query, table
+from smolql.domain.entities import Query
+
+
+def test_builder_methods_return_new_queries() -> None:
+    """Test that chaining leaves the base query untouched."""
+    users = table("users")
+    base = query().select(users.id).from_(users)
+
+    adults = base.where(users.age >= 18)
+    limited = base.limit(5)
+
+    assert adults is not base
+    assert base.where_conditions == ()
+    assert len(adults.where_conditions) == 1
+    assert base.limit_value is None
+    assert limited.limit_value == 5
+    assert compile_to_sql(base, Dialect.SQLITE) == 'SELECT "users"."id" FROM "users"'
+
+
+def test_unchanged_clauses_are_shared() -> None:
+    """Test that derived queries reuse the clause tuples of their parent."""
+    users = table("users")
+    groups = table("groups")
+    base = (
+        query()
+        .select(users.id, users.email)
+        .from_(users)
+        .join(groups, on=users.group_id == groups.id)
+        .where(users.active == True)  # noqa: E712
+    )
+
+    variant = base.where(users.age > 30).order_by(users.email)
+
+    assert variant.select_fields is base.select_fields
+    assert variant.joins is base.joins
+    assert variant.where_conditions[:1] == base.where_conditions[:1]
+
+
+def test_query_is_frozen() -> None:
+    """Test that query fields cannot be reassigned."""
+    q = query().select("*")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        q._limit_value = 10  # type: ignore[misc]
+
+
+def test_queries_hash_and_compare_by_structure() -> None:
+    """Test that equal structures are equal and usable as dict keys."""
+    users = table("users", alias="u")
+
+    def build(min_age: int) -> Query:
+        return (
+            query()
+            .select(users.email, count(alias="n"))
+            .from_(users)
+            .where(users.age > min_age)
+            .group_by(users.email)
+        )
+
+    assert build(18) == build(18)
+    assert hash(build(18)) == hash(build(18))
+    assert build(18) != build(21)
+    assert {build(18): "cached"}[build(18)] == "cached"
+
+
+def test_structure_key_is_memoized() -> None:
+    """Test that the structural key is computed once per query."""
+    users = table("users")
+    q = query().select(users.id).from_(users)
+
+    assert q.structure_key() is q.structure_key()
+    assert q.where(users.id == 1).structure_key() != q.structure_key()
+
+
+def test_derived_queries_start_without_memos() -> None:
+    """Test that copies made by builder methods do not reuse cached keys."""
+    users = table("users")
+    q = query().select(users.id).from_(users)
+    q.structure_key()
+
+    derived = q.limit(1)
+
+    assert derived._key is None
+    assert derived._fingerprint is None
+    assert derived.select_fields is q.select_fields
+    assert derived.limit_value == 1
@@ -0,0 +1,142 @@
+"""Test IN list conditions."""
+
+import datetime
+import sqlite3
+
+import pytest
+
+from smolql import (
+    Dialect,
+    ParamStyle,
+    compile_to_sql,
+    compile_with_params,
+    literal,
+    normalized_sql,
+    placeholder,
+    prepare,
+    query,
+    table,
+)
+from smolql.services.compiler_service import compile_statement
+
+
+def test_inline_in_list() -> None:
+    """Test that plain compilation renders the values inline."""
+    users = table("users")
+    q = query().from_(users).where(users.id.in_([1, 2, 3]), users.email.not_in_(["x"]))
+
+    assert compile_to_sql(q, Dialect.POSTGRESQL) == (
+        'SELECT * FROM "users" WHERE "users"."id" IN (1, 2, 3) '
+        'AND "users"."email" NOT IN (\'x\')'
+    )
+
+
+def test_empty_inline_in_list() -> None:
+    """Test that empty lists match nothing, or everything when negated."""
+    users = table("users")
+    q = query().from_(users).where(users.id.in_([]) | users.id.not_in_(()))
+
+    assert compile_to_sql(q, Dialect.SQLITE).endswith("WHERE (1 = 0 OR 1 = 1)")
+
+
+def test_postgresql_binds_one_array() -> None:
+    """Test that PostgreSQL binds the list as a single array parameter."""
+    users = table("users")
+
+    def sql_for(ids: list[int]) -> tuple[str, dict]:
+        q = query().from_(users).where(users.id.in_(ids), users.age.not_in_([1]))
+        return compile_with_params(q, Dialect.POSTGRESQL)
+
+    sql, params = sql_for(list(range(10_000)))
+    assert sql == (
+        'SELECT * FROM "users" WHERE "users"."id" = ANY(:_p1) '
+        'AND "users"."age" <> ALL(:_p2)'
+    )
+    assert params == {"_p1": list(range(10_000)), "_p2": [1]}
+    assert sql_for([7])[0] == sql
+
+
+def test_sqlite_binds_json_array() -> None:
+    """Test that SQLite expands a bound JSON array with json_each."""
+    users = table("users")
+    q = query().from_(users).where(users.id.in_(range(10_000)))
+    statement = compile_statement(
+        q, Dialect.SQLITE, extract_literals=True, paramstyle=ParamStyle.QMARK
+    )
+
+    assert statement.sql == (
+        'SELECT * FROM "users" WHERE "users"."id" IN (SELECT value FROM json_each(?))'
+    )
+    assert statement.param_names == ("_p1",)
+    assert statement.params["_p1"].startswith("[0, 1, 2")
+
+
+def test_sqlite_in_list_executes() -> None:
+    """Test bound IN lists against a real SQLite database."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id INTEGER, email TEXT)")
+    rows = [(i, f"u{i}") for i in range(50)]
+    conn.executemany("INSERT INTO users VALUES (?, ?)", rows)
+
+    users = table("users")
+    q = (
+        query()
+        .select(users.id)
+        .from_(users)
+        .where(users.id.in_([3, 5, 40, 99]), users.email.not_in_(["u5"]))
+    )
+    sql, params = compile_with_params(q, Dialect.SQLITE)
+
+    assert conn.execute(sql, params).fetchall() == [(3,), (40,)]
+
+
+def test_sqlite_values_json_cannot_carry() -> None:
+    """Test that dates and blobs are bound one parameter each on SQLite."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE events (day TEXT, tag BLOB)")
+    conn.executemany(
+        "INSERT INTO events VALUES (?, ?)",
+        [("2024-01-01", b"a"), ("2024-01-02", b"b"), ("2024-01-03", b"c")],
+    )
+    events = table("events")
+    days = [datetime.date(2024, 1, 1), datetime.date(2024, 1, 3)]
+    q = (
+        query()
+        .select(events.day)
+        .from_(events)
+        .where(events.day.in_(days), events.tag.not_in_([b"c"]))
+    )
+
+    sql, params = compile_with_params(q, Dialect.SQLITE)
+
+    assert sql.endswith(
+        'WHERE "events"."day" IN (:_p1, :_p2) AND "events"."tag" NOT IN (:_p3)'
+    )
+    assert conn.execute(sql, params).fetchall() == [("2024-01-01",)]
+    # Normalized SQL does not depend on the values
+    assert normalized_sql(q, Dialect.SQLITE).endswith("json_each(?))")
+
+
+def test_in_list_placeholder() -> None:
+    """Test that a placeholder is bound to the whole list."""
+    users = table("users")
+    q = query().from_(users).where(users.id.in_(placeholder("ids")))
+    prepared = prepare(q, Dialect.POSTGRESQL, paramstyle=ParamStyle.NUMERIC)
+
+    assert prepared.sql.endswith('WHERE "users"."id" = ANY($1)')
+    assert prepared.bind(ids=[1, 2]) == (prepared.sql, ([1, 2],))
+
+
+def test_inline_opt_out_and_validation() -> None:
+    """Test inline literal lists and rejection of non-collections."""
+    users = table("users")
+    q = query().from_(users).where(users.id.in_(literal([1, 2], inline=True)))
+
+    assert compile_with_params(q, Dialect.SQLITE) == (
+        'SELECT * FROM "users" WHERE "users"."id" IN (1, 2)',
+        {},
+    )
+    with pytest.raises(TypeError, match="collection of values"):
+        users.email.in_("abc")
+    with pytest.raises(TypeError, match="collection of values"):
+        users.email.in_(literal("abc"))
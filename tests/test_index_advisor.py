@@ -0,0 +1,161 @@
+"""Test index suggestions and their validation against SQLite plans."""
+
+import sqlite3
+
+from smolql import (
+    Dialect,
+    advise_indexes,
+    check_indexes,
+    count,
+    literal,
+    placeholder,
+    query,
+    table,
+)
+
+
+def make_db() -> sqlite3.Connection:
+    """Create a database with unindexed, analyzed orders and users tables."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT)")
+    conn.execute(
+        "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INT, status TEXT, "
+        "total INT, created INT)"
+    )
+    conn.executemany(
+        "INSERT INTO orders (user_id, status, total, created) VALUES (?, ?, ?, ?)",
+        [(i % 50, "open" if i % 3 else "paid", i, i) for i in range(500)],
+    )
+    conn.execute("ANALYZE")
+    return conn
+
+
+def test_equality_before_sort_before_range() -> None:
+    """Test the column order of a composite index for one query."""
+    orders = table("orders")
+    q = (
+        query()
+        .select(orders.id)
+        .from_(orders)
+        .where(orders.total > 100, orders.status == placeholder("s"))
+        .order_by(orders.created, "DESC")
+    )
+
+    (suggestion,) = advise_indexes([q], Dialect.SQLITE)
+    assert suggestion.columns == (
+        ("status", "ASC"),
+        ("created", "ASC"),
+        ("total", "ASC"),
+    )
+    assert suggestion.name == "ix_orders_status_created_total"
+    assert suggestion.sql == (
+        'CREATE INDEX "ix_orders_status_created_total" '
+        'ON "orders" ("status", "created", "total")'
+    )
+    assert suggestion.queries == (q,)
+
+
+def test_mixed_sort_directions_and_schema() -> None:
+    """Test that mixed sort directions and the table schema are kept."""
+    orders = table("orders", schema="shop")
+    q = (
+        query()
+        .select(orders.id)
+        .from_(orders)
+        .where(orders.user_id.in_([1, 2]), orders.total > 5)
+        .order_by(orders.status)
+        .order_by(orders.created, "DESC")
+    )
+
+    (suggestion,) = advise_indexes([q], Dialect.POSTGRESQL)
+    assert suggestion.columns == (
+        ("user_id", "ASC"),
+        ("status", "ASC"),
+        ("created", "DESC"),
+        ("total", "ASC"),
+    )
+    assert suggestion.sql == (
+        'CREATE INDEX "ix_orders_user_id_status_created_total" ON "shop"."orders" '
+        '("user_id", "status", "created" DESC, "total")'
+    )
+
+
+def test_join_keys_and_grouping() -> None:
+    """Test that both sides of a join key and GROUP BY columns are indexed."""
+    users, orders = table("users"), table("orders")
+    q = (
+        query()
+        .select(users.email, count())
+        .from_(users)
+        .join(orders, orders.user_id == users.id)
+        .where(users.email == placeholder("e"))
+        .group_by(orders.status)
+    )
+
+    suggestions = advise_indexes([q], Dialect.SQLITE)
+    assert {(s.table, s.columns) for s in suggestions} == {
+        ("users", (("email", "ASC"), ("id", "ASC"))),
+        ("orders", (("user_id", "ASC"), ("status", "ASC"))),
+    }
+
+
+def test_workload_weights_and_prefix_folding() -> None:
+    """Test that prefix indexes fold into longer ones and weights add up."""
+    orders = table("orders")
+    by_user = query().select(orders.id).from_(orders).where(orders.user_id == 1)
+    by_user_status = by_user.where(orders.status == literal("open"))
+    by_total = query().select(orders.id).from_(orders).where(orders.total >= 10)
+
+    suggestions = advise_indexes(
+        {by_user: 10.0, by_user_status: 5.0, by_total: 2.0}, Dialect.SQLITE
+    )
+    assert [(s.columns, s.weight) for s in suggestions] == [
+        ((("user_id", "ASC"), ("status", "ASC")), 15.0),
+        ((("total", "ASC"),), 2.0),
+    ]
+    assert set(suggestions[0].queries) == {by_user, by_user_status}
+
+
+def test_unindexable_conditions_are_ignored() -> None:
+    """Test that OR groups, NOT IN and multi-table sorts are skipped."""
+    users, orders = table("users"), table("orders")
+    q = (
+        query()
+        .select(orders.id)
+        .from_(orders)
+        .join(users, users.id == orders.user_id)
+        .where((orders.total > 1) | (orders.status == literal("paid")))
+        .where(orders.created.not_in_([1, 2]))
+        .order_by(users.email)
+        .order_by(orders.created)
+    )
+
+    suggestions = advise_indexes([q], Dialect.SQLITE)
+    assert {(s.table, s.columns) for s in suggestions} == {
+        ("users", (("id", "ASC"),)),
+        ("orders", (("user_id", "ASC"),)),
+    }
+
+
+def test_check_indexes_on_scratch_copy() -> None:
+    """Test plan validation without modifying the real database."""
+    conn = make_db()
+    orders = table("orders")
+    q = (
+        query()
+        .select(orders.id)
+        .from_(orders)
+        .where(orders.user_id == placeholder("u"))
+        .order_by(orders.created)
+    )
+    (check,) = check_indexes(advise_indexes([q], Dialect.SQLITE), conn)
+
+    assert check.before[0].missing_indexes
+    assert check.before[0].temp_btrees
+    assert check.used
+    assert check.improves
+    assert not check.after[0].temp_btrees
+    indexes = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index'"
+    ).fetchall()
+    assert indexes == []
@@ -0,0 +1,140 @@
+"""Test INSERT statements and chunked bulk inserts."""
+
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+
+import pytest
+
+from smolql import Dialect, ParamStyle, compile_to_sql, insert, placeholder, table
+from smolql.domain.value_objects import CompiledStatement
+from smolql.services import bulk_insert
+from smolql.services.bulk_insert import rows_per_chunk
+from smolql.services.compiler_service import compile_statement
+
+
+def test_single_row_insert() -> None:
+    """Test a plain INSERT with literal and placeholder values."""
+    users = table("users", schema="app", alias="u")
+    stmt = (
+        insert(users).columns("name", users.age).values("O'Brien", placeholder("age"))
+    )
+
+    assert compile_to_sql(stmt, Dialect.POSTGRESQL) == (
+        'INSERT INTO "app"."users" ("name", "age") VALUES (\'O\'\'Brien\', :age)'
+    )
+    assert compile_to_sql(stmt, Dialect.SQLITE).startswith('INSERT INTO "users" (')
+
+
+def test_values_must_match_columns() -> None:
+    """Test that rows with the wrong number of values are rejected."""
+    with pytest.raises(ValueError, match="Expected 2 values"):
+        insert(table("users")).columns("a", "b").values(1)
+
+
+def test_values_many_chunks_lazily() -> None:
+    """Test that rows are consumed one chunk at a time."""
+    consumed = []
+
+    def rows() -> Iterator[tuple[int, str]]:
+        for i in range(7):
+            consumed.append(i)
+            yield (i, f"user{i}")
+
+    bulk = insert(table("users")).columns("id", "name").values_many(rows())
+    chunks = bulk.chunks(Dialect.SQLITE, max_rows=3)
+
+    sql, params = next(chunks)
+    assert consumed == [0, 1, 2]
+    assert sql == (
+        'INSERT INTO "users" ("id", "name") '
+        "VALUES (:_p1, :_p2), (:_p3, :_p4), (:_p5, :_p6)"
+    )
+    assert isinstance(params, dict)
+    assert list(params.items())[:3] == [("_p1", 0), ("_p2", "user0"), ("_p3", 1)]
+    assert len(params) == 6
+
+    rest = list(chunks)
+    assert len(rest) == 2
+    assert rest[0][0] == sql
+    assert rest[1][0].endswith("VALUES (:_p1, :_p2)")
+
+
+def test_full_chunks_share_sql_within_limit() -> None:
+    """Test that chunks respect the dialect parameter limit."""
+    users = table("users")
+    rows = ((i, i * 2, i * 3) for i in range(100_000))
+    bulk = insert(users).columns("a", "b", "c").values_many(rows)
+
+    chunks = list(bulk.chunks(Dialect.POSTGRESQL, paramstyle=ParamStyle.NUMERIC))
+
+    size = rows_per_chunk(3, Dialect.POSTGRESQL)
+    assert size == 65535 // 3
+    assert all(len(params) <= 65535 for _, params in chunks)
+    assert len({sql for sql, _ in chunks[:-1]}) == 1
+    assert sum(len(params) for _, params in chunks) == 300_000
+    first = chunks[0][1]
+    assert isinstance(first, tuple)
+    assert first[:4] == (0, 0, 0, 1)
+    assert chunks[0][0].endswith(f"${size * 3})")
+
+
+def test_chunk_statements_evict_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a full chunk cache drops only its least recently used entry."""
+    monkeypatch.setattr(bulk_insert, "_MAX_CHUNK_STATEMENTS", 2)
+    cached: OrderedDict[Hashable, CompiledStatement] = OrderedDict()
+    monkeypatch.setattr(bulk_insert, "_chunk_statements", cached)
+
+    def load(name: str) -> None:
+        bulk = insert(table(name)).columns("a").values_many([(1,)])
+        list(bulk.chunks(Dialect.SQLITE))
+
+    load("first")
+    load("second")
+    load("first")
+    load("third")
+    assert [statement.sql.split()[2] for statement in cached.values()] == [
+        '"first"',
+        '"third"',
+    ]
+
+
+def test_bulk_insert_into_sqlite() -> None:
+    """Test that chunked qmark inserts load every row into SQLite."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER, label TEXT)")
+    rows = [{"id": i, "label": f"item {i}"} for i in range(2500)]
+    bulk = insert(table("items")).columns("id", "label").values_many(rows)
+
+    for sql, params in bulk.chunks(Dialect.SQLITE, ParamStyle.QMARK, max_rows=1000):
+        conn.execute(sql, params)
+
+    assert conn.execute("SELECT COUNT(*), SUM(id) FROM items").fetchone() == (
+        2500,
+        sum(range(2500)),
+    )
+
+
+def test_invalid_rows_and_limits() -> None:
+    """Test errors for malformed rows and impossible chunk sizes."""
+    bulk = insert(table("t")).columns("a", "b").values_many([(1, 2), (3,)])
+    with pytest.raises(ValueError, match="Expected a row of 2 values"):
+        list(bulk.chunks(Dialect.SQLITE))
+
+    with pytest.raises(ValueError, match="requires columns"):
+        insert(table("t")).values_many([])
+
+    with pytest.raises(ValueError, match="exceed"):
+        rows_per_chunk(70_000, Dialect.POSTGRESQL)
+
+
+def test_insert_statement_params() -> None:
+    """Test that literal values can be extracted from a single-row insert."""
+    stmt = insert(table("t")).columns("a", "b").values(1, "x")
+
+    compiled = compile_statement(stmt, Dialect.SQLITE, extract_literals=True)
+
+    assert compiled.sql == 'INSERT INTO "t" ("a", "b") VALUES (:_p1, :_p2)'
+    assert compiled.params == {"_p1": 1, "_p2": "x"}
@@ -0,0 +1,175 @@
+"""Test compile observers and the rolling statistics aggregator."""
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+
+from smolql import (
+    CompileCache,
+    CompileEvent,
+    CompileObserver,
+    CompileStats,
+    Dialect,
+    add_compile_observer,
+    compile_to_sql,
+    count,
+    executor,
+    placeholder,
+    query,
+    remove_compile_observer,
+    table,
+)
+from smolql.services import compile_query, count_nodes
+
+
+class Recorder(CompileObserver):
+    """Observer keeping every event."""
+
+    def __init__(self) -> None:
+        """Create an empty recorder."""
+        self.events: list[CompileEvent] = []
+
+    def on_compile(self, event: CompileEvent) -> None:
+        """Record an event."""
+        self.events.append(event)
+
+
+@contextmanager
+def observing(observer: CompileObserver) -> Iterator[None]:
+    """Register an observer for the duration of a block."""
+    add_compile_observer(observer)
+    try:
+        yield
+    finally:
+        remove_compile_observer(observer)
+
+
+def test_compile_event_details() -> None:
+    """Test the timings, node count and length reported for a compile."""
+    users, orders = table("users"), table("orders")
+    q = (
+        query()
+        .select(users.email, count())
+        .from_(users)
+        .join(orders, orders.user_id == users.id)
+        .where(users.age > 18)
+        .group_by(users.email)
+        .order_by(users.email)
+    )
+    recorder = Recorder()
+    with observing(recorder):
+        sql = compile_query(q, Dialect.POSTGRESQL)
+
+    (event,) = recorder.events
+    assert event.node is q
+    assert event.sql == sql
+    assert event.sql_length == len(sql)
+    assert event.dialect is Dialect.POSTGRESQL
+    assert event.cache_hit is None
+    assert event.node_count == count_nodes(q) > 10
+    assert set(event.clause_times) == {
+        "SELECT",
+        "FROM",
+        "JOIN",
+        "WHERE",
+        "GROUP",
+        "ORDER",
+    }
+    assert sum(event.clause_times.values()) <= event.duration
+
+
+def test_no_events_without_observers() -> None:
+    """Test that unregistered observers receive nothing."""
+    users = table("users")
+    recorder = Recorder()
+    add_compile_observer(recorder)
+    add_compile_observer(recorder)
+    remove_compile_observer(recorder)
+
+    compile_query(query().select(users.id).from_(users), Dialect.SQLITE)
+    assert recorder.events == []
+
+
+def test_count_nodes() -> None:
+    """Test that node counting walks nested tuples and subqueries."""
+    users = table("users")
+    assert count_nodes(users.id) == 2
+    assert count_nodes(users.id == 1) == 4
+    inner = query().select(users.id).from_(users)
+    assert count_nodes(query().select(inner)) == 1 + count_nodes(inner)
+
+
+def test_compile_cache_hits_and_misses() -> None:
+    """Test that compile caches report misses and lookups that hit."""
+    users = table("users")
+    q = query().select(users.id).from_(users).where(users.id == placeholder("id"))
+    cache = CompileCache()
+    recorder = Recorder()
+    with observing(recorder):
+        cache.compile(q, Dialect.SQLITE)
+        cache.compile(q, Dialect.SQLITE)
+
+    miss, hit = recorder.events
+    assert (miss.cache_hit, hit.cache_hit) == (False, True)
+    assert miss.sql == hit.sql
+    assert hit.node_count == 0
+    assert hit.clause_times == {}
+
+
+def test_executor_statement_cache_events() -> None:
+    """Test events from the statement cache of an executor."""
+    users = table("users")
+    q = query().select(users.id).from_(users).where(users.id == placeholder("id"))
+    runner = executor(sqlite3.connect(":memory:"), Dialect.SQLITE)
+    runner.connection.execute("CREATE TABLE users (id INTEGER PRIMARY KEY)")
+    stats = CompileStats()
+    with observing(stats):
+        for _ in range(3):
+            runner.fetchall(q, {"id": 1})
+
+    (summary,) = stats.summaries()
+    assert (summary.compiles, summary.cache_misses, summary.cache_hits) == (1, 1, 2)
+    assert summary.hit_ratio == pytest.approx(2 / 3)
+    assert summary.sql == 'SELECT "users"."id" FROM "users" WHERE "users"."id" = ?'
+
+
+def test_rolling_percentiles() -> None:
+    """Test nearest-rank percentiles over the most recent window."""
+    users = table("users")
+    q = query().select(users.id).from_(users)
+    stats = CompileStats(window=100)
+    sql = compile_to_sql(q, Dialect.SQLITE)
+    for millis in [1000.0] * 10 + list(range(1, 101)):
+        stats.on_compile(CompileEvent(q, Dialect.SQLITE, sql, millis / 1000, 3))
+
+    (summary,) = stats.summaries()
+    assert summary.compiles == 110
+    assert summary.total_time == pytest.approx(10 + 5.05)
+    # The ten slow samples fell out of the window
+    assert (summary.p50, summary.p95, summary.p99, summary.max) == (
+        0.05,
+        0.095,
+        0.099,
+        0.1,
+    )
+    assert stats.summary(summary.fingerprint) == summary
+    stats.reset()
+    assert stats.summaries() == []
+
+
+def test_fingerprint_limit() -> None:
+    """Test that the least recently seen fingerprints are dropped."""
+    users = table("users")
+    stats = CompileStats(max_fingerprints=2)
+    with observing(stats):
+        for name in ("id", "email", "id", "age"):
+            compile_to_sql(query().select(users.col(name)).from_(users), Dialect.SQLITE)
+
+    assert sorted(summary.sql for summary in stats.summaries()) == [
+        'SELECT "users"."age" FROM "users"',
+        'SELECT "users"."id" FROM "users"',
+    ]
+    with pytest.raises(ValueError, match="window"):
+        CompileStats(window=0)
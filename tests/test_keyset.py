@@ -0,0 +1,210 @@
+"""Test keyset pagination."""
+
+import datetime
+import decimal
+import sqlite3
+import uuid
+
+import pytest
+
+from smolql import (
+    Dialect,
+    compile_to_sql,
+    compile_with_params,
+    count,
+    identifier,
+    keyset,
+    query,
+    row_number,
+    table,
+)
+from smolql.services.keyset import decode_cursor, encode_cursor
+
+
+def test_uniform_directions_use_row_values() -> None:
+    """Test that same-direction keys compile to one row-value comparison."""
+    users = table("users")
+    q = query().select(users.id).from_(users).order_by(users.age).order_by(users.id)
+    pages = keyset(q)
+
+    sql, params = compile_with_params(
+        pages.page(20, encode_cursor([30, 7])), Dialect.POSTGRESQL
+    )
+    assert sql == (
+        'SELECT "users"."id" FROM "users" '
+        'WHERE ("users"."age", "users"."id") > (:_p1, :_p2) '
+        'ORDER BY "users"."age" ASC, "users"."id" ASC LIMIT 20'
+    )
+    assert params == {"_p1": 30, "_p2": 7}
+    assert compile_to_sql(pages.page(20), Dialect.POSTGRESQL).endswith(
+        '"users"."id" ASC LIMIT 20'
+    )
+
+
+def test_mixed_directions_expand() -> None:
+    """Test the expanded comparison for mixed ASC/DESC keys."""
+    users = table("users")
+    q = query().from_(users).order_by(users.age, "desc").order_by(users.id)
+
+    condition = keyset(q).seek((30, 7))
+    assert compile_to_sql(query().where(condition), Dialect.SQLITE) == (
+        'SELECT * WHERE ("users"."age" < 30 '
+        'OR ("users"."age" = 30 AND "users"."id" > 7))'
+    )
+
+
+def test_cursor_round_trip() -> None:
+    """Test that cursors preserve common key types."""
+    values = (
+        1,
+        "a/b",
+        1.5,
+        True,
+        datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        datetime.date(2024, 1, 2),
+        decimal.Decimal("1.10"),
+        uuid.UUID(int=5),
+        b"\x00\xff",
+    )
+
+    token = encode_cursor(values)
+    assert token.isascii() and "=" not in token
+    assert decode_cursor(token) == values
+
+
+def test_invalid_cursors() -> None:
+    """Test that malformed cursors are rejected."""
+    for token in ("!!", encode_cursor([1])[:-3], "eyJhIjoxfQ"):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(token)
+
+    users = table("users")
+    pages = keyset(query().from_(users).order_by(users.id))
+    with pytest.raises(ValueError, match="Expected 1 key values"):
+        pages.page(10, encode_cursor([1, 2]))
+
+
+def test_keyset_requirements() -> None:
+    """Test that the query must be ordered, without OFFSET or NULL keys."""
+    users = table("users")
+    with pytest.raises(ValueError, match="ORDER BY"):
+        keyset(query().from_(users))
+    with pytest.raises(ValueError, match="OFFSET"):
+        keyset(query().from_(users).order_by(users.id).offset(10))
+    with pytest.raises(ValueError, match="ASC and DESC"):
+        keyset(query().from_(users).order_by(users.id, "DESC NULLS LAST"))
+    with pytest.raises(ValueError, match="NULL"):
+        keyset(query().from_(users).order_by(users.id)).seek([None])
+    with pytest.raises(TypeError, match="columns or expressions"):
+        keyset(query().from_(users).order_by(1))
+
+
+def test_aggregate_keys_seek_in_having() -> None:
+    """Test paging a grouped query by an aggregate, which WHERE cannot test."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INT)")
+    conn.executemany(
+        "INSERT INTO orders VALUES (?, ?)",
+        [(i, user_id) for i, user_id in enumerate([1, 2, 2, 3, 3, 3, 4, 5, 5])],
+    )
+
+    orders = table("orders")
+    q = (
+        query()
+        .select(orders.user_id, count(orders.id, alias="total"))
+        .from_(orders)
+        .group_by(orders.user_id)
+        .order_by(count(orders.id), "DESC")
+        .order_by(orders.user_id)
+    )
+    pages = keyset(q)
+    sql = compile_to_sql(pages.page(2, encode_cursor([2, 2])), Dialect.SQLITE)
+    assert 'HAVING (COUNT("orders"."id") < 2 OR ' in sql
+    assert "WHERE" not in sql
+
+    seen = []
+    cursor = None
+    while True:
+        sql, params = compile_with_params(pages.page(2, cursor), Dialect.SQLITE)
+        rows = conn.execute(sql, params).fetchall()
+        if not rows:
+            break
+        seen.extend(rows)
+        cursor = pages.cursor(rows[-1])
+    assert seen == [(3, 3), (2, 2), (5, 2), (1, 1), (4, 1)]
+
+    with pytest.raises(TypeError, match="GROUP BY"):
+        keyset(query().select(count()).from_(orders).order_by(count()))
+    with pytest.raises(TypeError, match="window functions"):
+        keyset(query().select(row_number()).from_(orders).order_by(row_number()))
+
+
+def test_date_cursor_compiles_to_quoted_literal() -> None:
+    """Test that typed cursor values render as quoted literals and seek."""
+    events = table("events")
+    q = query().select(events.day, events.id).from_(events)
+    pages = keyset(q.order_by(events.day).order_by(events.id))
+    after = encode_cursor([datetime.date(2024, 1, 1), 5])
+
+    sql = compile_to_sql(pages.page(10, after), Dialect.SQLITE)
+    assert "> ('2024-01-01', 5) ORDER BY" in sql
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, day TEXT)")
+    conn.executemany(
+        "INSERT INTO events VALUES (?, ?)",
+        [(4, "2024-01-01"), (5, "2024-01-01"), (6, "2024-01-01"), (7, "2024-01-02")],
+    )
+    assert conn.execute(sql).fetchall() == [("2024-01-01", 6), ("2024-01-02", 7)]
+
+
+def test_pages_match_offset_paging_on_sqlite() -> None:
+    """Test that seeking visits the same rows as OFFSET paging."""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, score INT)")
+    conn.executemany(
+        "INSERT INTO events VALUES (?, ?)", [(i, i % 7) for i in range(1, 101)]
+    )
+
+    events = table("events")
+    q = (
+        query()
+        .select(events.id, events.score)
+        .from_(events)
+        .order_by(events.score, "DESC")
+        .order_by(events.id)
+    )
+    pages = keyset(q)
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        sql, params = compile_with_params(pages.page(15, cursor), Dialect.SQLITE)
+        rows = conn.execute(sql, params).fetchall()
+        if not rows:
+            break
+        seen.extend(row["id"] for row in rows)
+        cursor = pages.cursor(rows[-1])
+
+    expected = conn.execute(
+        "SELECT id FROM events ORDER BY score DESC, id ASC"
+    ).fetchall()
+    assert seen == [row["id"] for row in expected]
+
+
+def test_sequence_rows_use_select_positions() -> None:
+    """Test cursors from plain tuple rows and aliased columns."""
+    users = table("users")
+    q = (
+        query()
+        .select(users.email, identifier("id", users, alias="user_id"))
+        .from_(users)
+        .order_by(identifier("id", users, alias="user_id"))
+    )
+    assert keyset(q).key(("a@b", 3)) == (3,)
+    assert keyset(q).key({"email": "a@b", "user_id": 3}) == (3,)
+
+    unselected = query().select(users.id).from_(users).order_by(users.age)
+    with pytest.raises(ValueError, match="select list"):
+        keyset(unselected).key((1,))
@@ -0,0 +1,145 @@
+"""Test extracting literals into bound parameters."""
+
+import datetime
+import decimal
+import sqlite3
+import uuid
+
+import pytest
+
+from smolql import (
+    Dialect,
+    compile_to_sql,
+    compile_with_params,
+    count,
+    executor,
+    literal,
+    placeholder,
+    prepare,
+    query,
+    table,
+)
+
+
+def test_literals_become_parameters() -> None:
+    """Test that literal values are replaced by generated parameters."""
+    users = table("users", alias="u")
+    q = query().select("*").from_(users).where(users.age > 18, users.score <= 2.5)
+
+    sql, params = compile_with_params(q, Dialect.POSTGRESQL)
+
+    assert sql == (
+        'SELECT * FROM "users" AS "u" WHERE "u"."age" > :_p1 AND "u"."score" <= :_p2'
+    )
+    assert params == {"_p1": 18, "_p2": 2.5}
+
+
+def test_same_shape_compiles_to_same_sql() -> None:
+    """Test that different values produce identical SQL text."""
+    users = table("users")
+
+    def by_age(age: int) -> str:
+        q = query().select("*").from_(users).where(users.age > age).limit(10)
+        return compile_with_params(q, Dialect.SQLITE)[0]
+
+    assert by_age(18) == by_age(65)
+    assert by_age(18).endswith("LIMIT 10")
+
+
+def test_column_positions_stay_inline() -> None:
+    """Test that GROUP BY and ORDER BY positions are not bound as parameters."""
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE items (kind TEXT, size INT)")
+    connection.executemany(
+        "INSERT INTO items VALUES (?, ?)", [("a", 1), ("b", 2), ("a", 3)]
+    )
+    items = table("items")
+    q = (
+        query()
+        .select(items.kind, count())
+        .from_(items)
+        .where(items.size > 0)
+        .group_by(1)
+        .order_by(2, "DESC")
+    )
+
+    sql, params = compile_with_params(q, Dialect.SQLITE)
+
+    assert sql.endswith("GROUP BY 1 ORDER BY 2 DESC")
+    assert params == {"_p1": 0}
+    assert executor(connection, Dialect.SQLITE).fetchall(q) == [("a", 2), ("b", 1)]
+
+
+def test_inline_literal_opt_out() -> None:
+    """Test that literals marked inline stay in the SQL text."""
+    users = table("users")
+    q = (
+        query()
+        .select("*")
+        .from_(users)
+        .where(users.kind == literal("staff", inline=True), users.age > 30)
+    )
+
+    sql, params = compile_with_params(q, Dialect.SQLITE)
+
+    assert '"users"."kind" = \'staff\'' in sql
+    assert params == {"_p1": 30}
+
+
+def test_inline_strings_are_escaped() -> None:
+    """Test that inlined string literals escape single quotes."""
+    users = table("users")
+    q = query().select("*").from_(users).where(users.col("name") == literal("O'Brien"))
+
+    assert compile_to_sql(q, Dialect.SQLITE).endswith("= 'O''Brien'")
+
+
+def test_inline_typed_values_are_quoted() -> None:
+    """Test that dates, UUIDs, bytes and decimals render as typed literals."""
+    users = table("users")
+    cases = [
+        (datetime.date(2024, 1, 2), "'2024-01-02'"),
+        (datetime.datetime(2024, 1, 2, 3, 4, 5), "'2024-01-02 03:04:05'"),
+        (datetime.time(3, 4), "'03:04:00'"),
+        (uuid.UUID(int=1), "'00000000-0000-0000-0000-000000000001'"),
+        (b"\x00\xff", "X'00ff'"),
+        (decimal.Decimal("1.50"), "1.50"),
+    ]
+    for value, rendered in cases:
+        q = query().select("*").from_(users).where(users.at == literal(value))
+        assert compile_to_sql(q, Dialect.POSTGRESQL).endswith(f"= {rendered}")
+
+    q = query().select("*").from_(users).where(users.at == literal({"a": 1}))
+    with pytest.raises(TypeError, match="dict"):
+        compile_to_sql(q, Dialect.SQLITE)
+
+
+def test_prepared_query_binds_extracted_literals() -> None:
+    """Test that prepared templates fill in extracted literal values."""
+    users = table("users")
+    q = (
+        query()
+        .select("*")
+        .from_(users)
+        .where(users.age > 18, users.role == placeholder("role"))
+    )
+
+    prepared = prepare(q, Dialect.SQLITE, extract_literals=True)
+    sql, params = prepared.bind(role="admin")
+
+    assert sql.endswith('"users"."age" > :_p1 AND "users"."role" = :role')
+    assert params == {"_p1": 18, "role": "admin"}
+
+
+def test_reserved_placeholder_name() -> None:
+    """Test that user placeholders cannot shadow generated names."""
+    users = table("users")
+    q = (
+        query()
+        .select("*")
+        .from_(users)
+        .where(users.age > 18, users.id == placeholder("_p1"))
+    )
+
+    with pytest.raises(ValueError, match="reserved"):
+        compile_with_params(q, Dialect.SQLITE)
@@ -0,0 +1,59 @@
+"""Test the compact slotted AST nodes."""
+
+import pytest
+
+from smolql import count, placeholder, query, raw, table
+from smolql.bench.nodes import build_tree
+from smolql.domain.entities import Literal, Operator
+from smolql.services import count_nodes
+
+
+def test_nodes_have_no_instance_dict() -> None:
+    """Test that AST nodes are slotted."""
+    users = table("users")
+    nodes = [
+        users,
+        users.id,
+        users.id == 1,
+        Literal(_value=1),
+        placeholder("p"),
+        raw("1"),
+        count(),
+        query().select(users.id),
+    ]
+
+    for node in nodes:
+        assert not hasattr(node, "__dict__"), type(node).__name__
+
+
+def test_operator_arguments_are_tuples() -> None:
+    """Test that operator arguments are stored as tuples."""
+    users = table("users")
+    # Older callers pass a list, which the annotation no longer admits
+    legacy = Operator(
+        _operator_name="MY_FUNCTION",
+        _arguments=[users.id],  # type: ignore[arg-type]
+    )
+
+    assert isinstance(legacy.arguments, tuple)
+    assert len(legacy.arguments) == 1
+    assert isinstance((users.a + users.b).arguments, tuple)
+    assert hash(query().select(count(users.id))) == hash(
+        query().select(count(users.id))
+    )
+
+
+def test_table_columns_still_resolve() -> None:
+    """Test that attribute access on slotted tables still builds identifiers."""
+    users = table("users", alias="u")
+
+    assert users.email.name == "email"
+    with pytest.raises(AttributeError):
+        users._missing  # noqa: B018
+
+
+def test_benchmark_tree_node_count() -> None:
+    """Test that the benchmark tree has the expected number of nodes."""
+    # The query, its FROM table, the selected column and its table, then per
+    # condition a predicate, a column, the column's table and a literal
+    assert count_nodes(build_tree(10)) == 1 + 1 + 2 + 10 * 4
@@ -0,0 +1,120 @@
+"""Test driver-native parameter styles."""
+
+import sqlite3
+
+from smolql import (
+    Dialect,
+    ParamStyle,
+    literal,
+    placeholder,
+    prepare,
+    query,
+    raw,
+    table,
+)
+from smolql.domain.entities import Literal, Operator
+from smolql.services.compiler_service import compile_statement
+
+
+def test_numeric_style_deduplicates_names() -> None:
+    """Test that a repeated name maps to a single $n slot."""
+    users = table("users")
+    q = (
+        query()
+        .select("*")
+        .from_(users)
+        .where(
+            (users.owner_id == placeholder("uid"))
+            | (users.editor_id == placeholder("uid")),
+            users.org_id == placeholder("org"),
+        )
+    )
+
+    statement = compile_statement(q, Dialect.POSTGRESQL, paramstyle=ParamStyle.NUMERIC)
+
+    assert statement.sql.endswith(
+        '("users"."owner_id" = $1 OR "users"."editor_id" = $1) '
+        'AND "users"."org_id" = $2'
+    )
+    assert statement.positions == {"uid": 1, "org": 2}
+    assert statement.param_names == ("uid", "org")
+
+
+def test_qmark_style_uses_one_slot_per_marker() -> None:
+    """Test that qmark markers list every occurrence in order."""
+    users = table("users")
+    q = (
+        query()
+        .select("*")
+        .from_(users)
+        .where(
+            (users.a == placeholder("x")) | (users.b == placeholder("y")),
+            users.c == placeholder("x"),
+        )
+    )
+
+    statement = compile_statement(q, Dialect.SQLITE, paramstyle=ParamStyle.QMARK)
+
+    assert statement.sql.count("?") == 3
+    assert statement.param_names == ("x", "y", "x")
+    assert statement.positions == {"x": 1, "y": 2}
+
+
+def test_pyformat_style_escapes_percent() -> None:
+    """Test pyformat markers and escaping of literal percent signs."""
+    users = table("users")
+    modulo = Operator(_operator_name="%", _arguments=(users.score, Literal(_value=2)))
+    q = (
+        query()
+        .select(raw("'100%'"), modulo)
+        .from_(users)
+        .where(users.name_col == placeholder("name"), users.tag == literal("a%"))
+    )
+
+    statement = compile_statement(q, Dialect.POSTGRESQL, paramstyle=ParamStyle.PYFORMAT)
+    sql = statement.sql
+
+    assert "'100%%'" in sql
+    assert '("users"."score" %% 2)' in sql
+    assert '"users"."name_col" = %(name)s' in sql
+    assert "'a%%'" in sql
+
+
+def test_literals_extracted_in_positional_style() -> None:
+    """Test that generated literal parameters take positional slots."""
+    users = table("users")
+    q = (
+        query()
+        .select("*")
+        .from_(users)
+        .where(users.age > 18, users.id == placeholder("id"))
+    )
+
+    prepared = prepare(
+        q, Dialect.POSTGRESQL, extract_literals=True, paramstyle=ParamStyle.NUMERIC
+    )
+
+    assert prepared.sql.endswith('"users"."age" > $1 AND "users"."id" = $2')
+    assert prepared.bind(id=7) == (prepared.sql, (18, 7))
+
+
+def test_qmark_statement_runs_on_sqlite() -> None:
+    """Test that bound qmark parameters execute directly on sqlite3."""
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE users (id INTEGER, a INTEGER, b INTEGER)")
+    connection.executemany(
+        "INSERT INTO users VALUES (?, ?, ?)", [(1, 5, 0), (2, 0, 5), (3, 0, 0)]
+    )
+    users = table("users")
+    q = (
+        query()
+        .select(users.id)
+        .from_(users)
+        .where((users.a == placeholder("v")) | (users.b == placeholder("v")))
+        .order_by(users.id)
+    )
+
+    sql, params = prepare(q, Dialect.SQLITE, paramstyle=ParamStyle.QMARK).bind(v=5)
+
+    assert params == (5, 5)
+    assert connection.execute(sql, params).fetchall() == [(1,), (2,)]
@@ -0,0 +1,77 @@
+"""Test prepared query templates."""
+
+import pytest
+
+from smolql import Dialect, placeholder, prepare, query, table
+
+
+def test_prepare_compiles_once() -> None:
+    """Test that a prepared query exposes its SQL and placeholder names."""
+    users = table("users", alias="u")
+    q = (
+        query()
+        .select(users.id)
+        .from_(users)
+        .where(users.age > placeholder("min_age"), users.role == placeholder("role"))
+    )
+
+    prepared = prepare(q, Dialect.POSTGRESQL)
+
+    assert prepared.sql == (
+        'SELECT "u"."id" FROM "users" AS "u" '
+        'WHERE "u"."age" > :min_age AND "u"."role" = :role'
+    )
+    assert prepared.param_names == ("min_age", "role")
+
+
+def test_bind_returns_params_in_sql_order() -> None:
+    """Test that bound parameters follow the placeholder order."""
+    users = table("users")
+    q = (
+        query()
+        .select("*")
+        .from_(users)
+        .where(users.a == placeholder("first"), users.b == placeholder("second"))
+    )
+    prepared = prepare(q, Dialect.SQLITE)
+
+    sql, params = prepared.bind(second=2, first=1)
+
+    assert sql == prepared.sql
+    assert isinstance(params, dict)
+    assert list(params.items()) == [("first", 1), ("second", 2)]
+
+
+def test_repeated_placeholder_is_bound_once() -> None:
+    """Test that a placeholder used twice is listed once."""
+    users = table("users")
+    q = (
+        query()
+        .select("*")
+        .from_(users)
+        .where((users.a == placeholder("v")) | (users.b == placeholder("v")))
+    )
+
+    prepared = prepare(q, Dialect.SQLITE)
+
+    assert prepared.param_names == ("v",)
+    assert prepared.bind(v=3)[1] == {"v": 3}
+
+
+def test_bind_rejects_missing_and_unexpected_names() -> None:
+    """Test that bind validates parameter names."""
+    users = table("users")
+    q = query().select("*").from_(users).where(users.id == placeholder("id"))
+    prepared = prepare(q, Dialect.SQLITE)
+
+    with pytest.raises(ValueError, match="missing id"):
+        prepared.bind()
+    with pytest.raises(ValueError, match="unexpected extra"):
+        prepared.bind(id=1, extra=2)
+
+
+def test_prepare_without_placeholders() -> None:
+    """Test binding a query that takes no parameters."""
+    prepared = prepare(query().select("*").from_(table("users")), Dialect.SQLITE)
+
+    assert prepared.bind() == ('SELECT * FROM "users"', {})
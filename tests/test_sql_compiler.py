@@ -0,0 +1,94 @@
+"""Test the reusable per-dialect compiler."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from smolql import (
+    Dialect,
+    DialectSpec,
+    SQLCompiler,
+    compile_to_sql,
+    get_compiler,
+    placeholder,
+    query,
+    table,
+)
+from smolql.services.compiler_service import compile_statement
+
+
+def test_compiler_is_shared_per_dialect() -> None:
+    """Test that each dialect has a single reusable compiler."""
+    assert get_compiler(Dialect.POSTGRESQL) is get_compiler(Dialect.POSTGRESQL)
+    assert get_compiler(Dialect.SQLITE).dialect is Dialect.SQLITE
+    assert not get_compiler(Dialect.SQLITE).spec.supports_schema
+
+
+def test_compiler_matches_visitors() -> None:
+    """Test that compiling directly and through the API agree."""
+    users = table("users", schema="app", alias="u")
+    q = query().select(users.id).from_(users).where(users.age > placeholder("age"))
+
+    statement = get_compiler(Dialect.POSTGRESQL).compile(q)
+
+    assert statement.sql == compile_to_sql(q, Dialect.POSTGRESQL)
+    assert statement.sql == (
+        'SELECT "u"."id" FROM "app"."users" AS "u" WHERE "u"."age" > :age'
+    )
+    assert statement.param_names == ("age",)
+
+
+def test_custom_dialect_spec() -> None:
+    """Test that dialect differences are data on the compiler."""
+    compiler = SQLCompiler(
+        DialectSpec(Dialect.POSTGRESQL, supports_schema=False, identifier_quote="`")
+    )
+    users = table("users", schema="app", alias="u")
+
+    sql = compiler.to_sql(query().select(users.id).from_(users))
+
+    assert sql == "SELECT `u`.`id` FROM `users` AS `u`"
+    # The shared PostgreSQL compiler is unaffected by the custom one
+    pg_sql = compile_to_sql(query().select(users.id).from_(users), Dialect.POSTGRESQL)
+    assert pg_sql == 'SELECT "u"."id" FROM "app"."users" AS "u"'
+
+
+def test_quoted_names_are_memoized() -> None:
+    """Test that repeated references hit the bounded name cache."""
+    compiler = SQLCompiler(DialectSpec(Dialect.SQLITE), name_cache_size=2)
+    orders = table("orders", alias="o")
+    q = query().select(orders.id, orders.total, orders.id).from_(orders)
+
+    compiler.to_sql(q)
+
+    info = compiler._column_sql.cache_info()
+    assert info.hits == 1
+    assert info.maxsize == info.currsize == 2
+
+
+def test_compiler_is_thread_safe() -> None:
+    """Test that one compiler serves concurrent compilations."""
+    users = table("users")
+
+    def compile_one(i: int) -> tuple[int, str, tuple[str, ...]]:
+        q = (
+            query()
+            .select(users.col(f"c{i}"))
+            .from_(users)
+            .where(users.id == placeholder(f"p{i}"))
+        )
+        statement = compile_statement(q, Dialect.SQLITE)
+        return i, statement.sql, statement.param_names
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(compile_one, range(400)))
+
+    for i, sql, names in results:
+        assert sql == f'SELECT "users"."c{i}" FROM "users" WHERE "users"."id" = :p{i}'
+        assert names == (f"p{i}",)
+
+
+def test_unsupported_dialect() -> None:
+    """Test that unknown dialects are rejected."""
+    with pytest.raises(ValueError, match="Unsupported dialect"):
+        get_compiler("mysql")  # type: ignore[arg-type]
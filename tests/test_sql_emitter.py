@@ -0,0 +1,63 @@
+"""Test the single-buffer SQL emitter."""
+
+from smolql import Dialect, compile_to_sql, query, table
+from smolql.domain import interfaces
+from smolql.domain.entities import Literal, Operator
+from smolql.services.compiler_service import PostgreSQLVisitor, SQLiteVisitor
+
+
+class Upper(interfaces.ISQLNode):
+    """Custom node that renders through the public visitor API."""
+
+    def __init__(self, column: interfaces.IIdentifier) -> None:
+        """Create an UPPER() call over a column."""
+        self.column = column
+
+    def accept(self, visitor: interfaces.IVisitor) -> str:
+        """Accept a visitor for compilation."""
+        return f"UPPER({visitor.visit_identifier(self.column)})"
+
+
+def test_custom_nodes_render_in_place() -> None:
+    """Test that nodes unknown to the emitter are rendered via accept."""
+    users = table("users", alias="u")
+    q = query().select(users.id, Upper(users.col("name"))).from_(users)
+
+    sql = compile_to_sql(q, Dialect.POSTGRESQL)
+
+    assert sql == 'SELECT "u"."id", UPPER("u"."name") FROM "users" AS "u"'
+
+
+def test_visit_methods_return_standalone_fragments() -> None:
+    """Test that public visit methods still return their own SQL."""
+    users = table("users", schema="app", alias="u")
+    visitor = PostgreSQLVisitor()
+
+    assert users.accept(visitor) == '"app"."users" AS "u"'
+    assert (users.age > 18).accept(visitor) == '"u"."age" > 18'
+    assert users.accept(SQLiteVisitor()) == '"users" AS "u"'
+
+
+def test_deeply_nested_expressions() -> None:
+    """Test that nested function calls are emitted in one pass."""
+    facts = table("facts")
+    expr: interfaces.ISQLNode = facts.col("c0")
+    for i in range(200):
+        expr = Operator(_operator_name="coalesce", _arguments=(expr, Literal(_value=i)))
+
+    sql = compile_to_sql(query().select(expr).from_(facts), Dialect.SQLITE)
+
+    assert sql.startswith("SELECT COALESCE(COALESCE(")
+    assert sql.count("COALESCE(") == 200
+    assert sql.endswith(', 198), 199) FROM "facts"')
+
+
+def test_wide_select_list() -> None:
+    """Test that long select lists are separated correctly."""
+    facts = table("facts", alias="f")
+    columns = [facts.col(f"c{i}") for i in range(500)]
+
+    sql = compile_to_sql(query().select(*columns).from_(facts), Dialect.POSTGRESQL)
+
+    expected = ", ".join(f'"f"."c{i}"' for i in range(500))
+    assert sql == f'SELECT {expected} FROM "facts" AS "f"'
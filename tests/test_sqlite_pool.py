@@ -0,0 +1,140 @@
+"""Test the SQLite connection pool."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from smolql import SQLitePool, SQLitePragmas, query, table
+
+
+def make_pool(tmp_path: Path, **kwargs: Any) -> SQLitePool:
+    """Create a pool over a fresh database file with one table."""
+    pool = SQLitePool(str(tmp_path / "cache.db"), **kwargs)
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(10)])
+        conn.commit()
+    return pool
+
+
+def test_pragmas_are_applied(tmp_path: Path) -> None:
+    """Test that connections are tuned on open."""
+    pool = make_pool(tmp_path, pragmas=SQLitePragmas(cache_size=-2048))
+
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert conn.execute("PRAGMA cache_size").fetchone() == (-2048,)
+        assert conn.execute("PRAGMA synchronous").fetchone() == (1,)  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone() == (2,)  # MEMORY
+    with pytest.raises(ValueError, match="PRAGMA journal_mode"):
+        SQLitePragmas(journal_mode="wal; DROP TABLE t").statements()
+
+
+def test_connections_are_reused(tmp_path: Path) -> None:
+    """Test that released connections go back to the pool."""
+    pool = make_pool(tmp_path)
+    first = pool.acquire()
+    pool.release(first)
+
+    assert pool.acquire() is first
+    with pytest.raises(ValueError, match="not checked out"):
+        pool.release(object())  # type: ignore[arg-type]
+
+
+def test_executor_keeps_its_statement_cache(tmp_path: Path) -> None:
+    """Test that each pooled connection keeps a warm executor."""
+    pool = make_pool(tmp_path, max_size=1)
+    t = table("t")
+    q = query().select(t.id).from_(t).where(t.id < 3)
+
+    with pool.executor() as db:
+        assert db.fetchall(q) == [(0,), (1,), (2,)]
+    with pool.executor() as again:
+        assert again is db
+        again.fetchall(q)
+    assert db.cache_info().hits == 1
+
+
+def test_waits_for_a_connection_and_times_out(tmp_path: Path) -> None:
+    """Test waiting at max size, timeouts and wait metrics."""
+    pool = make_pool(tmp_path, max_size=1)
+    held = pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+
+    timer = threading.Timer(0.05, pool.release, args=(held,))
+    timer.start()
+    conn = pool.acquire(timeout=5)
+    timer.join()
+
+    metrics = pool.metrics()
+    assert conn is held
+    assert metrics.timeouts == 1
+    assert metrics.max_wait >= 0.04
+    assert metrics.utilization == 1.0
+    assert metrics.size == 1
+
+
+def test_unhealthy_connections_are_replaced(tmp_path: Path) -> None:
+    """Test that a broken idle connection is discarded on checkout."""
+    pool = make_pool(tmp_path, health_check_interval=0)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.close()
+
+    with pool.connection() as fresh:
+        assert fresh is not conn
+        assert fresh.execute("SELECT count(*) FROM t").fetchone() == (10,)
+    assert pool.metrics().discarded == 1
+
+
+class _FailingRollback(sqlite3.Connection):
+    """A connection whose rollback always fails."""
+
+    def rollback(self) -> None:
+        """Fail to roll back."""
+        raise sqlite3.OperationalError("disk I/O error")
+
+
+def test_failed_rollback_frees_the_slot(tmp_path: Path) -> None:
+    """Test that a connection that cannot roll back is dropped on release."""
+    pool = make_pool(tmp_path, max_size=1, timeout=0.5, factory=_FailingRollback)
+    conn = pool.acquire()
+    conn.execute("INSERT INTO t VALUES (100)")
+
+    with pytest.raises(sqlite3.OperationalError, match="disk I/O"):
+        pool.release(conn)
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    assert pool.metrics().size == 0
+    with pool.connection() as fresh:
+        assert fresh.execute("SELECT count(*) FROM t").fetchone() == (10,)
+
+
+def test_thread_connections(tmp_path: Path) -> None:
+    """Test per-thread pinned connections."""
+    pool = make_pool(tmp_path, max_size=2)
+    seen = {}
+
+    def worker(name: str) -> None:
+        seen[name] = (pool.thread_connection(), pool.thread_connection())
+        time.sleep(0.02)
+        pool.release_thread_connection()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen["a"][0] is seen["a"][1]
+    assert seen["a"][0] is not seen["b"][0]
+    assert pool.metrics().in_use == 0
+    pool.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.acquire()
@@ -0,0 +1,109 @@
+"""Test streaming query results."""
+
+import sqlite3
+from typing import Any
+
+import pytest
+
+from smolql import Dialect, ParamStyle, executor, placeholder, query, table
+from smolql.services.streaming import server_cursor
+
+
+class RecordingCursor:
+    """DB-API cursor double that records statements and serves fixed rows."""
+
+    def __init__(self, log: list[Any], rows: list[tuple[int]]) -> None:
+        """Create a cursor over ``rows``."""
+        self.log = log
+        self.rows = rows
+        self.pending: list[tuple[int]] = []
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        """Record a statement and serve the next batch for FETCH."""
+        self.log.append((sql, params))
+        if sql.startswith("FETCH FORWARD"):
+            size = int(sql.split()[2])
+            self.pending, self.rows = self.rows[:size], self.rows[size:]
+
+    def fetchall(self) -> list[tuple[int]]:
+        """Get the rows of the last FETCH."""
+        return self.pending
+
+    def close(self) -> None:
+        """Record that the cursor was closed."""
+        self.log.append(("<close>", None))
+
+
+class RecordingConnection:
+    """DB-API connection double handing out recording cursors."""
+
+    def __init__(self, rows: list[tuple[int]]) -> None:
+        """Create a connection serving ``rows``."""
+        self.log: list[Any] = []
+        self.rows = rows
+
+    def cursor(self) -> RecordingCursor:
+        """Create a cursor."""
+        return RecordingCursor(self.log, self.rows)
+
+
+def test_sqlite_stream_batches() -> None:
+    """Test fetchmany batching end to end on sqlite3."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(2500)])
+    db = executor(conn, Dialect.SQLITE)
+    t = table("t")
+    q = query().select(t.id).from_(t).where(t.id >= placeholder("start"))
+
+    sizes = [len(batch) for batch in db.stream_batches(q, {"start": 100}, 1000)]
+    assert sizes == [1000, 1000, 400]
+    assert sum(1 for _ in db.stream(q, {"start": 0}, batch_size=7)) == 2500
+
+
+def test_stream_is_lazy() -> None:
+    """Test that rows are only fetched as the stream is consumed."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id INTEGER)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(100)])
+    t = table("t")
+
+    rows = executor(conn, Dialect.SQLITE).stream(query().from_(t), batch_size=10)
+    assert next(rows) == (0,)
+    rows.close()
+    with pytest.raises(ValueError, match="batch_size"):
+        next(executor(conn, Dialect.SQLITE).stream(query().from_(t), batch_size=0))
+
+
+def test_server_cursor_sql() -> None:
+    """Test the DECLARE / FETCH / CLOSE statements."""
+    cursor = server_cursor('SELECT * FROM "t" WHERE "t"."id" > %(id)s', 500, "c1")
+
+    assert cursor.declare_sql == (
+        'DECLARE "c1" NO SCROLL CURSOR FOR SELECT * FROM "t" WHERE "t"."id" > %(id)s'
+    )
+    assert cursor.fetch_sql == 'FETCH FORWARD 500 FROM "c1"'
+    assert cursor.close_sql == 'CLOSE "c1"'
+    assert server_cursor("SELECT 1").name != server_cursor("SELECT 1").name
+
+
+def test_postgresql_streams_through_server_cursor() -> None:
+    """Test the statement sequence sent for a PostgreSQL stream."""
+    conn = RecordingConnection([(i,) for i in range(5)])
+    db = executor(conn, Dialect.POSTGRESQL, paramstyle=ParamStyle.PYFORMAT)
+    t = table("t")
+    q = query().select(t.id).from_(t).where(t.id > 0)
+
+    assert list(db.stream_batches(q, batch_size=2)) == [
+        [(0,), (1,)],
+        [(2,), (3,)],
+        [(4,)],
+    ]
+    declare, *rest = [sql for sql, _ in conn.log]
+    name = declare.split()[1]
+    assert declare == (
+        f"DECLARE {name} NO SCROLL CURSOR FOR "
+        'SELECT "t"."id" FROM "t" WHERE "t"."id" > %(_p1)s'
+    )
+    assert conn.log[0][1] == {"_p1": 0}
+    assert rest == [f"FETCH FORWARD 2 FROM {name}"] * 3 + [f"CLOSE {name}", "<close>"]
@@ -0,0 +1,63 @@
+"""Test schema-declared tables."""
+
+import pytest
+
+from smolql import Dialect, compile_to_sql, query, table
+
+
+def test_declared_columns_are_reused() -> None:
+    """Test that column access returns the same precomputed identifier."""
+    users = table("users", alias="u", columns=["id", "email"])
+
+    assert users.email is users.email
+    assert users.col("id") is users.id
+    assert users.columns == ("id", "email")
+
+
+def test_unknown_column_fails_at_access() -> None:
+    """Test that typos raise AttributeError when the column is declared."""
+    users = table("users", columns=["id", "email"])
+
+    with pytest.raises(AttributeError, match="has no column 'emial'"):
+        users.emial  # noqa: B018
+    with pytest.raises(AttributeError):
+        users.col("emial")
+
+
+def test_undeclared_tables_accept_any_column() -> None:
+    """Test that tables without columns keep the dynamic behavior."""
+    users = table("users")
+
+    assert users.anything.name == "anything"
+    assert users.columns is None
+
+
+def test_declared_columns_compile_per_dialect() -> None:
+    """Test that cached fragments are kept per dialect."""
+    users = table("users", schema="app", alias="u", columns=["id", "email"])
+    q = query().select(users.id, users.email).from_(users).where(users.id == 1)
+
+    pg_sql = compile_to_sql(q, Dialect.POSTGRESQL)
+    sqlite_sql = compile_to_sql(q, Dialect.SQLITE)
+
+    assert pg_sql == (
+        'SELECT "u"."id", "u"."email" FROM "app"."users" AS "u" WHERE "u"."id" = 1'
+    )
+    assert sqlite_sql == (
+        'SELECT "u"."id", "u"."email" FROM "users" AS "u" WHERE "u"."id" = 1'
+    )
+    assert users.email._fragments == {
+        Dialect.POSTGRESQL: '"u"."email"',
+        Dialect.SQLITE: '"u"."email"',
+    }
+
+
+def test_declared_table_equals_undeclared() -> None:
+    """Test that column declarations do not change query structure."""
+    declared = table("users", columns=["id"])
+    plain = table("users")
+
+    declared_query = query().select(declared.id).from_(declared)
+    plain_query = query().select(plain.id).from_(plain)
+
+    assert declared_query == plain_query
@@ -0,0 +1,133 @@
+"""Test ON CONFLICT upserts."""
+
+import sqlite3
+
+import pytest
+
+from smolql import (
+    Dialect,
+    ParamStyle,
+    compile_to_sql,
+    excluded,
+    insert,
+    placeholder,
+    table,
+)
+
+
+def test_on_conflict_do_nothing() -> None:
+    """Test DO NOTHING with and without a conflict target."""
+    stmt = insert(table("users")).columns("id", "name").values(1, "a")
+
+    assert compile_to_sql(stmt.on_conflict_do_nothing("id"), Dialect.SQLITE) == (
+        'INSERT INTO "users" ("id", "name") VALUES (1, \'a\') '
+        'ON CONFLICT ("id") DO NOTHING'
+    )
+    assert compile_to_sql(stmt.on_conflict_do_nothing(), Dialect.POSTGRESQL).endswith(
+        "VALUES (1, 'a') ON CONFLICT DO NOTHING"
+    )
+
+
+def test_on_conflict_do_update_columns() -> None:
+    """Test DO UPDATE overwriting columns with the proposed row."""
+    users = table("users", schema="app")
+    stmt = (
+        insert(users)
+        .columns("id", "name", "age")
+        .values(placeholder("id"), placeholder("name"), placeholder("age"))
+        .on_conflict_do_update([users.id], ["name", users.age])
+    )
+
+    assert compile_to_sql(stmt, Dialect.POSTGRESQL) == (
+        'INSERT INTO "app"."users" ("id", "name", "age") VALUES (:id, :name, :age) '
+        'ON CONFLICT ("id") DO UPDATE SET "name" = "excluded"."name", '
+        '"age" = "excluded"."age"'
+    )
+
+
+def test_on_conflict_do_update_mapping_and_where() -> None:
+    """Test DO UPDATE with expressions, literals and a WHERE condition."""
+    users = table("users")
+    stmt = (
+        insert(users)
+        .columns("id", "name", "version")
+        .values(1, "a", 2)
+        .on_conflict_do_update(
+            ["id"],
+            {"name": excluded("name"), "source": "import"},
+            where=users.version < excluded("version"),
+        )
+    )
+
+    assert compile_to_sql(stmt, Dialect.SQLITE).endswith(
+        'ON CONFLICT ("id") DO UPDATE SET "name" = "excluded"."name", '
+        '"source" = \'import\' WHERE "users"."version" < "excluded"."version"'
+    )
+
+
+def test_on_conflict_do_update_validation() -> None:
+    """Test that DO UPDATE requires a target and columns to update."""
+    stmt = insert(table("users")).columns("id").values(1)
+
+    with pytest.raises(ValueError, match="conflict target"):
+        stmt.on_conflict_do_update([], ["id"])
+    with pytest.raises(ValueError, match="columns to update"):
+        stmt.on_conflict_do_update(["id"], {})
+
+
+def test_bulk_upsert_runs_on_sqlite() -> None:
+    """Test chunked upserts against a real SQLite database."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, hits INT)")
+    conn.execute("INSERT INTO users VALUES (1, 'old', 5)")
+
+    users = table("users")
+    bulk = (
+        insert(users)
+        .columns("id", "name", "hits")
+        .on_conflict_do_update(
+            ["id"],
+            {"name": excluded("name"), "hits": users.hits + excluded("hits")},
+        )
+        .values_many([(i, f"user{i}", 1) for i in range(1, 6)])
+    )
+    chunks = list(bulk.chunks(Dialect.SQLITE, ParamStyle.QMARK, max_rows=2))
+    assert len(chunks) == 3
+    assert chunks[0][0] == chunks[1][0]
+    for sql, params in chunks:
+        conn.execute(sql, params)
+
+    assert conn.execute("SELECT * FROM users ORDER BY id").fetchall() == [
+        (1, "user1", 6),
+        (2, "user2", 1),
+        (3, "user3", 1),
+        (4, "user4", 1),
+        (5, "user5", 1),
+    ]
+
+
+def test_bulk_upsert_rejects_extra_placeholders() -> None:
+    """Test that bulk upserts cannot bind parameters outside VALUES."""
+    bulk = (
+        insert(table("users"))
+        .columns("id", "name")
+        .on_conflict_do_update(["id"], {"name": placeholder("name")})
+        .values_many([(1, "a")])
+    )
+
+    with pytest.raises(ValueError, match="outside VALUES"):
+        list(bulk.chunks(Dialect.POSTGRESQL))
+
+
+def test_bulk_upsert_rejects_placeholders_named_like_rows() -> None:
+    """Test that a placeholder sharing a generated row name is not bound."""
+    users = table("users")
+    bulk = (
+        insert(users)
+        .columns("id", "hits")
+        .on_conflict_do_update(["id"], ["hits"], where=users.hits < placeholder("_p2"))
+        .values_many([(1, 5)])
+    )
+
+    with pytest.raises(ValueError, match="outside VALUES"):
+        list(bulk.chunks(Dialect.SQLITE))